@@ -15,6 +15,10 @@ if BASE_DIR not in sys.path:
 # backend/models/base.py 에서 Base 정의
 from models.base import Base       # Base = declarative_base() 반환
 import models.request              # noqa: F401  (모델 등록용)
+import models.channel_resolution   # noqa: F401
+import models.channel_snapshot     # noqa: F401
+import models.youtube_quota        # noqa: F401
+import models.tier_benchmark       # noqa: F401
 
 # === 2) Alembic 기본 설정 ===
 
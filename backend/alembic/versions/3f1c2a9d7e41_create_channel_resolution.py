@@ -0,0 +1,36 @@
+"""create channel_resolution table
+
+Revision ID: 3f1c2a9d7e41
+Revises: cbb05eb74952
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9d7e41'
+down_revision: Union[str, Sequence[str], None] = 'cbb05eb74952'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "channel_resolution",
+        sa.Column("handle", sa.String(200), primary_key=True),
+        sa.Column("channel_id", sa.String(64), nullable=True),
+        sa.Column(
+            "resolved_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("channel_resolution")
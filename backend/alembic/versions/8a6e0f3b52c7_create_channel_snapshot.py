@@ -0,0 +1,38 @@
+"""create channel_snapshot table
+
+Revision ID: 8a6e0f3b52c7
+Revises: 3f1c2a9d7e41
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a6e0f3b52c7'
+down_revision: Union[str, Sequence[str], None] = '3f1c2a9d7e41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "channel_snapshot",
+        sa.Column("channel_id", sa.String(64), primary_key=True),
+        sa.Column("analysis_period_months", sa.Integer(), nullable=False),
+        sa.Column("video_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("data", sa.JSON(), nullable=False),
+        sa.Column(
+            "collected_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("channel_snapshot")
@@ -0,0 +1,64 @@
+"""create youtube quota ledger tables
+
+Revision ID: c4d9e2a1f083
+Revises: 8a6e0f3b52c7
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e2a1f083'
+down_revision: Union[str, Sequence[str], None] = '8a6e0f3b52c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "youtube_quota_usage",
+        sa.Column("usage_date", sa.Date(), primary_key=True),
+        sa.Column("units_used", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+
+    op.create_table(
+        "youtube_collection_run",
+        sa.Column("run_id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("request_id", sa.BigInteger(), nullable=True),
+        sa.Column("channel_id", sa.String(64), nullable=True),
+        sa.Column("usage_date", sa.Date(), nullable=False),
+        sa.Column("max_videos", sa.Integer(), nullable=False),
+        sa.Column("max_comments", sa.Integer(), nullable=False),
+        sa.Column("degraded", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("units_used", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("units_by_resource", sa.JSON(), nullable=False),
+        sa.Column("calls_by_resource", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_youtube_collection_run_usage_date",
+        "youtube_collection_run",
+        ["usage_date"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_youtube_collection_run_usage_date", table_name="youtube_collection_run")
+    op.drop_table("youtube_collection_run")
+    op.drop_table("youtube_quota_usage")
@@ -0,0 +1,55 @@
+"""create tier_benchmark table and report_creator latest-version index
+
+Revision ID: d7b3f6a2c915
+Revises: c4d9e2a1f083
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b3f6a2c915'
+down_revision: Union[str, Sequence[str], None] = 'c4d9e2a1f083'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade():
+    op.create_table(
+        "tier_benchmark",
+        sa.Column("benchmark_id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("tier", sa.String(50), nullable=False),
+        sa.Column("engagement_per_1k", sa.Float(), nullable=False),
+        sa.Column("views_per_day", sa.Float(), nullable=False),
+        sa.Column("demand_index", sa.Float(), nullable=False),
+        sa.Column("problem_rate", sa.Float(), nullable=False),
+        sa.Column("videos_per_week_benchmark", sa.Float(), nullable=False),
+        sa.Column("percentile", sa.Float(), nullable=False),
+        sa.Column("sample_size", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.UniqueConstraint("version", "tier", name="uq_tier_benchmark_version_tier"),
+    )
+    op.create_index("ix_tier_benchmark_version", "tier_benchmark", ["version"])
+
+    # 의뢰별 최신 버전 리포트 조회 (벤치마크 계산 / 재채점)
+    op.create_index(
+        "ix_report_creator_request_version",
+        "report_creator",
+        ["request_id", "version"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_report_creator_request_version", table_name="report_creator")
+    op.drop_index("ix_tier_benchmark_version", table_name="tier_benchmark")
+    op.drop_table("tier_benchmark")
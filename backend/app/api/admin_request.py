@@ -5,10 +5,12 @@ from core.db import get_db
 from models.request import Request
 from models.report_bm import ReportBM
 from models.report_creator import ReportCreator
-from schemas.analysis import AnalysisStartResp
+from schemas.analysis import AnalysisStartResp, RescoreResp
 from schemas.request import RequestAdminListResp, RequestAdminItem
 from services.report_service import build_bm_report_for_request
 from services.creator_report_service import build_creator_report_for_request
+from services.creator_rescore_service import rescore_creator_reports
+from services.creator_percentile_index import creator_percentile_index
 import logging
 
 router = APIRouter()
@@ -134,6 +136,32 @@ def start_analysis_for_request(request_id: int, db: Session = Depends(get_db)):
     )
 
 
+@router.post("/admin/creator-reports/rescore", response_model=RescoreResp)
+def rescore_all_creator_reports(dry_run: bool = False, db: Session = Depends(get_db)):
+    """
+    채점 기준 변경 후 전체 크리에이터 리포트 BLC 재채점
+    - 저장된 raw 값만 사용 (YouTube/LLM 호출 없음)
+    - 결과가 달라진 리포트만 새 버전 저장, dry_run=true 면 변경 예정만 확인
+    """
+    return rescore_creator_reports(db, dry_run=dry_run)
+
+
+@router.post("/admin/requests/{request_id}/creator-report/rescore", response_model=RescoreResp)
+def rescore_creator_report_for_request(
+    request_id: int,
+    dry_run: bool = False,
+    db: Session = Depends(get_db),
+):
+    """의뢰 1건의 최신 크리에이터 리포트 BLC 재채점"""
+    req = db.query(Request).filter(Request.request_id == request_id).first()
+    if not req:
+        raise HTTPException(
+            status_code=404,
+            detail="해당 의뢰를 찾을 수 없습니다. (request_id 불일치)",
+        )
+    return rescore_creator_reports(db, request_ids=[request_id], dry_run=dry_run)
+
+
 @router.get("/admin/requests/{request_id}/creator-report")
 def get_creator_report_for_request(
     request_id: int,
@@ -186,6 +214,8 @@ def get_creator_report_for_request(
         "problem_score": float(creator_report.problem_score) if creator_report.problem_score is not None else None,
         "format_score": float(creator_report.format_score) if creator_report.format_score is not None else None,
         "consistency_score": float(creator_report.consistency_score) if creator_report.consistency_score is not None else None,
+        # 같은 Tier 전체 크리에이터 중 위치 (점수 항목별 percentile / rank)
+        "tier_percentile": creator_percentile_index.lookup_report(db, creator_report),
 
         "meta": creator_report.meta_json,
         "executive_summary": creator_report.executive_summary_json,
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends
 from sqlalchemy.orm import Session
 from schemas.request import RequestCreateReq, RequestCreateResp
 from core.db import get_db
@@ -7,6 +7,7 @@ from models.report_bm import ReportBM
 from schemas.request import RequestAdminListResp, RequestAdminItem
 from schemas.request_lookup import RequestLookupReq, RequestLookupResp, RequestLookupReport
 from services.report_service import render_bm_sections_html
+from services.channel_prefetch_service import enqueue_channel_prefetch
 import hashlib
 import json
 router = APIRouter()
@@ -16,7 +17,11 @@ def hash_view_pw(plain_pw: str) -> str:
     return hashlib.sha256(plain_pw.encode("utf-8")).hexdigest()
 
 @router.post("/request", response_model=RequestCreateResp, status_code=201)
-def create_request(payload: RequestCreateReq, db: Session = Depends(get_db)):
+def create_request(
+    payload: RequestCreateReq,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
     req = Request(
         user_id=1,  # 나중에 로그인 시스템 생기면 실제 user_id로 교체
         activity_name=payload.activity_name,
@@ -33,6 +38,10 @@ def create_request(payload: RequestCreateReq, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(req)
 
+    # 응답 후 채널 데이터 미리 수집 등록 (관리자 분석 시작 시 수집 대기 제거)
+    if req.platform == "youtube":
+        background_tasks.add_task(enqueue_channel_prefetch, req.request_id)
+
     return RequestCreateResp(
         request_id=req.request_id,
         message="의뢰가 정상적으로 접수되었습니다.",
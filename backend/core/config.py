@@ -18,3 +18,24 @@ MIN_ACCEPT_CHARS= int(os.getenv("MIN_ACCEPT_CHARS", "250"))
 ALLOWED_ORIGINS = [
     os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
 ]
+
+# YouTube 수집 설정
+YOUTUBE_COMMENT_WORKERS = int(os.getenv("YOUTUBE_COMMENT_WORKERS", "8"))  # 댓글 동시 수집 스레드 수 (1 = 순차)
+YOUTUBE_VIDEO_LISTING = os.getenv("YOUTUBE_VIDEO_LISTING", "uploads")  # 영상 목록 수집 방식: uploads | search
+YOUTUBE_CACHE_PATH = os.getenv("YOUTUBE_CACHE_PATH", "/tmp/beautiq_youtube_cache.sqlite3")  # 응답 캐시 파일 (빈 값이면 사용 안 함)
+YOUTUBE_DAILY_QUOTA = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))  # 일일 quota 한도 (units)
+YOUTUBE_STREAMING = os.getenv("YOUTUBE_STREAMING", "0") == "1"  # 1 이면 수집과 댓글 분석을 스트리밍으로 겹쳐 실행
+YOUTUBE_COMMENT_SAMPLING = os.getenv("YOUTUBE_COMMENT_SAMPLING", "0") == "1"  # 1 이면 댓글 적응형 샘플링(조기 종료)
+YOUTUBE_COMMENT_BUDGET = os.getenv("YOUTUBE_COMMENT_BUDGET", "")  # 채널 전체 댓글 페이지 예산: 빈 값(영상당 고정) | auto | 페이지 수
+YOUTUBE_PREFETCH = os.getenv("YOUTUBE_PREFETCH", "0") == "1"  # 1 이면 의뢰 접수 시 채널 데이터를 백그라운드로 미리 수집
+YOUTUBE_PREFETCH_WAIT_SECONDS = int(os.getenv("YOUTUBE_PREFETCH_WAIT_SECONDS", "600"))  # 분석 시작 시 진행 중인 미리 수집을 기다리는 최대 시간
+YOUTUBE_SNAPSHOT_FRESH_MINUTES = int(os.getenv("YOUTUBE_SNAPSHOT_FRESH_MINUTES", "180"))  # 이보다 최근 스냅샷은 API 호출 없이 그대로 사용 (0 = 항상 증분 수집)
+YOUTUBE_SNAPSHOT_STORE_DIR = os.getenv("YOUTUBE_SNAPSHOT_STORE_DIR", "")  # 수집 원본 컬럼형(Arrow) 스냅샷 저장 디렉터리 (빈 값이면 저장 안 함)
+YOUTUBE_SNAPSHOT_STORE_COMPRESSION = os.getenv("YOUTUBE_SNAPSHOT_STORE_COMPRESSION", "") or None  # 빈 값(기본, 무압축, memory map 무복사 읽기) | zstd | lz4 (디스크 절약, 읽을 때 압축 해제)
+YOUTUBE_SNAPSHOT_STORE_KEEP = int(os.getenv("YOUTUBE_SNAPSHOT_STORE_KEEP", "5"))  # 채널별로 남길 최근 컬럼형 스냅샷 수 (0 = 삭제 안 함)
+
+# BLC Tier 벤치마크 보정
+TIER_BENCHMARK_PERCENTILE = float(os.getenv("TIER_BENCHMARK_PERCENTILE", "50"))  # report_creator 분포에서 벤치마크로 쓸 백분위 (0~100)
+TIER_BENCHMARK_MIN_SAMPLES = int(os.getenv("TIER_BENCHMARK_MIN_SAMPLES", "30"))  # Tier 표본이 이보다 적으면 기본 BENCHMARKS 유지
+TIER_BENCHMARK_CACHE_SECONDS = int(os.getenv("TIER_BENCHMARK_CACHE_SECONDS", "300"))  # 벤치마크 메모리 캐시 유지 시간 (0 = 매번 DB 조회)
+CREATOR_PERCENTILE_RELOAD_SECONDS = int(os.getenv("CREATOR_PERCENTILE_RELOAD_SECONDS", "600"))  # Tier 백분위 인덱스를 DB 에서 다시 읽는 주기 (다른 프로세스 저장분 반영)
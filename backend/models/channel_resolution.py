@@ -0,0 +1,19 @@
+# models/channel_resolution.py
+from sqlalchemy import Column, String, DateTime, func
+
+from core.db import Base
+
+
+class ChannelResolution(Base):
+    """
+    YouTube 핸들 -> 채널 ID(UC…) 해석 결과 캐시
+
+    - handle: 소문자로 정규화한 핸들 (@ 제외)
+    - channel_id: NULL 이면 '존재하지 않는 핸들' (negative cache)
+    """
+
+    __tablename__ = "channel_resolution"
+
+    handle      = Column(String(200), primary_key=True)
+    channel_id  = Column(String(64), nullable=True)
+    resolved_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,20 @@
+# models/channel_snapshot.py
+from sqlalchemy import Column, String, Integer, DateTime, JSON, func
+
+from core.db import Base
+
+
+class ChannelSnapshot(Base):
+    """
+    채널별 마지막 YouTube 수집 결과 (YouTubeDataCollector.collect_full_data 형식)
+    - 다음 분석 때 증분 수집(collect_delta_data)의 기준으로 사용
+    """
+
+    __tablename__ = "channel_snapshot"
+
+    channel_id             = Column(String(64), primary_key=True)
+    analysis_period_months = Column(Integer, nullable=False)
+    video_count            = Column(Integer, nullable=False, default=0)
+    data                   = Column(JSON, nullable=False)
+
+    collected_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
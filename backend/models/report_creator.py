@@ -10,6 +10,7 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     DateTime,
+    Index,
     UniqueConstraint,
     text,
     Numeric,
@@ -31,6 +32,10 @@ class PlatformEnum(PyEnum):
 
 class ReportCreator(Base):
     __tablename__ = "report_creator"
+    __table_args__ = (
+        # 의뢰별 최신 버전 조회 (재채점 / Tier 백분위 인덱스 / 벤치마크 보정)
+        Index("ix_report_creator_request_version", "request_id", "version"),
+    )
 
     report_creator_id = Column(BigInteger, primary_key=True, autoincrement=True)
     request_id        = Column(BigInteger, ForeignKey("request.request_id"), nullable=False)
@@ -0,0 +1,41 @@
+# models/tier_benchmark.py
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    UniqueConstraint,
+    func,
+)
+
+from core.db import Base
+
+
+class TierBenchmark(Base):
+    """
+    Tier별 BLC 벤치마크 (report_creator 전체 분포에서 계산한 백분위 값)
+    - version 단위로 Tier 4행을 함께 저장, 가장 큰 version 이 현재 기준
+    - 표본이 부족한 Tier 는 행이 없고 MetricsCalculator.BENCHMARKS 기본값 사용
+    """
+
+    __tablename__ = "tier_benchmark"
+    __table_args__ = (
+        UniqueConstraint("version", "tier", name="uq_tier_benchmark_version_tier"),
+    )
+
+    benchmark_id      = Column(BigInteger, primary_key=True, autoincrement=True)
+    version           = Column(Integer, nullable=False, index=True)
+    tier              = Column(String(50), nullable=False)
+
+    engagement_per_1k = Column(Float, nullable=False)
+    views_per_day     = Column(Float, nullable=False)
+    demand_index      = Column(Float, nullable=False)
+    problem_rate      = Column(Float, nullable=False)
+    videos_per_week_benchmark = Column(Float, nullable=False)
+
+    percentile        = Column(Float, nullable=False)   # 0~100
+    sample_size       = Column(Integer, nullable=False)
+
+    created_at        = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
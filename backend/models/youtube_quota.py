@@ -0,0 +1,51 @@
+# models/youtube_quota.py
+from sqlalchemy import (
+    Column,
+    BigInteger,
+    Integer,
+    String,
+    Boolean,
+    Date,
+    DateTime,
+    JSON,
+    func,
+)
+
+from core.db import Base
+
+
+class YouTubeQuotaUsage(Base):
+    """
+    YouTube Data API 일일 quota 사용 원장
+    - usage_date: quota 기준일 (태평양 시간 자정에 초기화되므로 America/Los_Angeles 날짜)
+    """
+
+    __tablename__ = "youtube_quota_usage"
+
+    usage_date = Column(Date, primary_key=True)
+    units_used = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class YouTubeCollectionRun(Base):
+    """
+    수집 1회(파이프라인 1회)당 quota 비용 기록 - 용량 계획용
+    """
+
+    __tablename__ = "youtube_collection_run"
+
+    run_id            = Column(BigInteger, primary_key=True, autoincrement=True)
+    request_id        = Column(BigInteger, nullable=True)
+    channel_id        = Column(String(64), nullable=True)
+    usage_date        = Column(Date, nullable=False, index=True)
+
+    max_videos        = Column(Integer, nullable=False)
+    max_comments      = Column(Integer, nullable=False)
+    degraded          = Column(Boolean, nullable=False, default=False)
+    status            = Column(String(20), nullable=False)   # success / failed
+
+    units_used        = Column(Integer, nullable=False, default=0)
+    units_by_resource = Column(JSON, nullable=False, default=dict)
+    calls_by_resource = Column(JSON, nullable=False, default=dict)
+
+    created_at        = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,10 +1,28 @@
 from typing import Optional
 from pydantic import BaseModel
-from typing import Literal
+from typing import List, Literal
 
 class AnalysisStartResp(BaseModel):
     request_id: int
     status: Literal["ready", "idle", "processing"]
     report_id: Optional[int] = None
     creator_report_id: Optional[int] = None
-    message: str
\ No newline at end of file
+    message: str
+
+class RescoreItem(BaseModel):
+    request_id: int
+    report_creator_id: int
+    from_version: int
+    to_version: int
+    blc_score_before: Optional[float] = None
+    blc_score_after: float
+    grade_before: Optional[str] = None
+    grade_after: str
+
+
+class RescoreResp(BaseModel):
+    checked: int
+    changed: int
+    skipped: int
+    dry_run: bool
+    items: List[RescoreItem]
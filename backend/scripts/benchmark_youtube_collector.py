@@ -0,0 +1,239 @@
+# scripts/benchmark_youtube_collector.py
+"""
+YouTubeDataCollector 수집 성능 벤치마크 (실제 API 호출 없음)
+- scripts/youtube_fake_server.py 의 대역 서버를 프로세스 안에서 띄우고 collect_full_data 실행
+- 채널 규모(영상 10 / 100 / 1000개) x worker 수 조합별로
+  API 호출 수, quota units, 응답 바이트, 소요 시간을 표로 출력
+- --fleet: 여러 채널을 채널별 collect_full_data 반복(loop) vs collect_batch_data(batch)로 비교
+
+사용 예)
+  python scripts/benchmark_youtube_collector.py
+  python scripts/benchmark_youtube_collector.py --videos 100 --latency 0.05 --workers 1 8
+  python scripts/benchmark_youtube_collector.py --json bench.json
+  python scripts/benchmark_youtube_collector.py --fleet 5 20 --videos 30
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+# backend 디렉터리를 sys.path 에 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from services.youtube_data_collector import YouTubeDataCollector
+
+from youtube_fake_server import FAKE_CHANNEL_ID, FakeYouTubeAPI, SyntheticChannel, SyntheticFleet, start_server
+
+BENCH_API_KEY = "bench-key-0000"
+
+
+def _build_collector(base_url, workers, listing):
+    return YouTubeDataCollector(
+        BENCH_API_KEY,
+        comment_workers=workers,
+        video_listing=listing,
+        api_endpoint=base_url,
+    )
+
+
+def run_case(api, base_url, workers, n_videos, listing, max_comments, months_back):
+    """대역 서버 통계를 초기화하고 collect_full_data 1회 실행 -> 결과 dict"""
+    api.reset()
+    started = time.perf_counter()
+    collector = _build_collector(base_url, workers, listing)
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = collector.collect_full_data(
+            FAKE_CHANNEL_ID,
+            max_videos=n_videos,
+            months_back=months_back,
+            max_comments=max_comments,
+        )
+    wall = time.perf_counter() - started
+
+    stats = api.stats()
+    videos = data["videos"] if data else []
+    return {
+        "videos": n_videos,
+        "workers": workers,
+        "listing": listing,
+        "collected_videos": len(videos),
+        "comments": sum(len(v.get("comments", [])) for v in videos),
+        "calls": stats["total_calls"],
+        "calls_by_resource": stats["calls"],
+        "quota_units": collector.quota_units_used(),
+        "bytes": stats["total_bytes"],
+        "wall_seconds": round(wall, 3),
+    }
+
+
+def run_fleet_case(api, base_url, workers, mode, fleet, listing, max_videos, max_comments, months_back):
+    """
+    여러 채널 수집 1회 -> 결과 dict
+    - loop : 채널마다 collect_full_data (기존 방식)
+    - batch: collect_batch_data 한 번
+    """
+    api.reset()
+    started = time.perf_counter()
+    collector = _build_collector(base_url, workers, listing)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == "batch":
+            results = collector.collect_batch_data(
+                fleet.channel_ids,
+                max_videos=max_videos,
+                months_back=months_back,
+                max_comments=max_comments,
+            )
+        else:
+            results = {
+                channel_id: collector.collect_full_data(
+                    channel_id,
+                    max_videos=max_videos,
+                    months_back=months_back,
+                    max_comments=max_comments,
+                )
+                for channel_id in fleet.channel_ids
+            }
+    wall = time.perf_counter() - started
+
+    stats = api.stats()
+    videos = [v for data in results.values() if data for v in data["videos"]]
+    return {
+        "channels": len(fleet.channel_ids),
+        "mode": mode,
+        "workers": workers,
+        "collected_videos": len(videos),
+        "comments": sum(len(v.get("comments", [])) for v in videos),
+        "calls": stats["total_calls"],
+        "calls_by_resource": stats["calls"],
+        "quota_units": collector.quota_units_used(),
+        "bytes": stats["total_bytes"],
+        "wall_seconds": round(wall, 3),
+    }
+
+
+def print_fleet_table(results):
+    header = (
+        f"{'channels':>8} {'mode':>6} {'workers':>7} {'calls':>6} "
+        f"{'videos()':>8} {'units':>6} {'wall(s)':>8} {'comments':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['channels']:>8} {r['mode']:>6} {r['workers']:>7} {r['calls']:>6} "
+            f"{r['calls_by_resource'].get('videos', 0):>8} {r['quota_units']:>6} "
+            f"{r['wall_seconds']:>8.2f} {r['comments']:>9}"
+        )
+
+
+def run_fleet(args):
+    """--fleet: 채널 수별로 loop vs batch 비교 (--videos 는 채널당 평균 영상 수, 첫 값 사용)"""
+    results = []
+    for n_channels in args.fleet:
+        fleet = SyntheticFleet(n_channels, args.videos[0], months_back=args.months_back, seed=args.seed)
+        api = FakeYouTubeAPI(
+            fleet,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        server, base_url = start_server(api)
+        try:
+            for workers in args.workers:
+                for mode in ("loop", "batch"):
+                    result = run_fleet_case(
+                        api, base_url, workers, mode, fleet,
+                        args.listing, args.videos[0] * 2, args.max_comments, args.months_back,
+                    )
+                    results.append(result)
+                    print(
+                        f"  [Bench] channels={n_channels} mode={mode} workers={workers} "
+                        f"-> {result['calls']} calls, {result['wall_seconds']:.2f}s"
+                    )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print()
+    print_fleet_table(results)
+    return results
+
+
+def print_table(results):
+    header = f"{'videos':>6} {'workers':>7} {'calls':>6} {'units':>6} {'KB':>9} {'wall(s)':>8} {'comments':>9}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['videos']:>6} {r['workers']:>7} {r['calls']:>6} {r['quota_units']:>6} "
+            f"{r['bytes'] / 1024:>9.1f} {r['wall_seconds']:>8.2f} {r['comments']:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube 수집기 벤치마크 (로컬 대역 서버)")
+    parser.add_argument("--videos", type=int, nargs="+", default=[10, 100, 1000], help="채널 영상 수")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8], help="댓글 동시 수집 worker 수")
+    parser.add_argument("--listing", default="uploads", choices=YouTubeDataCollector.VIDEO_LISTING_MODES)
+    parser.add_argument("--max-comments", type=int, default=100)
+    parser.add_argument("--months-back", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.02, help="대역 서버 요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fleet", type=int, nargs="+", help="여러 채널 배치 수집 비교 (채널 수)")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장할 경로")
+    args = parser.parse_args()
+
+    if args.fleet:
+        results = run_fleet(args)
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(results, f, ensure_ascii=False, indent=2)
+            print(f"\n💾 결과 저장: {args.json}")
+        return
+
+    results = []
+    for n_videos in args.videos:
+        channel = SyntheticChannel(n_videos, months_back=args.months_back, seed=args.seed)
+        api = FakeYouTubeAPI(
+            channel,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+        server, base_url = start_server(api)
+        try:
+            for workers in args.workers:
+                result = run_case(
+                    api, base_url, workers, n_videos,
+                    args.listing, args.max_comments, args.months_back,
+                )
+                results.append(result)
+                print(
+                    f"  [Bench] videos={n_videos} workers={workers} "
+                    f"-> {result['calls']} calls, {result['wall_seconds']:.2f}s"
+                )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    print()
+    print_table(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# scripts/calibrate_tier_benchmarks.py
+"""
+report_creator 분포로 Tier 벤치마크 보정 CLI
+
+  python scripts/calibrate_tier_benchmarks.py                    # 기본 백분위(TIER_BENCHMARK_PERCENTILE)로 새 version 저장
+  python scripts/calibrate_tier_benchmarks.py --percentile 60 --min-samples 50
+  python scripts/calibrate_tier_benchmarks.py --dry-run          # 저장 없이 Tier 별 백분위 값만 출력
+
+보정 후 기존 리포트 점수 반영: python scripts/rescore_creator_reports.py
+"""
+
+import argparse
+import os
+import sys
+
+# backend 디렉터리를 sys.path 에 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from core.config import TIER_BENCHMARK_MIN_SAMPLES, TIER_BENCHMARK_PERCENTILE
+from core.db import SessionLocal
+from services.tier_benchmark_service import calibrate_tier_benchmarks, compute_tier_percentiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="report_creator 분포로 Tier 벤치마크 보정")
+    parser.add_argument("--percentile", type=float, default=TIER_BENCHMARK_PERCENTILE, help="백분위 (0~100)")
+    parser.add_argument("--min-samples", type=int, default=TIER_BENCHMARK_MIN_SAMPLES, help="Tier 최소 표본 수")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 Tier 별 백분위 값만 출력")
+    args = parser.parse_args()
+
+    if not 0 <= args.percentile <= 100:
+        parser.error("--percentile 은 0~100 사이여야 합니다.")
+
+    db = SessionLocal()
+    try:
+        if args.dry_run:
+            for tier, stats in sorted(compute_tier_percentiles(db, args.percentile).items()):
+                print(f"  {tier}: {stats}")
+        else:
+            calibrate_tier_benchmarks(db, percentile=args.percentile, min_samples=args.min_samples)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# scripts/rescore_creator_reports.py
+"""
+저장된 크리에이터 리포트 BLC 재채점 CLI (YouTube/LLM 호출 없음)
+
+  python scripts/rescore_creator_reports.py                 # 전체
+  python scripts/rescore_creator_reports.py --request-id 12 --request-id 15
+  python scripts/rescore_creator_reports.py --dry-run       # 저장 없이 변경 예정만 출력
+"""
+
+import argparse
+import os
+import sys
+
+# backend 디렉터리를 sys.path 에 추가
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from core.db import SessionLocal
+from services.creator_rescore_service import rescore_creator_reports
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 raw 값으로 크리에이터 리포트 BLC 재채점")
+    parser.add_argument("--request-id", type=int, action="append", dest="request_ids",
+                        help="대상 의뢰 ID (여러 번 지정 가능, 생략하면 전체)")
+    parser.add_argument("--dry-run", action="store_true", help="저장하지 않고 변경 예정만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        result = rescore_creator_reports(db, request_ids=args.request_ids, dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    for item in result["items"]:
+        print(
+            f"  request_id={item['request_id']} v{item['from_version']} -> v{item['to_version']}: "
+            f"{item['blc_score_before']} ({item['grade_before']}) -> "
+            f"{item['blc_score_after']} ({item['grade_after']})"
+        )
+
+
+if __name__ == "__main__":
+    main()
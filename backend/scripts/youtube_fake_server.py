@@ -0,0 +1,635 @@
+# scripts/youtube_fake_server.py
+"""
+YouTube Data API v3 로컬 대역 서버 (표준 라이브러리만 사용)
+- YouTubeDataCollector 가 쓰는 channels / search / playlistItems / videos / commentThreads 지원
+- 합성 채널(영상 수/댓글 수 지정), 여러 합성 채널 묶음(--channels) 또는 녹화한 응답(fixture JSON) 재생
+- 지연(latency/jitter), 일시 오류(500), 키별 quota 소진(403 quotaExceeded) 재현
+- fields= partial response 지원 (응답 바이트 비교용)
+- GET /_stats : 리소스별 호출 수 / 응답 바이트, POST /_reset : 통계 초기화
+
+사용 예)
+  # 합성 채널 100개 영상, 요청당 50ms 지연
+  python scripts/youtube_fake_server.py --videos 100 --latency 0.05
+
+  # 합성 채널 20개 (채널당 평균 30개 영상) - collect_batch_data 확인용
+  python scripts/youtube_fake_server.py --channels 20 --videos 30
+
+  # 실제 API 를 프록시하며 응답 녹화 -> 이후 --fixture 로 재생
+  python scripts/youtube_fake_server.py --record fixture.json
+  python scripts/youtube_fake_server.py --fixture fixture.json
+
+collector 연결)
+  YouTubeDataCollector(key, api_endpoint="http://127.0.0.1:8765")
+  YouTubeRestCollector(key, api_endpoint="http://127.0.0.1:8765")
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+API_PREFIX = "/youtube/v3/"
+UPSTREAM_URL = "https://www.googleapis.com/youtube/v3/"
+
+# 리소스별 quota 비용 (YouTubeDataCollector.QUOTA_COSTS 와 동일)
+QUOTA_COSTS = {
+    "search": 100,
+    "channels": 1,
+    "playlistItems": 1,
+    "videos": 1,
+    "commentThreads": 1,
+}
+
+FAKE_CHANNEL_ID = "UCfakechannel0000000000a"
+
+
+def fleet_channel_id(index):
+    """SyntheticFleet 의 index 번째 채널 ID (UC + 22자)"""
+    return f"UCfakefleet{index:013d}"
+
+THUMBNAIL_SIZES = [
+    ("default", 120, 90),
+    ("medium", 320, 180),
+    ("high", 480, 360),
+    ("standard", 640, 480),
+    ("maxres", 1280, 720),
+]
+FAKE_HANDLE = "fakechannel"
+
+COMMENT_WORDS = [
+    "좋아요", "추천해주세요", "여드름 고민이에요", "민감 피부인데 괜찮나요", "써봤어요",
+    "건조해요", "정보 감사합니다", "다음 영상도 기대", "제품 정보 알려주세요", "트러블 났어요",
+]
+
+
+def _iso(dt):
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def fixture_key(resource, params):
+    """녹화/재생 키: resource + 정렬된 파라미터 (API 키 제외)"""
+    clean = {k: v for k, v in params.items() if k != "key"}
+    raw = resource + "?" + json.dumps(clean, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def parse_fields(spec):
+    """
+    partial response fields= 문법 파싱 -> 중첩 dict (None 이면 하위 전체)
+    예) 'nextPageToken,items(id,snippet/title)' -> {'nextPageToken': None, 'items': {'id': None, 'snippet': {'title': None}}}
+    """
+    pos = 0
+
+    def merge(tree, other):
+        for key, sub in other.items():
+            if key in tree and tree[key] is not None and sub is not None:
+                merge(tree[key], sub)
+            else:
+                tree[key] = None if key in tree and tree[key] is None else sub
+        return tree
+
+    def parse_list():
+        nonlocal pos
+        tree = {}
+        while pos < len(spec) and spec[pos] != ")":
+            merge(tree, parse_item())
+            if pos < len(spec) and spec[pos] == ",":
+                pos += 1
+        return tree
+
+    def parse_item():
+        nonlocal pos
+        start = pos
+        while pos < len(spec) and spec[pos] not in ",()/":
+            pos += 1
+        name = spec[start:pos].strip()
+        if pos < len(spec) and spec[pos] == "/":
+            pos += 1
+            return {name: parse_item()}
+        if pos < len(spec) and spec[pos] == "(":
+            pos += 1
+            sub = parse_list()
+            pos += 1  # ')'
+            return {name: sub}
+        return {name: None}
+
+    return parse_list()
+
+
+def apply_fields(obj, tree):
+    """parse_fields 결과에 맞춰 응답에서 필드만 남김 (리스트는 원소마다 적용)"""
+    if tree is None:
+        return obj
+    if isinstance(obj, list):
+        return [apply_fields(item, tree) for item in obj]
+    if not isinstance(obj, dict):
+        return obj
+    return {key: apply_fields(obj[key], sub) for key, sub in tree.items() if key in obj}
+
+
+class ApiError(Exception):
+    def __init__(self, status, reason, message=""):
+        super().__init__(message or reason)
+        self.status = status
+        self.reason = reason
+
+    def body(self):
+        return {
+            "error": {
+                "code": self.status,
+                "message": str(self),
+                "errors": [{"reason": self.reason, "message": str(self)}],
+            }
+        }
+
+
+class SyntheticChannel:
+    """
+    재현 가능한(seed) 합성 채널
+    - 영상은 months_back 기간에 고르게 분포, 최신순
+    - 영상별 댓글 수는 조회수에 비례 (일부 영상은 댓글 비활성화)
+    """
+
+    def __init__(self, n_videos=100, months_back=6, seed=0, disabled_comment_rate=0.02, channel_id=FAKE_CHANNEL_ID):
+        rnd = random.Random(seed)
+        self.channel_id = channel_id
+        now = datetime.now(timezone.utc)
+        span = timedelta(days=months_back * 30 - 1)
+        self.channel = {
+            "id": channel_id,
+            "snippet": {
+                "title": f"Fake Channel ({n_videos} videos)",
+                "description": "synthetic channel for collector benchmarks",
+                "publishedAt": "2019-01-01T00:00:00Z",
+            },
+            "statistics": {
+                "subscriberCount": str(rnd.randint(10_000, 500_000)),
+                "viewCount": "0",
+                "videoCount": str(n_videos),
+            },
+            "contentDetails": {"relatedPlaylists": {"uploads": "UU" + channel_id[2:]}},
+        }
+        self.videos = []
+        self.comments = {}
+        self.comments_disabled = set()
+        total_views = 0
+        for i in range(n_videos):
+            video_id = f"fv{seed:03d}{i:06d}"
+            published = now - span * (i + 0.5) / max(n_videos, 1)
+            views = int(rnd.lognormvariate(9, 1.3))
+            total_views += views
+            comment_count = min(int(views * rnd.uniform(0.001, 0.01)), 3000)
+            title = rnd.choice(["리뷰", "루틴", "vlog", "하울", "추천템"]) + f" #{i}"
+            # 실제 응답과 비슷한 크기가 되도록 fields= 없이 오는 필드도 채운다
+            self.videos.append({
+                "kind": "youtube#video",
+                "etag": f"etag-{video_id}",
+                "id": video_id,
+                "snippet": {
+                    "publishedAt": _iso(published),
+                    "channelId": channel_id,
+                    "title": title,
+                    "description": " ".join(rnd.choices(COMMENT_WORDS, k=60)),
+                    "thumbnails": {
+                        size: {"url": f"https://i.ytimg.com/vi/{video_id}/{size}.jpg", "width": w, "height": h}
+                        for size, w, h in THUMBNAIL_SIZES
+                    },
+                    "channelTitle": self.channel["snippet"]["title"],
+                    "tags": ["beauty", "skincare", "makeup", "review"],
+                    "categoryId": "26",
+                    "liveBroadcastContent": "none",
+                    "defaultAudioLanguage": "ko",
+                    "localized": {"title": title, "description": ""},
+                },
+                "contentDetails": {
+                    "duration": f"PT{rnd.randint(0, 25)}M{rnd.randint(0, 59)}S",
+                    "dimension": "2d",
+                    "definition": "hd",
+                    "caption": "false",
+                    "licensedContent": True,
+                    "contentRating": {},
+                    "projection": "rectangular",
+                },
+                "statistics": {
+                    "viewCount": str(views),
+                    "likeCount": str(int(views * rnd.uniform(0.01, 0.05))),
+                    "favoriteCount": "0",
+                    "commentCount": str(comment_count),
+                },
+            })
+            if rnd.random() < disabled_comment_rate:
+                self.comments_disabled.add(video_id)
+            self.comments[video_id] = comment_count
+        self.channel["statistics"]["viewCount"] = str(total_views)
+        self._by_id = {v["id"]: v for v in self.videos}
+        self._seed = seed
+
+    def _comment_thread(self, video_id, index):
+        text = self._comment_text(video_id, index)
+        comment_id = f"Ug{video_id}{index:05d}"
+        author = f"viewer{index % 997}"
+        return {
+            "kind": "youtube#commentThread",
+            "etag": f"etag-{comment_id}",
+            "id": comment_id,
+            "snippet": {
+                "channelId": self.channel_id,
+                "videoId": video_id,
+                "topLevelComment": {
+                    "kind": "youtube#comment",
+                    "etag": f"etag-c-{comment_id}",
+                    "id": comment_id,
+                    "snippet": {
+                        "channelId": self.channel_id,
+                        "videoId": video_id,
+                        "textDisplay": text,
+                        "textOriginal": text,
+                        "authorDisplayName": f"@{author}",
+                        "authorProfileImageUrl": f"https://yt3.ggpht.com/ytc/{author}=s48-c-k-c0x00ffffff-no-rj",
+                        "authorChannelUrl": f"http://www.youtube.com/@{author}",
+                        "authorChannelId": {"value": f"UC{author:0>22}"[:24]},
+                        "canRate": True,
+                        "viewerRating": "none",
+                        "likeCount": index % 7,
+                        "publishedAt": "2024-01-01T00:00:00Z",
+                        "updatedAt": "2024-01-01T00:00:00Z",
+                    },
+                },
+                "canReply": True,
+                "totalReplyCount": index % 3,
+                "isPublic": True,
+            },
+        }
+
+    def _comment_text(self, video_id, index):
+        rnd = random.Random(f"{self._seed}:{video_id}:{index}")
+        return " ".join(rnd.sample(COMMENT_WORDS, rnd.randint(1, 3)))
+
+    @staticmethod
+    def _page(items, params, default_size, max_size):
+        start = int(params.get("pageToken") or 0)
+        size = min(int(params.get("maxResults") or default_size), max_size)
+        page = items[start:start + size]
+        next_token = str(start + size) if start + size < len(items) else None
+        return page, next_token
+
+    def handle(self, resource, params):
+        handler = getattr(self, f"_{resource}", None)
+        if handler is None:
+            raise ApiError(404, "notFound", f"unknown resource: {resource}")
+        return handler(params)
+
+    def _channels(self, params):
+        if "forHandle" in params:
+            found = params["forHandle"].lstrip("@").lower() == FAKE_HANDLE
+            return {"kind": "youtube#channelListResponse", "items": [{"id": self.channel_id}] if found else []}
+        if "forUsername" in params:
+            return {"kind": "youtube#channelListResponse", "items": []}
+        ids = params.get("id", "").split(",")
+        return {"kind": "youtube#channelListResponse", "items": [self.channel] if self.channel_id in ids else []}
+
+    def _search(self, params):
+        if params.get("type") == "channel":
+            found = FAKE_HANDLE in params.get("q", "").lower()
+            return {"items": [{"snippet": {"channelId": self.channel_id}}] if found else []}
+        if params.get("channelId") != self.channel_id:
+            return {"items": []}
+        after = params.get("publishedAfter")
+        videos = [v for v in self.videos if not after or v["snippet"]["publishedAt"] > after[:19] + "Z"]
+        page, next_token = self._page(videos, params, 5, 50)
+        response = {
+            "kind": "youtube#searchListResponse",
+            "items": [{"id": {"kind": "youtube#video", "videoId": v["id"]}, "snippet": v["snippet"]} for v in page],
+        }
+        if next_token:
+            response["nextPageToken"] = next_token
+        return response
+
+    def _playlistItems(self, params):
+        if params.get("playlistId") != self.channel["contentDetails"]["relatedPlaylists"]["uploads"]:
+            raise ApiError(404, "playlistNotFound")
+        page, next_token = self._page(self.videos, params, 5, 50)
+        response = {
+            "kind": "youtube#playlistItemListResponse",
+            "items": [
+                {
+                    "snippet": {"publishedAt": v["snippet"]["publishedAt"], "title": v["snippet"]["title"]},
+                    "contentDetails": {"videoId": v["id"], "videoPublishedAt": v["snippet"]["publishedAt"]},
+                }
+                for v in page
+            ],
+        }
+        if next_token:
+            response["nextPageToken"] = next_token
+        return response
+
+    def _videos(self, params):
+        ids = [i for i in params.get("id", "").split(",") if i]
+        return {
+            "kind": "youtube#videoListResponse",
+            "items": [self._by_id[i] for i in ids if i in self._by_id],
+        }
+
+    def _commentThreads(self, params):
+        video_id = params.get("videoId")
+        if video_id not in self.comments:
+            raise ApiError(404, "videoNotFound")
+        if video_id in self.comments_disabled:
+            raise ApiError(403, "commentsDisabled", "The video has disabled comments.")
+        indices = list(range(self.comments[video_id]))
+        page, next_token = self._page(indices, params, 20, 100)
+        response = {
+            "kind": "youtube#commentThreadListResponse",
+            "items": [self._comment_thread(video_id, j) for j in page],
+        }
+        if next_token:
+            response["nextPageToken"] = next_token
+        return response
+
+
+class SyntheticFleet:
+    """
+    여러 합성 채널 묶음 (다채널 배치 수집 벤치마크용)
+    - 채널별 영상 수는 n_videos 의 0.5~1.5배에서 seed 로 고정
+    - channels().list 의 id 목록, videos().list 의 영상 ID 가 여러 채널에 걸쳐도 처리
+    """
+
+    def __init__(self, n_channels=20, n_videos=30, months_back=6, seed=0):
+        rnd = random.Random(seed)
+        self.channels = [
+            SyntheticChannel(
+                rnd.randint(max(1, n_videos // 2), max(1, n_videos * 3 // 2)),
+                months_back=months_back,
+                seed=seed + i,
+                channel_id=fleet_channel_id(i),
+            )
+            for i in range(n_channels)
+        ]
+        self.channel_ids = [c.channel_id for c in self.channels]
+        self._by_channel = {c.channel_id: c for c in self.channels}
+        self._by_playlist = {c.channel["contentDetails"]["relatedPlaylists"]["uploads"]: c for c in self.channels}
+        self._by_video = {v["id"]: c for c in self.channels for v in c.videos}
+
+    def handle(self, resource, params):
+        if resource == "channels":
+            ids = [i for i in params.get("id", "").split(",") if i]
+            return {
+                "kind": "youtube#channelListResponse",
+                "items": [self._by_channel[i].channel for i in ids if i in self._by_channel],
+            }
+        if resource == "search":
+            channel = self._by_channel.get(params.get("channelId"))
+            return channel.handle(resource, params) if channel else {"items": []}
+        if resource == "playlistItems":
+            channel = self._by_playlist.get(params.get("playlistId"))
+            if channel is None:
+                raise ApiError(404, "playlistNotFound")
+            return channel.handle(resource, params)
+        if resource == "videos":
+            ids = [i for i in params.get("id", "").split(",") if i]
+            return {
+                "kind": "youtube#videoListResponse",
+                "items": [self._by_video[i]._by_id[i] for i in ids if i in self._by_video],
+            }
+        if resource == "commentThreads":
+            channel = self._by_video.get(params.get("videoId"))
+            if channel is None:
+                raise ApiError(404, "videoNotFound")
+            return channel.handle(resource, params)
+        raise ApiError(404, "notFound", f"unknown resource: {resource}")
+
+
+class FixtureStore:
+    """
+    녹화한 응답 재생
+    - fixture JSON: {"<fixture_key>": {"resource": ..., "params": ..., "response": ...}, ...}
+    - upstream 이 있으면 없는 응답은 실제 API 에서 받아 기록 (record 모드)
+    """
+
+    def __init__(self, path=None, upstream=None):
+        self.path = path
+        self.upstream = upstream
+        self.entries = {}
+        self._lock = threading.Lock()
+        if path and not upstream:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+
+    def handle(self, resource, params):
+        key = fixture_key(resource, params)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is not None:
+            return entry["response"]
+        if not self.upstream:
+            raise ApiError(404, "fixtureNotFound", f"no recorded response for {resource} {params}")
+        response = self._fetch_upstream(resource, params)
+        with self._lock:
+            self.entries[key] = {
+                "resource": resource,
+                "params": {k: v for k, v in params.items() if k != "key"},
+                "response": response,
+            }
+        return response
+
+    def _fetch_upstream(self, resource, params):
+        url = self.upstream + resource + "?" + urllib.parse.urlencode(params)
+        try:
+            with urllib.request.urlopen(url, timeout=30) as resp:
+                return json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            payload = json.loads(e.read() or b"{}")
+            reasons = [err.get("reason") for err in payload.get("error", {}).get("errors", [])]
+            raise ApiError(e.code, reasons[0] if reasons else "upstreamError")
+
+    def save(self):
+        if not self.path:
+            return
+        with self._lock:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+
+
+class FakeYouTubeAPI:
+    """
+    요청 처리 + 장애 주입 + 통계
+    - latency / jitter: 요청당 지연(초)
+    - error_rate: 일시 오류(500 backendError) 비율
+    - quota_per_key: 키별 일일 quota (초과 시 403 quotaExceeded), None 이면 무제한
+    """
+
+    def __init__(self, source, latency=0.0, jitter=0.0, error_rate=0.0, quota_per_key=None, seed=0):
+        self.source = source
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.quota_per_key = quota_per_key
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.calls = Counter()
+            self.bytes = Counter()
+            self.errors = Counter()
+            self.units_by_key = Counter()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "bytes": dict(self.bytes),
+                "errors": dict(self.errors),
+                "units_by_key": {f"...{k[-4:]}": v for k, v in self.units_by_key.items()},
+                "total_calls": sum(self.calls.values()),
+                "total_bytes": sum(self.bytes.values()),
+            }
+
+    def handle(self, resource, params):
+        """-> (status, body bytes)"""
+        api_key = params.get("key", "")
+        cost = QUOTA_COSTS.get(resource, 1)
+        with self._lock:
+            self.calls[resource] += 1
+            over_quota = (
+                self.quota_per_key is not None
+                and self.units_by_key[api_key] + cost > self.quota_per_key
+            )
+            if not over_quota:
+                self.units_by_key[api_key] += cost
+            transient = self.error_rate > 0 and self._rnd.random() < self.error_rate
+
+        delay = self.latency + (self._rnd.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+        try:
+            if not api_key:
+                raise ApiError(403, "forbidden", "API key is missing")
+            if over_quota:
+                raise ApiError(403, "quotaExceeded", "The request cannot be completed because you have exceeded your quota.")
+            if transient:
+                raise ApiError(500, "backendError", "Backend Error")
+            status, payload = 200, self.source.handle(resource, params)
+            if params.get("fields"):
+                payload = apply_fields(payload, parse_fields(params["fields"]))
+        except ApiError as e:
+            status, payload = e.status, e.body()
+            with self._lock:
+                self.errors[e.reason] += 1
+
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self.bytes[resource] += len(body)
+        return status, body
+
+
+def make_handler(api):
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # 헤더/본문을 따로 쓰므로 Nagle + delayed ACK 지연(~40ms)을 피한다
+        disable_nagle_algorithm = True
+
+        def _send(self, status, body):
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            if url.path == "/_stats":
+                return self._send(200, json.dumps(api.stats()).encode("utf-8"))
+            if not url.path.startswith(API_PREFIX):
+                return self._send(404, b'{"error": {"code": 404, "message": "not found"}}')
+            resource = url.path[len(API_PREFIX):].strip("/")
+            params = dict(urllib.parse.parse_qsl(url.query))
+            params.pop("alt", None)  # discovery 클라이언트가 붙이는 alt=json
+            status, body = api.handle(resource, params)
+            self._send(status, body)
+
+        def do_POST(self):
+            if self.path == "/_reset":
+                api.reset()
+                return self._send(200, b"{}")
+            self._send(404, b"{}")
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def start_server(api, host="127.0.0.1", port=0):
+    """백그라운드 스레드로 서버 시작 -> (server, 루트 주소). port=0 이면 빈 포트 사용"""
+    server = ThreadingHTTPServer((host, port), make_handler(api))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, name="yt-fake-server", daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YouTube Data API v3 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--videos", type=int, default=100, help="합성 채널 영상 수")
+    parser.add_argument("--channels", type=int, default=1, help="합성 채널 수 (2 이상이면 SyntheticFleet)")
+    parser.add_argument("--months-back", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fixture", help="녹화한 응답 JSON 재생")
+    parser.add_argument("--record", help="실제 API 를 프록시하며 응답을 이 파일에 녹화")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="추가 지연 최대값(초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율 (0~1)")
+    parser.add_argument("--quota-per-key", type=int, default=None, help="키별 quota (초과 시 403 quotaExceeded)")
+    args = parser.parse_args()
+
+    if args.record:
+        source = FixtureStore(args.record, upstream=UPSTREAM_URL)
+    elif args.fixture:
+        source = FixtureStore(args.fixture)
+    elif args.channels > 1:
+        source = SyntheticFleet(args.channels, args.videos, months_back=args.months_back, seed=args.seed)
+    else:
+        source = SyntheticChannel(args.videos, months_back=args.months_back, seed=args.seed)
+
+    api = FakeYouTubeAPI(
+        source,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        quota_per_key=args.quota_per_key,
+        seed=args.seed,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(api))
+    server.daemon_threads = True
+    print(f"✅ YouTube 대역 서버: http://{args.host}:{args.port} (api_endpoint 로 지정)")
+    if isinstance(source, SyntheticChannel):
+        print(f"   합성 채널: {FAKE_CHANNEL_ID} (@{FAKE_HANDLE}), 영상 {args.videos}개")
+    elif isinstance(source, SyntheticFleet):
+        print(f"   합성 채널 {args.channels}개: {source.channel_ids[0]} ~ {source.channel_ids[-1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if isinstance(source, FixtureStore) and args.record:
+            source.save()
+            print(f"💾 녹화 저장: {args.record} ({len(source.entries)}개 응답)")
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+# services/blc_batch_scorer.py
+"""
+BLC 점수 일괄 계산 (여러 채널을 NumPy 배열로 한 번에)
+- MetricsCalculator.calculate_blc_score / get_blc_matching 과 같은 규칙
+  (Tier 벤치마크, 개별 100점 cap, 가중치, 판정 구간, 매칭 규칙은 MetricsCalculator 상수를 그대로 사용)
+- 입력은 채널별 raw 값 배열 (리포트 meta_json['raw_values'] 와 같은 항목)
+- 저장된 크리에이터 수천 명 야간 재채점용: 채널별 pandas/파이썬 루프 없이 배열 연산만 사용
+
+사용 예)
+  scores = score_blc_batch(
+      subscriber_count=[12_000, 730_000],
+      engagement_median=[21.3, 35.0],
+      views_per_day_median=[180.0, 4200.0],
+      demand_index_median=[0.3, 1.2],
+      problem_rate_median=[0.004, 0.02],
+      videos_per_week=[1.5, 0.8],
+      format_improvement_pct=[np.nan, 32.5],   # 포맷 효과 분석 불가 = NaN
+  )
+  scores["blc_score"], scores["verdict"], blc_records(scores)[0]
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+COMPONENTS = list(MetricsCalculator.BLC_WEIGHTS)
+
+# Tier 순서 = TIER_THRESHOLDS 순서 (Tier_1 부터)
+TIER_NAMES = np.array([tier for _, tier in MetricsCalculator.TIER_THRESHOLDS], dtype=object)
+_TIER_FLOORS = np.array([floor for floor, _ in MetricsCalculator.TIER_THRESHOLDS][::-1], dtype=float)
+
+
+def _benchmark_arrays(benchmarks: Dict[str, Dict[str, float]]) -> Dict[str, np.ndarray]:
+    """{tier: {항목: 값}} -> {항목: TIER_NAMES 순서 배열}"""
+    defaults = {"videos_per_week_benchmark": 1.0}
+    return {
+        name: np.array(
+            [benchmarks[tier].get(name, defaults.get(name, 0.0)) for tier in TIER_NAMES],
+            dtype=float,
+        )
+        for name in ("engagement_per_1k", "views_per_day", "demand_index", "problem_rate", "videos_per_week_benchmark")
+    }
+
+
+_DEFAULT_BENCHMARKS = _benchmark_arrays(MetricsCalculator.BENCHMARKS)
+
+# 판정: 점수 하한 오름차순 (searchsorted 용)
+_VERDICT_FLOORS = np.array([floor for floor, _ in MetricsCalculator.VERDICTS][::-1], dtype=float)
+_VERDICT_LABELS = np.array([label for _, label in MetricsCalculator.VERDICTS][::-1], dtype=object)
+
+MATCHING_KEYS = np.array(list(MetricsCalculator.BLC_MATCHING_PROFILES), dtype=object)
+_MATCHING_INDEX = {key: i for i, key in enumerate(MATCHING_KEYS)}
+
+
+def _as_array(values: ArrayLike, n: Optional[int] = None) -> np.ndarray:
+    array = np.asarray(values, dtype=float)
+    if array.ndim != 1:
+        raise ValueError("채널별 값은 1차원 배열이어야 합니다.")
+    if n is not None and len(array) != n:
+        raise ValueError(f"배열 길이가 다릅니다: {len(array)} != {n}")
+    return array
+
+
+def tier_indices(subscriber_count: ArrayLike) -> np.ndarray:
+    """구독자 수 -> TIER_NAMES 위치 (0 = Tier_1_Major)"""
+    subscribers = _as_array(subscriber_count)
+    # 하한 오름차순 기준 위치 (1만 미만 = 0) -> TIER_THRESHOLDS 순서로 뒤집기
+    position = np.searchsorted(_TIER_FLOORS, subscribers, side="right") - 1
+    position[np.isnan(subscribers)] = 0
+    return (len(TIER_NAMES) - 1) - np.clip(position, 0, len(TIER_NAMES) - 1)
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """0 으로 나누면 inf/nan (calculate_blc_score 의 float 나눗셈과 같은 cap 결과)"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return numerator / denominator
+
+
+def _round1(values: np.ndarray) -> np.ndarray:
+    """
+    소수 1자리 반올림 (파이썬 round(x, 1) 과 같은 결과)
+    - np.round 는 x*10 을 반올림해서 .x5 경계 근처에서 round() 와 다를 수 있음 -> 경계 근처 값만 round() 로 다시 계산
+    """
+    rounded = np.round(values, 1)
+    scaled = values * 10
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    for i in np.flatnonzero(near_half):
+        rounded[i] = round(float(values[i]), 1)
+    return rounded
+
+
+def score_blc_batch(
+    subscriber_count: ArrayLike,
+    engagement_median: ArrayLike,
+    views_per_day_median: ArrayLike,
+    demand_index_median: ArrayLike,
+    problem_rate_median: ArrayLike,
+    videos_per_week: ArrayLike,
+    format_improvement_pct: Optional[ArrayLike] = None,
+    benchmarks: Optional[Dict[str, Dict[str, float]]] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    채널 N개 BLC 점수 일괄 계산
+    - format_improvement_pct: analyze_format_effect 의 improvement_pct (분석 불가/None = NaN -> 기본 50점)
+    - benchmarks: Tier별 벤치마크 (None 이면 MetricsCalculator.BENCHMARKS)
+    - 반환: {'blc_score', 'verdict', 'tier', 'matching', 구성 점수 6개} (모두 길이 N 배열)
+      점수는 소수 1자리 반올림, 판정은 반올림 전 BLC, 매칭은 반올림한 구성 점수 기준 (단일 채널 계산과 같음)
+    """
+    subscribers = _as_array(subscriber_count)
+    n = len(subscribers)
+    eng = _as_array(engagement_median, n)
+    vpd = _as_array(views_per_day_median, n)
+    demand = _as_array(demand_index_median, n)
+    problem = _as_array(problem_rate_median, n)
+    vpw = _as_array(videos_per_week, n)
+    improvement = (
+        np.full(n, np.nan)
+        if format_improvement_pct is None
+        else _as_array(format_improvement_pct, n)
+    )
+
+    tier = tier_indices(subscribers)
+    calc = MetricsCalculator
+    bench = _DEFAULT_BENCHMARKS if benchmarks is None else _benchmark_arrays(benchmarks)
+
+    # 1. Engagement / 2. Views: 벤치마크 대비 (100점 cap)
+    eng_score = np.minimum(
+        _divide(eng, bench["engagement_per_1k"][tier] * calc.ENGAGEMENT_FULL_MARK_RATIO) * 100, 100
+    )
+    views_score = np.minimum(_divide(vpd, bench["views_per_day"][tier]) * 100, 100)
+
+    # 3. Demand: 만점 기준 이상이면 100, 아니면 벤치마크 대비
+    demand_score = np.where(
+        demand >= calc.DEMAND_MAX_THRESHOLD,
+        100.0,
+        np.minimum(_divide(demand, bench["demand_index"][tier]) * 100, 100),
+    )
+
+    # 4. Problem: 만점 기준 이상이면 100, 아니면 벤치마크 2배 대비 (벤치마크 0 이면 0)
+    bench_problem = bench["problem_rate"][tier]
+    problem_score = np.select(
+        [problem >= calc.PROBLEM_MAX_THRESHOLD, bench_problem > 0],
+        [100.0, _divide(problem, bench_problem * calc.PROBLEM_FULL_MARK_RATIO) * 100],
+        default=0.0,
+    )
+    problem_score = np.minimum(problem_score, 100)
+
+    # 5. Format: 개선율 2배 (분석 불가면 기본값)
+    format_score = np.where(
+        np.isnan(improvement),
+        float(calc.FORMAT_DEFAULT_SCORE),
+        np.minimum(improvement * 2, 100),
+    )
+    format_score = np.minimum(format_score, 100)
+
+    # 6. Consistency: 주간 업로드 횟수 / 벤치마크
+    bench_vpw = bench["videos_per_week_benchmark"][tier]
+    consistency_score = np.minimum(
+        np.where(bench_vpw > 0, _divide(vpw, bench_vpw) * 100, 0.0), 100
+    )
+
+    components = {
+        "engagement_score": eng_score,
+        "views_score": views_score,
+        "demand_score": demand_score,
+        "problem_score": problem_score,
+        "format_score": format_score,
+        "consistency_score": consistency_score,
+    }
+
+    # 가중 합 (calculate_blc_score 와 같은 순서로 더해 부동소수 결과 일치)
+    blc = np.zeros(n)
+    for name in COMPONENTS:
+        blc = blc + components[name] * calc.BLC_WEIGHTS[name]
+    blc = np.minimum(blc, 100)
+
+    # 판정: 하한 오름차순 searchsorted (NaN 은 최하 등급)
+    verdict_position = np.searchsorted(_VERDICT_FLOORS, blc, side="right") - 1
+    verdict_position[np.isnan(blc)] = 0
+    verdict = _VERDICT_LABELS[np.clip(verdict_position, 0, len(_VERDICT_LABELS) - 1)]
+
+    rounded = {name: _round1(score) for name, score in components.items()}
+
+    return {
+        "blc_score": _round1(blc),
+        "verdict": verdict,
+        "tier": TIER_NAMES[tier],
+        "matching": match_blc_batch(
+            rounded["engagement_score"], rounded["demand_score"], rounded["problem_score"]
+        ),
+        **rounded,
+    }
+
+
+def match_blc_batch(
+    engagement_score: ArrayLike,
+    demand_score: ArrayLike,
+    problem_score: ArrayLike,
+) -> np.ndarray:
+    """get_blc_matching 규칙 일괄 적용 -> BLC_MATCHING_PROFILES key 배열"""
+    engagement = _as_array(engagement_score)
+    n = len(engagement)
+    demand = _as_array(demand_score, n)
+    problem = _as_array(problem_score, n)
+
+    top = engagement >= 80
+    upper = ~top & (engagement >= 60)
+    middle = ~top & ~upper & (engagement >= 40)
+    conditions = [
+        top & (demand >= 80),
+        top,
+        upper & (demand >= 60) & (problem < 60),
+        upper & (demand >= 60) & (problem >= 60),
+        upper,
+        middle & (problem >= 70),
+        middle,
+    ]
+    choices = [
+        _MATCHING_INDEX[key]
+        for key in ("premium", "trend", "daily", "solution", "general_balanced", "intensive", "general_practical")
+    ]
+    return MATCHING_KEYS[np.select(conditions, choices, default=_MATCHING_INDEX["growth"])]
+
+
+def blc_records(scores: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    score_blc_batch 결과 -> 채널별 dict 목록
+    (calculate_blc_score 의 blc_score/verdict/tier/components + 'blc_matching')
+    """
+    profiles = MetricsCalculator.BLC_MATCHING_PROFILES
+    component_lists = {name: scores[name].tolist() for name in COMPONENTS}
+    return [
+        {
+            "blc_score": blc_score,
+            "verdict": verdict,
+            "tier": tier,
+            "components": {name: component_lists[name][i] for name in COMPONENTS},
+            "blc_matching": dict(profiles[matching]),
+        }
+        for i, (blc_score, verdict, tier, matching) in enumerate(zip(
+            scores["blc_score"].tolist(),
+            scores["verdict"].tolist(),
+            scores["tier"].tolist(),
+            scores["matching"].tolist(),
+        ))
+    ]
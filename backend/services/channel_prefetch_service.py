@@ -0,0 +1,81 @@
+# services/channel_prefetch_service.py
+"""
+의뢰 접수 시 채널 데이터 미리 수집 (백그라운드)
+- POST /request 가 의뢰 저장 후 enqueue_channel_prefetch(request_id) 호출
+- 전용 worker 1개(낮은 우선순위)가 채널 ID 확인 + 스냅샷 수집/저장을 순서대로 처리
+  -> 관리자가 분석을 시작할 때는 최근 스냅샷을 API 호출 없이 재사용하므로 LLM 단계만 기다린다
+- 분석 시작 시 같은 의뢰의 미리 수집이
+  - 대기열에 있으면 취소하고 분석 쪽에서 바로 수집
+  - 실행 중이면 끝날 때까지 기다린 뒤 그 결과를 사용 (중복 수집 방지)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Optional
+
+from core.config import YOUTUBE_PREFETCH, YOUTUBE_PREFETCH_WAIT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# 관리자 분석/다른 API 요청과 경쟁하지 않도록 worker 1개로 순차 처리
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yt-prefetch")
+_futures: Dict[int, Future] = {}
+_lock = threading.Lock()
+
+
+def _prefetch_job(request_id: int) -> Optional[str]:
+    # creator_report_service 가 이 모듈을 import 하므로 순환 import 를 피해 실행 시점에 import
+    from core.db import SessionLocal
+    from services.creator_report_service import prefetch_channel_data_for_request
+
+    db = SessionLocal()
+    try:
+        return prefetch_channel_data_for_request(db, request_id)
+    except Exception as e:
+        # 미리 수집 실패는 분석 시작 시 다시 수집하면 되므로 로그만 남김
+        logger.warning("[Prefetch] request_id=%s 미리 수집 실패: %s", request_id, e)
+        return None
+    finally:
+        db.close()
+        with _lock:
+            _futures.pop(request_id, None)
+
+
+def enqueue_channel_prefetch(request_id: int) -> bool:
+    """미리 수집 작업 등록 (이미 대기/실행 중이면 무시). 등록했으면 True"""
+    if not YOUTUBE_PREFETCH:
+        return False
+    with _lock:
+        if request_id in _futures:
+            return False
+        _futures[request_id] = _executor.submit(_prefetch_job, request_id)
+    print(f"  [Prefetch] 📥 request_id={request_id} 채널 데이터 미리 수집 등록")
+    return True
+
+
+def wait_for_prefetch(request_id: int, timeout: float = YOUTUBE_PREFETCH_WAIT_SECONDS) -> None:
+    """
+    분석 시작 전에 호출
+    - 아직 시작 안 한 작업은 취소 (분석 쪽에서 바로 수집하는 편이 빠름)
+    - 실행 중인 작업은 timeout 초까지 대기 (초과하면 그냥 진행)
+    """
+    with _lock:
+        future = _futures.get(request_id)
+        if future is None:
+            return
+        if future.cancel():
+            _futures.pop(request_id, None)
+            print(f"  [Prefetch] ⏭️ request_id={request_id} 대기 중인 미리 수집 취소")
+            return
+
+    print(f"  [Prefetch] ⏳ request_id={request_id} 진행 중인 미리 수집 완료 대기...")
+    try:
+        future.result(timeout=timeout)
+    except FutureTimeoutError:
+        logger.warning("[Prefetch] request_id=%s 미리 수집 대기 시간 초과 (%ss)", request_id, timeout)
+    except CancelledError:
+        pass
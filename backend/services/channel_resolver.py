@@ -0,0 +1,69 @@
+# services/channel_resolver.py
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from googleapiclient.errors import HttpError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.channel_resolution import ChannelResolution
+from services.youtube_data_collector import YouTubeDataCollector, parse_channel_query
+
+# 존재하지 않는 핸들은 이 기간 동안 다시 API 로 찾지 않는다
+NEGATIVE_TTL = timedelta(days=1)
+
+
+def resolve_channel_id(
+    db: Session,
+    collector: YouTubeDataCollector,
+    channel_query: str,
+    negative_ttl: timedelta = NEGATIVE_TTL,
+) -> Optional[str]:
+    """
+    채널 입력값(@핸들 / 채널 URL / UC ID) -> 채널 ID
+    1) URL·UC ID 는 로컬에서 바로 해석 (API 호출 없음)
+    2) channel_resolution 테이블 조회 (PK 조회 1회)
+    3) 미스일 때만 collector 로 API 해석 후 결과(없는 핸들 포함)를 저장
+       - API 오류는 저장하지 않는다 (일시 오류를 negative cache 하지 않도록)
+       - 미리 수집과 관리자 분석이 같은 핸들을 동시에 저장하면 먼저 저장된 행을 다시 읽어 사용
+    """
+    kind, value = parse_channel_query(channel_query)
+    if kind is None:
+        return None
+    if kind == "id":
+        return value
+
+    handle = value.lower()
+    row: Optional[ChannelResolution] = db.get(ChannelResolution, handle)
+    if row is not None:
+        if row.channel_id:
+            print(f"  [ChannelResolver] ✅ 캐시 적중: @{handle} -> {row.channel_id}")
+            return row.channel_id
+        resolved_at = row.resolved_at
+        if resolved_at is not None and resolved_at.tzinfo is None:
+            resolved_at = resolved_at.replace(tzinfo=timezone.utc)
+        if resolved_at and datetime.now(timezone.utc) - resolved_at < negative_ttl:
+            print(f"  [ChannelResolver] ⚠️ 존재하지 않는 핸들 (캐시): @{handle}")
+            return None
+
+    try:
+        channel_id = collector.get_channel_id_from_username("@" + value, raise_errors=True)
+    except HttpError:
+        return None
+
+    if row is None:
+        row = ChannelResolution(handle=handle)
+        db.add(row)
+    row.channel_id = channel_id
+    row.resolved_at = datetime.now(timezone.utc)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 다른 세션이 같은 핸들을 먼저 저장 (PK 충돌) -> 그 결과 사용
+        db.rollback()
+        stored = db.get(ChannelResolution, handle)
+        if stored is not None and stored.channel_id:
+            return stored.channel_id
+
+    return channel_id
@@ -0,0 +1,148 @@
+# services/channel_snapshot_service.py
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from core.config import (
+    YOUTUBE_SNAPSHOT_FRESH_MINUTES,
+    YOUTUBE_SNAPSHOT_STORE_COMPRESSION,
+    YOUTUBE_SNAPSHOT_STORE_DIR,
+    YOUTUBE_SNAPSHOT_STORE_KEEP,
+)
+from models.channel_snapshot import ChannelSnapshot
+from services.channel_snapshot_store import ChannelSnapshotStore
+from services.youtube_data_collector import YouTubeDataCollector
+from services.youtube_video_record import videos_to_dicts
+
+# 스냅샷이 이보다 오래되면 증분 대신 전체 재수집
+DELTA_MAX_AGE = timedelta(days=14)
+
+# 스냅샷이 이보다 최근이면 API 호출 없이 그대로 사용 (의뢰 접수 시 미리 수집한 데이터 재사용)
+FRESH_MAX_AGE = timedelta(minutes=YOUTUBE_SNAPSHOT_FRESH_MINUTES)
+
+# 수집 원본 컬럼형 스냅샷 (재분석용, 설정된 경우만)
+file_store: Optional[ChannelSnapshotStore] = (
+    ChannelSnapshotStore(
+        YOUTUBE_SNAPSHOT_STORE_DIR,
+        YOUTUBE_SNAPSHOT_STORE_COMPRESSION,
+        keep=YOUTUBE_SNAPSHOT_STORE_KEEP,
+    )
+    if YOUTUBE_SNAPSHOT_STORE_DIR
+    else None
+)
+
+
+def load_snapshot(db: Session, channel_id: str) -> Optional[ChannelSnapshot]:
+    return db.get(ChannelSnapshot, channel_id)
+
+
+def save_snapshot(db: Session, channel_id: str, data: Dict[str, Any]) -> ChannelSnapshot:
+    """채널의 마지막 수집 결과를 덮어쓴다 (채널당 1행)"""
+    snapshot = db.get(ChannelSnapshot, channel_id)
+    if snapshot is None:
+        snapshot = ChannelSnapshot(channel_id=channel_id)
+        db.add(snapshot)
+
+    snapshot.analysis_period_months = int(data.get("analysis_period_months", 6))
+    snapshot.video_count = len(data.get("videos", []))
+    snapshot.data = {**data, "videos": videos_to_dicts(data.get("videos", []))}
+    snapshot.collected_at = datetime.now(timezone.utc)
+    db.commit()
+    return snapshot
+
+
+def _snapshot_age(snapshot: ChannelSnapshot) -> timedelta:
+    collected_at = snapshot.collected_at
+    if collected_at.tzinfo is None:
+        collected_at = collected_at.replace(tzinfo=timezone.utc)
+    return datetime.now(timezone.utc) - collected_at
+
+
+def _is_full_depth(snapshot: ChannelSnapshot) -> bool:
+    """quota 축소 모드(영상/댓글 수 축소)로 수집한 스냅샷이 아닌지"""
+    return not (snapshot.data or {}).get("degraded")
+
+
+def load_fresh_snapshot_data(
+    db: Session,
+    channel_id: str,
+    months_back: int = 6,
+    fresh_max_age: timedelta = FRESH_MAX_AGE,
+) -> Optional[Dict[str, Any]]:
+    """
+    fresh_max_age 이내에 같은 분석 기간으로 수집된 스냅샷이 있으면 그 데이터, 없으면 None
+    - quota 축소 모드 스냅샷은 최근이어도 재사용하지 않음 (전체 분석 결과처럼 쓰이지 않도록)
+    """
+    if fresh_max_age <= timedelta(0):
+        return None
+    snapshot = load_snapshot(db, channel_id)
+    if (
+        snapshot is None
+        or snapshot.analysis_period_months != months_back
+        or _snapshot_age(snapshot) > fresh_max_age
+        or not _is_full_depth(snapshot)
+    ):
+        return None
+    print(f"  [Snapshot] ✅ 최근 스냅샷 재사용 ({snapshot.collected_at:%Y-%m-%d %H:%M}, API 호출 없음)")
+    return snapshot.data
+
+
+def collect_channel_data(
+    db: Session,
+    collector: YouTubeDataCollector,
+    channel_id: str,
+    max_videos: int = 100,
+    months_back: int = 6,
+    max_comments: int = 100,
+    degraded: bool = False,
+) -> Optional[Dict[str, Any]]:
+    """
+    - 최근(FRESH_MAX_AGE 이내) 전체 깊이 스냅샷이 있으면 그대로 반환
+    - 스냅샷이 있으면 증분 수집, 없거나 조건이 다르면 전체 수집 후 스냅샷 저장
+    - degraded: 이번 수집이 quota 축소 모드인지 (스냅샷에 기록)
+      축소 모드 스냅샷은 빠진 영상/댓글이 계속 이어지지 않도록 증분 기준으로 쓰지 않고 전체 수집
+    """
+    fresh = load_fresh_snapshot_data(db, channel_id, months_back)
+    if fresh is not None:
+        return fresh
+
+    snapshot = load_snapshot(db, channel_id)
+
+    use_delta = (
+        snapshot is not None
+        and snapshot.analysis_period_months == months_back
+        and _snapshot_age(snapshot) <= DELTA_MAX_AGE
+    )
+    if use_delta and not _is_full_depth(snapshot):
+        print("  [Snapshot] ⚠️ 이전 스냅샷이 축소 모드 수집이라 전체 재수집")
+        use_delta = False
+
+    if use_delta:
+        print(f"  [Snapshot] ♻️ 이전 스냅샷 기준 증분 수집 ({snapshot.collected_at:%Y-%m-%d %H:%M})")
+        data = collector.collect_delta_data(
+            channel_id=channel_id,
+            previous=snapshot.data,
+            max_videos=max_videos,
+            months_back=months_back,
+            max_comments=max_comments,
+        )
+    else:
+        data = collector.collect_full_data(
+            channel_id=channel_id,
+            max_videos=max_videos,
+            months_back=months_back,
+            max_comments=max_comments,
+        )
+
+    if data and data.get("channel"):
+        data["degraded"] = degraded
+        save_snapshot(db, channel_id, data)
+        if file_store is not None:
+            try:
+                file_store.save(data)
+            except OSError as e:
+                # 파일 스냅샷은 재분석용 보조 저장이므로 실패해도 수집 결과는 그대로 사용
+                print(f"  [SnapshotStore] ⚠️ 스냅샷 파일 저장 실패: {e}")
+    return data
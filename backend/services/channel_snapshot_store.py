@@ -0,0 +1,244 @@
+# services/channel_snapshot_store.py
+"""
+수집한 채널 원본 데이터의 컬럼형 스냅샷 저장소 (Arrow IPC)
+- 스냅샷 1개 = 디렉터리 1개: channel.arrow / videos.arrow / comments.arrow
+    {root}/{channel_id}/{수집 시각 YYYYmmddTHHMMSS}/
+- 읽기는 memory map: 압축하지 않은 스냅샷의 숫자 열은 복사 없이 DataFrame 으로 사용
+- 댓글 원문은 영상 순서대로 한 테이블에 저장 (video_id 는 dictionary 인코딩)
+- 채널별로 최근 keep 개 스냅샷만 남기고 저장할 때마다 오래된 것부터 삭제
+- load_for_metrics() 결과를 그대로 MetricsCalculator 에 넘기면 API 호출 없이 재분석
+
+사용 예)
+  store = ChannelSnapshotStore("/data/snapshots")
+  path = store.save(raw_data)
+  calculator = MetricsCalculator(store.load_for_metrics(path))
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa  # pip install pyarrow
+
+from services.youtube_video_record import videos_to_dicts
+
+CHANNEL_FILE = "channel.arrow"
+VIDEOS_FILE = "videos.arrow"
+COMMENTS_FILE = "comments.arrow"
+
+CHANNEL_SCHEMA = pa.schema([
+    ("channel_id", pa.string()),
+    ("channel_name", pa.string()),
+    ("description", pa.string()),
+    ("subscriber_count", pa.int64()),
+    ("total_views", pa.int64()),
+    ("video_count", pa.int64()),
+    ("published_at", pa.string()),
+    ("collection_date", pa.string()),
+    ("analysis_period_months", pa.int32()),
+])
+
+VIDEOS_SCHEMA = pa.schema([
+    ("video_id", pa.string()),
+    ("title", pa.string()),
+    ("published_at", pa.string()),
+    ("days_since_upload", pa.int64()),
+    ("duration_seconds", pa.int64()),
+    ("duration_formatted", pa.string()),
+    ("view_count", pa.int64()),
+    ("like_count", pa.int64()),
+    ("comment_count", pa.int64()),
+    ("tags", pa.list_(pa.string())),
+    ("thumbnail_high", pa.string()),
+    ("comments_target", pa.float64()),
+    ("comments_error", pa.bool_()),
+])
+
+COMMENTS_SCHEMA = pa.schema([
+    ("video_id", pa.dictionary(pa.int32(), pa.string())),
+    ("text", pa.string()),
+])
+
+_CHANNEL_FIELDS = [f.name for f in CHANNEL_SCHEMA if f.name not in ("collection_date", "analysis_period_months")]
+
+
+def _write_table(path: str, table: pa.Table, compression: Optional[str]) -> None:
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    with pa.OSFile(path, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+
+
+def _read_table(path: str) -> pa.Table:
+    """memory map 으로 읽기 (압축하지 않은 파일은 버퍼를 복사하지 않음)"""
+    with pa.memory_map(path, "r") as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def _snapshot_stamp(collection_date: Optional[str]) -> str:
+    try:
+        collected_at = datetime.fromisoformat(collection_date) if collection_date else None
+    except ValueError:
+        collected_at = None
+    collected_at = collected_at or datetime.now(timezone.utc)
+    return collected_at.strftime("%Y%m%dT%H%M%S")
+
+
+class ChannelSnapshotStore:
+    """
+    채널 스냅샷 파일 저장소
+    - root: 저장 디렉터리
+    - compression: None(기본, memory map 무복사 읽기) | 'zstd' | 'lz4' (디스크 절약, 읽을 때 압축 해제)
+    - keep: 채널별로 남길 최근 스냅샷 수 (0 이하면 삭제하지 않음)
+    """
+
+    def __init__(self, root: str, compression: Optional[str] = None, keep: int = 5):
+        self.root = root
+        self.compression = compression
+        self.keep = keep
+
+    # --- 저장 ---
+    def save(self, data: Dict[str, Any]) -> str:
+        """collect_full_data 형식의 dict 저장 -> 스냅샷 디렉터리 경로"""
+        channel = data["channel"]
+        videos = videos_to_dicts(data.get("videos", []))
+        path = os.path.join(self.root, channel["channel_id"], _snapshot_stamp(data.get("collection_date")))
+        os.makedirs(path, exist_ok=True)
+
+        channel_row = {name: [channel.get(name)] for name in _CHANNEL_FIELDS}
+        channel_row["collection_date"] = [data.get("collection_date")]
+        channel_row["analysis_period_months"] = [data.get("analysis_period_months")]
+        _write_table(
+            os.path.join(path, CHANNEL_FILE),
+            pa.Table.from_pydict(channel_row, schema=CHANNEL_SCHEMA),
+            self.compression,
+        )
+
+        video_columns = {
+            field.name: [video.get(field.name) for video in videos]
+            for field in VIDEOS_SCHEMA
+        }
+        video_columns["comments_error"] = [bool(v) for v in video_columns["comments_error"]]
+        video_columns["tags"] = [v or [] for v in video_columns["tags"]]
+        _write_table(
+            os.path.join(path, VIDEOS_FILE),
+            pa.Table.from_pydict(video_columns, schema=VIDEOS_SCHEMA),
+            self.compression,
+        )
+
+        # 영상 순서대로 이어 붙인 댓글 + 영상 위치(dictionary index)
+        counts = [len(video.get("comments") or []) for video in videos]
+        indices = pa.array(np.repeat(np.arange(len(videos), dtype=np.int32), counts))
+        comment_video_ids = pa.DictionaryArray.from_arrays(
+            indices, pa.array(video_columns["video_id"], type=pa.string())
+        )
+        texts = pa.array(
+            [text for video in videos for text in (video.get("comments") or [])],
+            type=pa.string(),
+        )
+        _write_table(
+            os.path.join(path, COMMENTS_FILE),
+            pa.Table.from_arrays([comment_video_ids, texts], schema=COMMENTS_SCHEMA),
+            self.compression,
+        )
+        print(f"  [SnapshotStore] 💾 스냅샷 저장: {path} (영상 {len(videos)}개, 댓글 {sum(counts):,}개)")
+        self.prune(channel["channel_id"])
+        return path
+
+    def prune(self, channel_id: str, keep: Optional[int] = None) -> List[str]:
+        """채널의 최근 keep 개만 남기고 오래된 스냅샷 디렉터리 삭제 -> 삭제한 경로 목록"""
+        keep = self.keep if keep is None else keep
+        channel_dir = os.path.join(self.root, channel_id)
+        if keep <= 0 or not os.path.isdir(channel_dir):
+            return []
+        # 저장 도중 실패한 불완전한 디렉터리도 오래된 순서에 포함
+        stamps = sorted(
+            name for name in os.listdir(channel_dir)
+            if os.path.isdir(os.path.join(channel_dir, name))
+        )
+        removed = [os.path.join(channel_dir, name) for name in stamps[:-keep]]
+        for path in removed:
+            shutil.rmtree(path, ignore_errors=True)
+        return removed
+
+    # --- 조회 ---
+    def list_snapshots(self, channel_id: str) -> List[str]:
+        """채널의 스냅샷 디렉터리 목록 (오래된 순)"""
+        channel_dir = os.path.join(self.root, channel_id)
+        if not os.path.isdir(channel_dir):
+            return []
+        return [
+            os.path.join(channel_dir, name)
+            for name in sorted(os.listdir(channel_dir))
+            if os.path.isfile(os.path.join(channel_dir, name, VIDEOS_FILE))
+        ]
+
+    def latest(self, channel_id: str) -> Optional[str]:
+        snapshots = self.list_snapshots(channel_id)
+        return snapshots[-1] if snapshots else None
+
+    def disk_usage(self, path: str) -> int:
+        """스냅샷 디렉터리 크기 (bytes)"""
+        return sum(
+            os.path.getsize(os.path.join(path, name))
+            for name in (CHANNEL_FILE, VIDEOS_FILE, COMMENTS_FILE)
+        )
+
+    # --- 읽기 ---
+    def load_tables(self, path: str) -> Dict[str, pa.Table]:
+        """{'channel', 'videos', 'comments'} Arrow 테이블 (memory map)"""
+        return {
+            "channel": _read_table(os.path.join(path, CHANNEL_FILE)),
+            "videos": _read_table(os.path.join(path, VIDEOS_FILE)),
+            "comments": _read_table(os.path.join(path, COMMENTS_FILE)),
+        }
+
+    def load_for_metrics(self, path: str) -> Dict[str, Any]:
+        """
+        MetricsCalculator 입력 형식으로 읽기
+        - 'videos' 는 DataFrame (숫자 열은 memory map 버퍼를 그대로 사용)
+        - 'comments' / 'tags' 열만 영상별 list[str] 로 만든다
+          (키워드 정규식 매칭에 Python 문자열이 필요하고, numpy 배열 셀은 DataFrame.replace 와 맞지 않음)
+        """
+        tables = self.load_tables(path)
+        channel_row = tables["channel"].to_pylist()[0]
+        channel = {name: channel_row[name] for name in _CHANNEL_FIELDS}
+
+        videos = tables["videos"]
+        videos_df = videos.drop_columns(["tags"]).to_pandas(split_blocks=True)
+        videos_df.insert(videos.schema.get_field_index("tags"), "tags", videos.column("tags").to_pylist())
+        videos_df["comments"] = self._comments_by_video(tables["comments"], len(videos_df))
+        return {
+            "channel": channel,
+            "videos": videos_df,
+            "collection_date": channel_row["collection_date"],
+            "analysis_period_months": channel_row["analysis_period_months"],
+        }
+
+    def load(self, path: str) -> Dict[str, Any]:
+        """collect_full_data 와 같은 dict 형식으로 읽기 (영상은 dict 목록)"""
+        data = self.load_for_metrics(path)
+        videos_df = data["videos"]
+        videos = videos_df.to_dict("records")
+        for video in videos:
+            if pd.isna(video["comments_target"]):
+                del video["comments_target"]
+            else:
+                video["comments_target"] = int(video["comments_target"])
+            if not video["comments_error"]:
+                del video["comments_error"]
+        return {**data, "videos": videos}
+
+    @staticmethod
+    def _comments_by_video(comments: pa.Table, n_videos: int) -> list:
+        """영상 순서대로 저장된 댓글 -> 영상별 list[str]"""
+        texts = comments.column("text").to_pylist()
+        indices = comments.column("video_id").combine_chunks().indices.to_numpy(zero_copy_only=False)
+        bounds = np.cumsum(np.bincount(indices, minlength=n_videos))
+        starts = np.concatenate(([0], bounds[:-1]))
+        return [texts[start:end] for start, end in zip(starts.tolist(), bounds.tolist())]
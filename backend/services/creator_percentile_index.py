@@ -0,0 +1,176 @@
+# services/creator_percentile_index.py
+"""
+Tier 내 백분위 순위 인덱스 (크리에이터 리포트 BLC / 구성 점수)
+- Tier × 점수 항목별 정렬 리스트를 메모리에 유지 -> bisect 로 O(log n) 백분위 조회
+- 의뢰별 최신 버전 리포트만 모집단 (같은 의뢰의 새 버전이 들어오면 이전 값을 빼고 넣음)
+- 처음 조회할 때 점수 컬럼만 한 번에 읽어 구성, 이후 리포트 저장/재채점 시 add_report() 로 증분 반영
+- 다른 프로세스(워커, CLI 재채점)가 저장한 리포트는 CREATOR_PERCENTILE_RELOAD_SECONDS 마다 다시 읽어 반영
+
+사용 예)
+  creator_percentile_index.add_report(report)             # 리포트 저장 직후
+  creator_percentile_index.lookup_report(db, report)
+  # {'tier': 'Tier_3_Rising', 'sample_size': 120,
+  #  'scores': {'blc_score': {'percentile': 82.5, 'rank': 22}, 'engagement_score': {...}, ...}}
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from core.config import CREATOR_PERCENTILE_RELOAD_SECONDS
+from models.report_creator import ReportCreator
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+SCORE_FIELDS = ["blc_score", *MetricsCalculator.BLC_WEIGHTS]
+
+
+def _score_values(source) -> Optional[Dict[str, float]]:
+    """ReportCreator / 조회 행 -> {항목: 점수} (점수가 하나라도 없으면 None)"""
+    values = {name: getattr(source, name) for name in SCORE_FIELDS}
+    if any(value is None for value in values.values()):
+        return None
+    return {name: float(value) for name, value in values.items()}
+
+
+class TierPercentileIndex:
+    """Tier × 점수 항목별 정렬 리스트 (스레드 안전)"""
+
+    def __init__(self, reload_seconds: float = CREATOR_PERCENTILE_RELOAD_SECONDS):
+        self.reload_seconds = reload_seconds
+        self._lock = threading.Lock()
+        self._sorted: Dict[str, Dict[str, List[float]]] = {}
+        self._entries: Dict[int, Tuple[int, str, Dict[str, float]]] = {}  # request_id -> (version, tier, 점수)
+        self._loaded_at: Optional[float] = None
+
+    # --- 구성 ---
+    def load(self, db: Session) -> None:
+        """의뢰별 최신 리포트 점수 컬럼만 읽어 전체 재구성"""
+        latest = (
+            select(
+                ReportCreator.request_id.label("request_id"),
+                func.max(ReportCreator.version).label("version"),
+            )
+            .group_by(ReportCreator.request_id)
+            .subquery()
+        )
+        stmt = (
+            select(
+                ReportCreator.request_id,
+                ReportCreator.version,
+                ReportCreator.blc_tier,
+                *[getattr(ReportCreator, name) for name in SCORE_FIELDS],
+            )
+            .join(
+                latest,
+                and_(
+                    ReportCreator.request_id == latest.c.request_id,
+                    ReportCreator.version == latest.c.version,
+                ),
+            )
+            .where(ReportCreator.blc_tier.isnot(None))
+        )
+
+        entries: Dict[int, Tuple[int, str, Dict[str, float]]] = {}
+        columns: Dict[str, Dict[str, List[float]]] = {}
+        for row in db.execute(stmt):
+            values = _score_values(row)
+            if values is None:
+                continue
+            entries[row.request_id] = (row.version, row.blc_tier, values)
+            tier_columns = columns.setdefault(row.blc_tier, {name: [] for name in SCORE_FIELDS})
+            for name, value in values.items():
+                tier_columns[name].append(value)
+        for tier_columns in columns.values():
+            for values in tier_columns.values():
+                values.sort()
+
+        with self._lock:
+            self._entries = entries
+            self._sorted = columns
+            self._loaded_at = time.monotonic()
+        print(f"  [PercentileIndex] ✅ 리포트 {len(entries)}개로 Tier 백분위 인덱스 구성")
+
+    def ensure_loaded(self, db: Session) -> None:
+        with self._lock:
+            fresh = (
+                self._loaded_at is not None
+                and time.monotonic() - self._loaded_at < self.reload_seconds
+            )
+        if not fresh:
+            self.load(db)
+
+    def invalidate(self) -> None:
+        """다음 조회 때 다시 읽도록 표시"""
+        with self._lock:
+            self._loaded_at = None
+
+    # --- 증분 반영 ---
+    def add_report(self, report: ReportCreator) -> None:
+        """
+        새로 저장된 리포트 반영 (같은 의뢰의 이전 버전 값은 제거)
+        - 아직 인덱스를 만들지 않았으면 아무것도 하지 않음 (첫 조회 때 DB 에서 함께 읽힘)
+        """
+        values = _score_values(report)
+        if values is None or not report.blc_tier:
+            return
+        self.add(report.request_id, report.version, report.blc_tier, values)
+
+    def add(self, request_id: int, version: int, tier: str, values: Dict[str, float]) -> None:
+        """add_report 와 같음 (ORM 객체 대신 값으로)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            previous = self._entries.get(request_id)
+            if previous is not None and previous[0] > version:
+                return
+            if previous is not None:
+                _, old_tier, old_values = previous
+                for name, value in old_values.items():
+                    column = self._sorted[old_tier][name]
+                    del column[bisect_left(column, value)]
+            tier_columns = self._sorted.setdefault(tier, {name: [] for name in SCORE_FIELDS})
+            for name in SCORE_FIELDS:
+                insort(tier_columns[name], float(values[name]))
+            self._entries[request_id] = (version, tier, values)
+
+    # --- 조회 ---
+    def lookup(self, tier: str, values: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Tier 내 위치
+        - percentile: Tier 내에서 이 점수보다 낮은 비율 + 같은 점수의 절반 (0~100)
+        - rank: 이 점수보다 높은 크리에이터 수 + 1 (1 = Tier 최고)
+        """
+        with self._lock:
+            tier_columns = self._sorted.get(tier) or {}
+            sample_size = len(tier_columns.get("blc_score") or [])
+            scores: Dict[str, Dict[str, Any]] = {}
+            for name in SCORE_FIELDS:
+                column = tier_columns.get(name) or []
+                value = values.get(name)
+                if not column or value is None:
+                    continue
+                below = bisect_left(column, value)
+                below_or_equal = bisect_right(column, value)
+                scores[name] = {
+                    "percentile": round((below + (below_or_equal - below) / 2) / len(column) * 100, 1),
+                    "rank": len(column) - below_or_equal + 1,
+                }
+        return {"tier": tier, "sample_size": sample_size, "scores": scores}
+
+    def lookup_report(self, db: Session, report: ReportCreator) -> Optional[Dict[str, Any]]:
+        """리포트의 Tier 내 백분위 (점수/Tier 가 없으면 None)"""
+        values = _score_values(report)
+        if values is None or not report.blc_tier:
+            return None
+        self.ensure_loaded(db)
+        return self.lookup(report.blc_tier, values)
+
+
+# 프로세스 공용 인덱스
+creator_percentile_index = TierPercentileIndex()
@@ -8,10 +8,32 @@ from openai import OpenAI
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
 
+from core.config import (
+    YOUTUBE_CACHE_PATH,
+    YOUTUBE_COMMENT_BUDGET,
+    YOUTUBE_COMMENT_SAMPLING,
+    YOUTUBE_COMMENT_WORKERS,
+    YOUTUBE_DAILY_QUOTA,
+    YOUTUBE_STREAMING,
+    YOUTUBE_VIDEO_LISTING,
+)
 from models.request import Request
 from models.report_creator import ReportCreator
+from services.channel_resolver import resolve_channel_id
+from services.channel_prefetch_service import wait_for_prefetch
+from services.creator_percentile_index import creator_percentile_index
+from services.channel_snapshot_service import collect_channel_data, load_fresh_snapshot_data
+from services.youtube_api_cache import YouTubeResponseCache
+from services.youtube_api_keys import get_shared_key_pool
+from services.youtube_comment_sampler import AdaptiveCommentSampler
 from services.youtube_data_collector import YouTubeDataCollector
+from services.youtube_quota_service import (
+    get_remaining_units,
+    plan_collection_depth,
+    record_collection_run,
+)
 from services.youtube_metrics_calculator_v2 import MetricsCalculator
+from services.tier_benchmark_service import get_tier_benchmarks
 ##----------------------------근서 코드 넣기---------------------------------------------
 
 # -----------------------------------------
@@ -240,19 +262,203 @@ YouTube 채널 '{metrics.get('channel_name', 'N/A')}'의 리스크를 분석하
     result = _call_openai_simple(prompts[section_name])
     return result if result else f"[{section_name} 생성 실패]"
 
+def _load_youtube_api_keys() -> list[str]:
+    """YOUTUBE_API_KEYS (쉼표 구분) 우선, 없으면 YOUTUBE_API_KEY 1개"""
+    keys = [k.strip() for k in os.getenv("YOUTUBE_API_KEYS", "").split(",") if k.strip()]
+    if not keys and os.getenv("YOUTUBE_API_KEY"):
+        keys = [os.getenv("YOUTUBE_API_KEY")]
+    return keys
+
+def _build_collector(youtube_api_key) -> YouTubeDataCollector:
+    """
+    설정에 따라 YouTubeDataCollector 구성
+    - youtube_api_key: 키 1개 또는 YouTubeApiKeyPool (키별 quota 소진 시 자동 교체)
+    - YOUTUBE_COMMENT_SAMPLING=1 이면 댓글 적응형 샘플링(조기 종료) 사용
+    - YOUTUBE_COMMENT_BUDGET 이 있으면 채널 전체 댓글 예산을 조회수/댓글 수 가중치로 배분
+    """
+    comment_sampler = None
+    if YOUTUBE_COMMENT_SAMPLING:
+        comment_sampler = AdaptiveCommentSampler(classify=MetricsCalculator.classify_comment)
+    return YouTubeDataCollector(
+        youtube_api_key,
+        comment_workers=YOUTUBE_COMMENT_WORKERS,
+        video_listing=YOUTUBE_VIDEO_LISTING,
+        cache=YouTubeResponseCache(YOUTUBE_CACHE_PATH) if YOUTUBE_CACHE_PATH else None,
+        comment_sampler=comment_sampler,
+        comment_budget=YOUTUBE_COMMENT_BUDGET or None,
+    )
+
+def _plan_depth(collector: YouTubeDataCollector, db: Session) -> tuple[int, int, bool]:
+    """남은 일일 quota 에 맞춘 수집 깊이 (max_videos, max_comments, degraded)"""
+    # 일일 한도는 키 1개 기준이므로 키 풀 전체로 환산
+    daily_limit = YOUTUBE_DAILY_QUOTA * len(collector.key_pool)
+    remaining = get_remaining_units(db, daily_limit)
+    return plan_collection_depth(remaining, daily_limit, collector.video_listing)
+
+
+def _resolve_and_collect(
+    collector: YouTubeDataCollector,
+    channel_query: str,
+    analysis_period_months: int,
+    db: Optional[Session] = None,
+    request_id: Optional[int] = None,
+    streaming: Optional[bool] = None,
+    depth: Optional[tuple[int, int, bool]] = None,
+) -> tuple[str, Dict[str, Any], Dict[str, Any]]:
+    """
+    채널 ID 확인 + YouTube 데이터 수집
+    - db 가 있으면 남은 일일 quota 에 맞춰 수집 깊이를 정하고, 실행 비용을 원장에 기록
+    - streaming: None 이면 YOUTUBE_STREAMING 설정을 따름 (미리 수집은 스냅샷을 남겨야 하므로 False)
+    - depth: 호출 쪽에서 이미 정한 수집 깊이 (None 이면 여기서 계산)
+    - 반환: (channel_id, raw_data, collection_info)
+    """
+    if streaming is None:
+        streaming = YOUTUBE_STREAMING
+    max_videos, max_comments, degraded = 100, 100, False
+    if depth is not None:
+        max_videos, max_comments, degraded = depth
+    elif db is not None:
+        max_videos, max_comments, degraded = _plan_depth(collector, db)
+
+    channel_id: Optional[str] = None
+    status = "failed"
+    try:
+        # STEP 1: 채널 ID 확인 (URL/UC ID 는 로컬 해석, 핸들은 해석 캐시 우선)
+        print("  [Pipeline] 채널 ID 확인...")
+        if db is not None:
+            channel_id = resolve_channel_id(db, collector, channel_query)
+        else:
+            channel_id = collector.get_channel_id_from_username(channel_query)
+
+        if not channel_id:
+            raise RuntimeError(f"채널 ID를 찾을 수 없습니다: {channel_query}")
+
+        print(f"  ✅ 채널 ID: {channel_id}")
+
+        # STEP 2: YouTube 데이터 수집
+        print("\n[STEP 2/4] 📊 YouTube 데이터 수집 중...")
+        fresh_data = None
+        if db is not None and streaming:
+            # 접수 시 미리 수집한 스냅샷이 있으면 스트리밍 수집도 생략
+            fresh_data = load_fresh_snapshot_data(db, channel_id, analysis_period_months)
+        if fresh_data is not None:
+            raw_data = fresh_data
+        elif streaming:
+            # 스트리밍: 영상별 댓글이 도착하는 대로 분석하고 원문은 버린다 (스냅샷 저장 없음)
+            raw_data = collector.stream_full_data(
+                channel_id=channel_id,
+                max_videos=max_videos,
+                months_back=analysis_period_months,
+                max_comments=max_comments,
+            )
+            if raw_data:
+                raw_data["videos"] = MetricsCalculator.analyze_video_stream(raw_data["videos"])
+        elif db is not None:
+            # 채널 스냅샷이 있으면 증분 수집
+            raw_data = collect_channel_data(
+                db,
+                collector,
+                channel_id=channel_id,
+                max_videos=max_videos,
+                months_back=analysis_period_months,
+                max_comments=max_comments,
+                degraded=degraded,
+            )
+        else:
+            raw_data = collector.collect_full_data(
+                channel_id=channel_id,
+                max_videos=max_videos,
+                months_back=analysis_period_months,
+                max_comments=max_comments,
+            )
+        if not raw_data or not raw_data.get("channel"):
+            raise RuntimeError(f"YouTube 데이터 수집 실패: {channel_id}")
+        status = "success"
+    finally:
+        if db is not None:
+            record_collection_run(
+                db,
+                collector,
+                channel_id=channel_id,
+                request_id=request_id,
+                max_videos=max_videos,
+                max_comments=max_comments,
+                degraded=degraded,
+                status=status,
+            )
+
+    collection_info = {
+        "max_videos": max_videos,
+        "max_comments": max_comments,
+        "degraded": degraded,
+        "quota_units": collector.quota_units_used(),
+        "units_by_key": collector.usage_summary()["units_by_key"],
+    }
+    return channel_id, raw_data, collection_info
+
+def prefetch_channel_data_for_request(db: Session, request_id: int) -> Optional[str]:
+    """
+    의뢰 접수 직후 백그라운드에서 실행 (services/channel_prefetch_service)
+    - 채널 ID 확인 + 스냅샷 수집/저장까지만 수행 (지표 계산/LLM 은 분석 시작 시)
+    - 분석 시작 시 build_creator_report_for_request 는 이 스냅샷을 API 호출 없이 재사용
+    - 남은 quota 로는 축소 수집밖에 못 하면 생략
+    - 반환: channel_id (YouTube 의뢰가 아니거나 생략했으면 None)
+    """
+    req: Optional[Request] = (
+        db.query(Request)
+        .filter(Request.request_id == request_id)
+        .first()
+    )
+    if not req or req.platform != "youtube" or not req.channel_name:
+        return None
+
+    youtube_api_keys = _load_youtube_api_keys()
+    if not youtube_api_keys:
+        return None
+
+    collector = _build_collector(get_shared_key_pool(youtube_api_keys))
+    try:
+        depth = _plan_depth(collector, db)
+        if depth[2]:
+            # quota 가 부족해 축소 수집이 되는 경우 미리 수집하지 않음
+            # (축소 스냅샷이 최근 스냅샷으로 재사용되지 않도록, 분석 시작 시 그때 남은 quota 로 수집)
+            print(f"  [Prefetch] ⏭️ request_id={request_id} quota 부족으로 축소 수집 예정 -> 미리 수집 생략")
+            return None
+
+        channel_id, raw_data, collection_info = _resolve_and_collect(
+            collector,
+            channel_query=req.channel_name,
+            analysis_period_months=6,
+            db=db,
+            request_id=request_id,
+            streaming=False,
+            depth=depth,
+        )
+    finally:
+        collector.close()
+    print(
+        f"  [Prefetch] ✅ request_id={request_id} 채널 {channel_id} "
+        f"영상 {len(raw_data['videos'])}개 ({collection_info['quota_units']} units)"
+    )
+    return channel_id
+
 def _run_creator_pipeline_core(
     channel_query: str,
     brand_concept: str,
     analysis_period_months: int = 6,
+    db: Optional[Session] = None,
+    request_id: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     노트북 run_full_pipeline() 의 핵심 로직.
     - YouTubeDataCollector + MetricsCalculator 사용
     - 파일 저장 없이 metrics/섹션 텍스트/매칭 정보만 반환
+    - db 가 주어지면 핸들 -> 채널 ID 해석 결과를 channel_resolution 테이블에 캐시하고,
+      channel_snapshot 기준 증분 수집 및 quota 원장을 사용
     """
-    youtube_api_key = os.getenv("YOUTUBE_API_KEY")
-    if not youtube_api_key:
-        raise RuntimeError("YOUTUBE_API_KEY 가 설정되어 있지 않습니다.")
+    youtube_api_keys = _load_youtube_api_keys()
+    if not youtube_api_keys:
+        raise RuntimeError("YOUTUBE_API_KEY(S) 가 설정되어 있지 않습니다.")
 
     print("\n" + "=" * 80)
     print("🚀 YouTube Creator Analysis V2.1 - Tier 기반 상대평가")
@@ -260,28 +466,20 @@ def _run_creator_pipeline_core(
     print(f"채널 쿼리: {channel_query}")
     print(f"분석 기간: 최근 {analysis_period_months}개월\n")
 
-    collector = YouTubeDataCollector(youtube_api_key)
-
-    # STEP 1: 채널 ID 확인
-    channel_id = channel_query
-    if not channel_query.startswith("UC"):
-        print("  [Pipeline] 채널 ID 검색 시도...")
-        channel_id = collector.get_channel_id_from_username(channel_query)
-
-    if not channel_id:
-        raise RuntimeError(f"채널 ID를 찾을 수 없습니다: {channel_query}")
+    collector = _build_collector(get_shared_key_pool(youtube_api_keys))
 
-    print(f"  ✅ 채널 ID: {channel_id}")
-
-    # STEP 2: YouTube 데이터 수집
-    print("\n[STEP 2/4] 📊 YouTube 데이터 수집 중...")
-    raw_data = collector.collect_full_data(
-        channel_id=channel_id,
-        max_videos=100,
-        months_back=analysis_period_months,
-    )
-    if not raw_data or not raw_data.get("channel"):
-        raise RuntimeError(f"YouTube 데이터 수집 실패: {channel_id}")
+    # STEP 1~2: 채널 ID 확인 + YouTube 데이터 수집
+    try:
+        channel_id, raw_data, collection_info = _resolve_and_collect(
+            collector,
+            channel_query=channel_query,
+            analysis_period_months=analysis_period_months,
+            db=db,
+            request_id=request_id,
+        )
+    finally:
+        # 요청마다 여는 응답 캐시 연결을 닫는다 (장시간 실행 worker 의 파일 핸들 누수 방지)
+        collector.close()
 
     print(f"  ✅ 채널: {raw_data['channel']['channel_name']}")
     print(f"  ✅ 영상: {len(raw_data['videos'])}개")
@@ -291,7 +489,10 @@ def _run_creator_pipeline_core(
 
     # STEP 3: 지표 계산
     print("\n[STEP 3/4] 📈 지표 계산 중... (V2.1: Format Score 수정)")
-    calculator = MetricsCalculator(raw_data)
+    calculator = MetricsCalculator(
+        raw_data,
+        benchmarks=get_tier_benchmarks(db) if db is not None else None,
+    )
     metrics = calculator.generate_summary_report()
     if not metrics or "blc_score" not in metrics:
         raise RuntimeError("지표 계산 실패")
@@ -320,28 +521,12 @@ def _run_creator_pipeline_core(
         sections[key] = text
 
     # BLC 매칭 섹션 텍스트
-    blc_matching = metrics.get("blc_matching", {}) or {}
-    blc_bd = metrics.get("blc_breakdown", {}) or {}
-    blc_matching_section = f"""
-**채널 Tier:** {metrics.get('tier', 'N/A')}
-
-**적합 카테고리:** {blc_matching.get('category', 'N/A')}
-
-**적합 이미지:** {blc_matching.get('image', 'N/A')}
-
-**적합 스킨케어:** {blc_matching.get('skincare', 'N/A')}
-
-**적합 제품 유형:** {blc_matching.get('product_type', 'N/A')}
-
----
-**알고리즘 근거 (Tier 대비 상대 점수, 100점 만점):**
-- Engagement: {blc_bd.get('engagement_score', 0):.1f}/100
-- Views: {blc_bd.get('views_score', 0):.1f}/100
-- Demand: {blc_bd.get('demand_score', 0):.1f}/100 (구매/사용 인증 댓글)
-- Problem: {blc_bd.get('problem_score', 0):.1f}/100 (고민 해결 수요)
-
-**등급:** {metrics.get('verdict', 'N/A')}
-""".strip()
+    blc_matching_section = _build_blc_matching_section(
+        metrics.get("tier", "N/A"),
+        metrics.get("blc_matching", {}) or {},
+        metrics.get("blc_breakdown", {}) or {},
+        metrics.get("verdict", "N/A"),
+    )
 
     # 전체 리포트 마크다운 (필요하면 나중에 사용)
     full_report_md = f"""
@@ -372,12 +557,60 @@ def _run_creator_pipeline_core(
 
     return {
         "channel_id": channel_id,
+        "collection": collection_info,
         "metrics": metrics,
         "sections": sections,
         "blc_matching_section": blc_matching_section,
         "full_report_md": full_report_md,
     }
 
+def _build_blc_matching_section(
+    tier: str,
+    blc_matching: Dict[str, Any],
+    blc_bd: Dict[str, Any],
+    verdict: str,
+) -> str:
+    """BLC 매칭 섹션 마크다운 (리포트 생성 / 재채점 새 버전 공용)"""
+    return f"""
+**채널 Tier:** {tier or 'N/A'}
+
+**적합 카테고리:** {blc_matching.get('category', 'N/A')}
+
+**적합 이미지:** {blc_matching.get('image', 'N/A')}
+
+**적합 스킨케어:** {blc_matching.get('skincare', 'N/A')}
+
+**적합 제품 유형:** {blc_matching.get('product_type', 'N/A')}
+
+---
+**알고리즘 근거 (Tier 대비 상대 점수, 100점 만점):**
+- Engagement: {blc_bd.get('engagement_score', 0):.1f}/100
+- Views: {blc_bd.get('views_score', 0):.1f}/100
+- Demand: {blc_bd.get('demand_score', 0):.1f}/100 (구매/사용 인증 댓글)
+- Problem: {blc_bd.get('problem_score', 0):.1f}/100 (고민 해결 수요)
+
+**등급:** {verdict or 'N/A'}
+""".strip()
+
+
+def _remove_markdown(text: str) -> str:
+    """마크다운 문법(###, ####, ** 등)을 제거합니다."""
+    if not text:
+        return ""
+    # ###, ####, ## 등 헤더 제거
+    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    # **볼드** 제거
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
+    # *이탤릭* 제거
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)
+    # `코드` 제거
+    text = re.sub(r'`([^`]+)`', r'\1', text)
+    # ---, --- 등 구분선 제거
+    text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
+    # []() 링크 제거 (링크 텍스트만 남김)
+    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    return text.strip()
+
 def _parse_verdict(verdict: str) -> tuple[str, str]:
     """
     예시:
@@ -417,6 +650,9 @@ def build_creator_report_for_request(
 
     brand_concept = req.brand_concept or "미제공"
 
+    # 접수 시 시작된 채널 데이터 미리 수집이 진행 중이면 끝날 때까지 대기 (중복 수집 방지)
+    wait_for_prefetch(request_id)
+
     # 이미 존재하는 report_creator 개수 → version 결정
     existing_count = (
         db.query(ReportCreator)
@@ -430,6 +666,8 @@ def build_creator_report_for_request(
         channel_query=channel_query,
         brand_concept=brand_concept,
         analysis_period_months=6,
+        db=db,
+        request_id=request_id,
     )
 
     metrics = pipeline_result["metrics"]
@@ -461,48 +699,30 @@ def build_creator_report_for_request(
         "upload_consistency": metrics.get("upload_consistency", {}),
         "format_effects": metrics.get("format_effects", {}),
         "raw_values": raw_values,
+        "score_inputs": metrics.get("score_inputs", {}),
+        "collection": pipeline_result.get("collection", {}),
     }
 
-    # 마크다운 문법 제거 함수
-    def remove_markdown(text: str) -> str:
-        """마크다운 문법(###, ####, ** 등)을 제거합니다."""
-        if not text:
-            return ""
-        import re
-        # ###, ####, ## 등 헤더 제거
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
-        # **볼드** 제거
-        text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-        # *이탤릭* 제거
-        text = re.sub(r'\*([^*]+)\*', r'\1', text)
-        # `코드` 제거
-        text = re.sub(r'`([^`]+)`', r'\1', text)
-        # ---, --- 등 구분선 제거
-        text = re.sub(r'^---+$', '', text, flags=re.MULTILINE)
-        # []() 링크 제거 (링크 텍스트만 남김)
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
-        return text.strip()
-
     # 섹션 JSON은 단순 구조로 (필요하면 title 필드 나중에 추가)
     executive_summary_json = {
         "key": "executive_summary",
         "title": "한 장 요약",
-        "content_md": remove_markdown(sections.get("executive_summary", "")),
+        "content_md": _remove_markdown(sections.get("executive_summary", "")),
     }
     deep_analysis_json = {
         "key": "deep_analysis",
         "title": "심층 분석",
-        "content_md": remove_markdown(sections.get("deep_analysis", "")),
+        "content_md": _remove_markdown(sections.get("deep_analysis", "")),
     }
     risk_mitigation_json = {
         "key": "risk_mitigation",
         "title": "리스크 & 대응",
-        "content_md": remove_markdown(sections.get("risk_mitigation", "")),
+        "content_md": _remove_markdown(sections.get("risk_mitigation", "")),
     }
     blc_matching_json = {
         "key": "blc_matching",
         "title": "BLC 매칭",
-        "content_md": remove_markdown(blc_matching_section),
+        "content_md": _remove_markdown(blc_matching_section),
         "matching": blc_matching,
     }
 
@@ -541,6 +761,9 @@ def build_creator_report_for_request(
     db.add(rc)
     db.commit()
     db.refresh(rc)
+
+    # Tier 백분위 인덱스에 새 버전 반영
+    creator_percentile_index.add_report(rc)
     return rc
 
 
@@ -0,0 +1,264 @@
+# services/creator_rescore_service.py
+"""
+저장된 크리에이터 리포트 BLC 재채점 (YouTube/LLM 재실행 없음)
+- report_creator.meta_json 의 score_inputs (리포트 생성 시 저장한 원본 입력) 로
+  구성 점수, blc_score, 등급, Tier, 매칭을 현재 MetricsCalculator 기준 + 현재 Tier 벤치마크로 다시 계산
+- score_inputs 가 없는 이전 리포트는 raw_values / format_effects / upload_consistency 사용
+  (raw_values 는 표시용 반올림 값이라 첫 재채점 때 기준이 같아도 소수점 차이로 새 버전이 생길 수 있음)
+- 의뢰별 최신 버전만 대상, 결과가 달라진 리포트만 새 버전으로 저장 (기존 버전은 그대로)
+- 새 버전의 BLC 매칭 섹션 본문은 새 점수로 다시 만들고, LLM 섹션은 이전 점수 기준이라는 안내를 붙여 복사
+- 채점 기준(BENCHMARKS, 가중치, 임계값) 변경 배포 후 전체 재채점용: 점수 계산은 blc_batch_scorer 로 한 번에
+
+사용 예)
+  rescore_creator_reports(db)                      # 전체
+  rescore_creator_reports(db, request_ids=[12])    # 특정 의뢰
+  rescore_creator_reports(db, dry_run=True)        # 저장 없이 변경 예정만 확인
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models.report_creator import ReportCreator
+from services.blc_batch_scorer import COMPONENTS, blc_records, score_blc_batch
+from services.creator_percentile_index import creator_percentile_index
+from services.creator_report_service import _build_blc_matching_section, _parse_verdict, _remove_markdown
+from services.tier_benchmark_service import get_tier_benchmarks
+
+# meta_json['score_inputs'] / ['raw_values'] 에 있어야 재채점 가능한 항목
+RAW_VALUE_FIELDS = [
+    "engagement_median",
+    "views_per_day_median",
+    "demand_index_median",
+    "problem_rate_median",
+]
+
+# 저장 컬럼 Numeric(.., 2) -> 이보다 작은 차이는 같은 점수로 본다
+SCORE_TOLERANCE = 0.005
+
+# 재채점 후에도 그대로 복사하는 LLM 섹션 (본문에 이전 점수/등급이 들어 있을 수 있음)
+LLM_SECTION_FIELDS = ["executive_summary_json", "deep_analysis_json", "risk_mitigation_json"]
+
+
+def _latest_reports(db: Session, request_ids: Optional[Sequence[int]] = None) -> List[ReportCreator]:
+    """의뢰별 최신 버전 리포트"""
+    latest = db.query(
+        ReportCreator.request_id.label("request_id"),
+        func.max(ReportCreator.version).label("version"),
+    )
+    if request_ids is not None:
+        latest = latest.filter(ReportCreator.request_id.in_(list(request_ids)))
+    latest = latest.group_by(ReportCreator.request_id).subquery()
+
+    return (
+        db.query(ReportCreator)
+        .join(
+            latest,
+            (ReportCreator.request_id == latest.c.request_id)
+            & (ReportCreator.version == latest.c.version),
+        )
+        .order_by(ReportCreator.request_id)
+        .all()
+    )
+
+
+def _subscriber_count(report: ReportCreator) -> Optional[int]:
+    if report.subscriber_count is not None:
+        return int(report.subscriber_count)
+    value = (report.meta_json or {}).get("subscriber_count")
+    try:
+        return int(str(value).replace(",", "")) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _score_inputs(report: ReportCreator) -> Optional[Dict[str, float]]:
+    """meta_json -> score_blc_batch 입력 1행 (raw 값이 없으면 None)"""
+    meta = report.meta_json or {}
+    score_inputs = meta.get("score_inputs") or {}
+    if score_inputs and all(score_inputs.get(name) is not None for name in RAW_VALUE_FIELDS):
+        improvement = score_inputs.get("format_improvement_pct")
+        return {
+            "subscriber_count": float(score_inputs.get("subscriber_count") or _subscriber_count(report) or 0),
+            **{name: float(score_inputs[name]) for name in RAW_VALUE_FIELDS},
+            "videos_per_week": float(score_inputs.get("videos_per_week") or 0),
+            "format_improvement_pct": np.nan if improvement is None else float(improvement),
+        }
+
+    # 이전 리포트: 표시용 raw_values 로 계산
+    raw_values = meta.get("raw_values") or {}
+    subscribers = _subscriber_count(report)
+    if subscribers is None or any(raw_values.get(name) is None for name in RAW_VALUE_FIELDS):
+        return None
+
+    videos_per_week = raw_values.get("videos_per_week")
+    if videos_per_week is None:
+        videos_per_week = (meta.get("upload_consistency") or {}).get("videos_per_week", 0)
+
+    format_data = (meta.get("format_effects") or {}).get("format") or {}
+    improvement = format_data.get("improvement_pct")
+
+    return {
+        "subscriber_count": float(subscribers),
+        **{name: float(raw_values[name]) for name in RAW_VALUE_FIELDS},
+        "videos_per_week": float(videos_per_week or 0),
+        "format_improvement_pct": np.nan if improvement is None else float(improvement),
+    }
+
+
+def _stored_score(value) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+def _is_changed(report: ReportCreator, record: Dict[str, Any], grade: str) -> bool:
+    stored = [_stored_score(report.blc_score)] + [
+        _stored_score(getattr(report, name)) for name in COMPONENTS
+    ]
+    computed = [record["blc_score"]] + [record["components"][name] for name in COMPONENTS]
+    if any(old is None or abs(old - new) > SCORE_TOLERANCE for old, new in zip(stored, computed)):
+        return True
+    stored_matching = (report.blc_matching_json or {}).get("matching") or {}
+    return (
+        report.blc_grade != grade
+        or report.blc_tier != record["tier"]
+        or stored_matching != record["blc_matching"]
+    )
+
+
+def _flag_stale_section(section: Optional[Dict[str, Any]], version: int) -> Optional[Dict[str, Any]]:
+    """
+    LLM 섹션 복사본에 '이전 점수 기준' 표시
+    - scores_from_version: 본문이 작성된 버전 (여러 번 재채점해도 처음 값 유지, 안내 문구도 1번만)
+    - 본문이 없는 섹션은 그대로
+    """
+    if not isinstance(section, dict) or not section.get("content_md") or section.get("scores_from_version") is not None:
+        return section
+    notice = f"※ 이 섹션은 v{version} 리포트의 점수 기준으로 작성되었습니다. 현재 점수·등급·매칭은 BLC 매칭 섹션을 참고하세요."
+    return {
+        **section,
+        "content_md": f"{notice}\n\n{section['content_md']}",
+        "scores_from_version": version,
+    }
+
+
+def _new_version(report: ReportCreator, record: Dict[str, Any], grade: str, grade_label: str) -> ReportCreator:
+    """
+    기존 리포트 복사 + 재채점 결과 반영
+    - BLC 매칭 섹션 본문은 새 점수로 다시 생성
+    - LLM 섹션 본문은 그대로 두고 이전 점수 기준이라는 안내만 붙인다
+    """
+    meta_json = {
+        **(report.meta_json or {}),
+        "tier": record["tier"],
+        "verdict": record["verdict"],
+        "rescored_from_version": report.version,
+    }
+    blc_matching_json = {
+        **(report.blc_matching_json or {}),
+        "content_md": _remove_markdown(_build_blc_matching_section(
+            record["tier"], record["blc_matching"], record["components"], record["verdict"],
+        )),
+        "matching": record["blc_matching"],
+    }
+    llm_sections = {
+        name: _flag_stale_section(getattr(report, name), report.version)
+        for name in LLM_SECTION_FIELDS
+    }
+
+    return ReportCreator(
+        request_id=report.request_id,
+        latest_run_id=report.latest_run_id,
+        version=report.version + 1,
+        title=report.title,
+        platform=report.platform,
+        channel_url=report.channel_url,
+        channel_handle=report.channel_handle,
+        channel_external_id=report.channel_external_id,
+
+        blc_score=record["blc_score"],
+        blc_grade=grade,
+        blc_grade_label=grade_label,
+        blc_tier=record["tier"],
+        subscriber_count=report.subscriber_count,
+        **{name: record["components"][name] for name in COMPONENTS},
+
+        meta_json=meta_json,
+        blc_matching_json=blc_matching_json,
+        **llm_sections,
+    )
+
+
+def rescore_creator_reports(
+    db: Session,
+    request_ids: Optional[Sequence[int]] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """
+    저장된 raw 값으로 BLC 재채점
+    - request_ids: None 이면 전체 의뢰
+    - dry_run: True 면 저장하지 않고 변경 예정 목록만 반환
+    - 반환: {'checked', 'changed', 'skipped', 'dry_run', 'items': [변경된 리포트 요약]}
+    """
+    reports = _latest_reports(db, request_ids)
+
+    scorable: List[ReportCreator] = []
+    rows: List[Dict[str, float]] = []
+    for report in reports:
+        inputs = _score_inputs(report)
+        if inputs is not None:
+            scorable.append(report)
+            rows.append(inputs)
+
+    items: List[Dict[str, Any]] = []
+    new_reports: List[ReportCreator] = []
+    index_updates = []
+    if rows:
+        columns = {name: np.array([row[name] for row in rows]) for name in rows[0]}
+        records = blc_records(score_blc_batch(**columns, benchmarks=get_tier_benchmarks(db)))
+
+        for report, record in zip(scorable, records):
+            grade, grade_label = _parse_verdict(record["verdict"])
+            if not _is_changed(report, record, grade):
+                continue
+            items.append({
+                "request_id": report.request_id,
+                "report_creator_id": report.report_creator_id,
+                "from_version": report.version,
+                "to_version": report.version + 1,
+                "blc_score_before": _stored_score(report.blc_score),
+                "blc_score_after": record["blc_score"],
+                "grade_before": report.blc_grade,
+                "grade_after": grade,
+            })
+            if not dry_run:
+                new_reports.append(_new_version(report, record, grade, grade_label))
+                index_updates.append((
+                    report.request_id,
+                    report.version + 1,
+                    record["tier"],
+                    {"blc_score": record["blc_score"], **record["components"]},
+                ))
+
+    if new_reports:
+        db.add_all(new_reports)
+        db.commit()
+        # commit 후 ORM 객체를 다시 읽지 않도록 계산한 값으로 Tier 백분위 인덱스 반영
+        for update in index_updates:
+            creator_percentile_index.add(*update)
+
+    skipped = len(reports) - len(scorable)
+    print(
+        f"  [Rescore] ✅ 리포트 {len(reports)}개 확인, 변경 {len(items)}개"
+        f"{' (dry-run, 저장 안 함)' if dry_run else ''}, raw 값 없음 {skipped}개"
+    )
+    return {
+        "checked": len(reports),
+        "changed": len(items),
+        "skipped": skipped,
+        "dry_run": dry_run,
+        "items": items,
+    }
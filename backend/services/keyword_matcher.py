@@ -0,0 +1,109 @@
+# services/keyword_matcher.py
+"""
+댓글 키워드 매칭 엔진 (Aho-Corasick)
+- 카테고리별 키워드 목록으로 automaton 을 1번만 만든다 (예: demand / problem)
+- 댓글 1개를 한 번 훑어서 카테고리별 적중 여부 + 적중 키워드를 함께 얻는다
+- 대소문자 구분 없음 (기존 re.IGNORECASE 정규식과 같은 결과)
+- 적중 여부만 필요하면 모든 카테고리가 적중하는 순간 훑기를 멈춘다
+- 댓글이 많으면 flag_matrix 로 전체를 이어 붙여 한 번만 훑고, 적중 위치로 댓글을 찾는다
+
+사용 예)
+  matcher = KeywordMatcher({"demand": ["샀어요", "추천"], "problem": ["여드름"]})
+  matcher.flags("여드름 때문에 샀어요")   # (True, True)
+  matcher.scan("여드름 때문에 샀어요")    # ((True, True), {"demand": ["샀어요"], "problem": ["여드름"]})
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import ahocorasick  # pip install pyahocorasick
+import numpy as np
+
+
+class KeywordMatcher:
+    """
+    카테고리별 키워드 Aho-Corasick matcher
+    - categories: {카테고리 이름: 키워드 목록} (순서대로 flags 튜플의 위치가 된다)
+    - 같은 키워드가 여러 카테고리에 있으면 모든 카테고리에 적중
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories = list(categories)
+        self._automaton = ahocorasick.Automaton()
+        keyword_bits: Dict[str, int] = {}
+        for bit, name in enumerate(self.categories):
+            for keyword in categories[name]:
+                key = keyword.lower()
+                if not key:
+                    continue
+                keyword_bits[key] = keyword_bits.get(key, 0) | (1 << bit)
+        for key, mask in keyword_bits.items():
+            self._automaton.add_word(key, (mask, key))
+        self._automaton.make_automaton()
+        self.keyword_count = len(keyword_bits)
+        self._full_mask = (1 << len(self.categories)) - 1
+        # mask -> flags 튜플 (댓글마다 튜플을 새로 만들지 않도록)
+        self._flags_table = [
+            tuple(bool(mask >> bit & 1) for bit in range(len(self.categories)))
+            for mask in range(self._full_mask + 1)
+        ]
+
+    def mask(self, text: str) -> int:
+        """적중한 카테고리 bit mask (첫 카테고리 = 1)"""
+        if not isinstance(text, str) or not text or self.keyword_count == 0:
+            return 0
+        mask = 0
+        for _, (bits, _) in self._automaton.iter(text.lower()):
+            mask |= bits
+            if mask == self._full_mask:
+                break
+        return mask
+
+    def flags(self, text: str) -> Tuple[bool, ...]:
+        """카테고리별 적중 여부 (categories 순서)"""
+        return self._flags_table[self.mask(text)]
+
+    def scan(self, text: str) -> Tuple[Tuple[bool, ...], Dict[str, List[str]]]:
+        """한 번 훑어서 (카테고리별 적중 여부, {카테고리: 적중 키워드 목록(중복 제거, 등장 순)})"""
+        matched: Dict[str, List[str]] = {name: [] for name in self.categories}
+        mask = 0
+        if isinstance(text, str) and text and self.keyword_count:
+            for _, (bits, keyword) in self._automaton.iter(text.lower()):
+                mask |= bits
+                for bit, name in enumerate(self.categories):
+                    if bits >> bit & 1 and keyword not in matched[name]:
+                        matched[name].append(keyword)
+        return self._flags_table[mask], matched
+
+    def flags_many(self, texts: Sequence[str]) -> List[Tuple[bool, ...]]:
+        """댓글 목록 전체의 카테고리별 적중 여부 (문자열이 아닌 항목은 적중 없음)"""
+        table = self._flags_table
+        mask = self.mask
+        return [table[mask(text)] for text in texts]
+
+    def flag_matrix(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        flags_many 와 같은 결과를 (댓글 수, 카테고리 수) bool 행렬로
+        - 댓글을 구분자(NUL, 키워드에 없는 문자)로 이어 붙여 automaton 을 한 번만 훑는다
+        - 적중 끝 위치를 댓글 시작 위치에 searchsorted 해서 댓글 번호를 찾고 bit mask 를 OR
+        """
+        pieces = [text if isinstance(text, str) else '' for text in texts]
+        matrix_shape = (len(pieces), len(self.categories))
+        if not pieces or self.keyword_count == 0:
+            return np.zeros(matrix_shape, dtype=bool)
+        
+        joined = '\x00'.join(pieces).lower()
+        lengths = np.fromiter(map(len, pieces), dtype=np.int64, count=len(pieces))
+        if len(joined) != int(lengths.sum()) + len(pieces) - 1:
+            # 소문자로 바꾸면 길이가 달라지는 문자(예: 'İ')가 있으면 소문자 기준 길이로 다시 계산
+            lengths = np.fromiter((len(piece.lower()) for piece in pieces), dtype=np.int64, count=len(pieces))
+        starts = np.concatenate(([0], np.cumsum(lengths[:-1] + 1)))
+        
+        hits = list(self._automaton.iter(joined))
+        masks = np.zeros(len(pieces), dtype=np.int64)
+        if hits:
+            ends = np.fromiter((end for end, _ in hits), dtype=np.int64, count=len(hits))
+            bits = np.fromiter((value[0] for _, value in hits), dtype=np.int64, count=len(hits))
+            np.bitwise_or.at(masks, np.searchsorted(starts, ends, side='right') - 1, bits)
+        return (masks[:, None] >> np.arange(len(self.categories))) & 1 == 1
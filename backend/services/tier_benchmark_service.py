@@ -0,0 +1,237 @@
+# services/tier_benchmark_service.py
+"""
+Tier 벤치마크 보정 (report_creator 전체 분포 기준)
+- calibrate_tier_benchmarks(): 의뢰별 최신 리포트의 score_inputs(없으면 raw_values) 를 Tier 별로 모아
+  백분위 값을 계산해 tier_benchmark 테이블에 새 version 으로 저장
+    - PostgreSQL: percentile_cont 집계 쿼리 1번 (ORM 객체 로딩 없음)
+    - 그 외 DB: 값 컬럼만 한 번에 읽어 NumPy 로 계산 (같은 선형 보간)
+- get_tier_benchmarks(): 최신 version 을 MetricsCalculator.BENCHMARKS 위에 덮어쓴 dict (메모리 캐시)
+  표본 부족 Tier / 0 이하 값은 기본 BENCHMARKS 유지 (점수 계산 시 0 나누기 방지)
+
+사용 예)
+  version = calibrate_tier_benchmarks(db)
+  calculator = MetricsCalculator(raw_data, benchmarks=get_tier_benchmarks(db))
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import and_, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.config import (
+    TIER_BENCHMARK_CACHE_SECONDS,
+    TIER_BENCHMARK_MIN_SAMPLES,
+    TIER_BENCHMARK_PERCENTILE,
+)
+from models.report_creator import ReportCreator
+from models.tier_benchmark import TierBenchmark
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+logger = logging.getLogger(__name__)
+
+# score_inputs / raw_values 항목 -> BENCHMARKS 항목
+METRIC_FIELDS = {
+    "engagement_median": "engagement_per_1k",
+    "views_per_day_median": "views_per_day",
+    "demand_index_median": "demand_index",
+    "problem_rate_median": "problem_rate",
+    "videos_per_week": "videos_per_week_benchmark",
+}
+
+_cache_lock = threading.Lock()
+_cache: Dict[str, Any] = {"benchmarks": None, "version": None, "loaded_at": 0.0}
+
+
+def _metric_expr(name: str):
+    """meta_json 의 score_inputs.name (없으면 raw_values.name) 을 float 로"""
+    return func.coalesce(
+        ReportCreator.meta_json[("score_inputs", name)].as_float(),
+        ReportCreator.meta_json[("raw_values", name)].as_float(),
+    )
+
+
+def _latest_report_join(stmt):
+    """의뢰별 최신 버전 리포트만 (ix_report_creator_request_version 사용)"""
+    latest = (
+        select(
+            ReportCreator.request_id.label("request_id"),
+            func.max(ReportCreator.version).label("version"),
+        )
+        .group_by(ReportCreator.request_id)
+        .subquery()
+    )
+    return stmt.join(
+        latest,
+        and_(
+            ReportCreator.request_id == latest.c.request_id,
+            ReportCreator.version == latest.c.version,
+        ),
+    ).where(
+        ReportCreator.blc_tier.isnot(None),
+        _metric_expr("engagement_median").isnot(None),
+    )
+
+
+def _percentiles_sql(db: Session, percentile: float) -> Dict[str, Dict[str, float]]:
+    """PostgreSQL percentile_cont 집계 (Tier 당 1행)"""
+    fraction = percentile / 100.0
+    stmt = _latest_report_join(
+        select(
+            ReportCreator.blc_tier,
+            func.count().label("sample_size"),
+            *[
+                func.percentile_cont(fraction).within_group(_metric_expr(name)).label(name)
+                for name in METRIC_FIELDS
+            ],
+        ).select_from(ReportCreator)
+    ).group_by(ReportCreator.blc_tier)
+
+    return {
+        row.blc_tier: {
+            "sample_size": int(row.sample_size),
+            **{name: getattr(row, name) for name in METRIC_FIELDS},
+        }
+        for row in db.execute(stmt)
+    }
+
+
+def _percentiles_numpy(db: Session, percentile: float) -> Dict[str, Dict[str, float]]:
+    """percentile_cont 가 없는 DB: 값 컬럼만 읽어 Tier 별 nanpercentile (선형 보간)"""
+    stmt = _latest_report_join(
+        select(
+            ReportCreator.blc_tier,
+            *[_metric_expr(name).label(name) for name in METRIC_FIELDS],
+        ).select_from(ReportCreator)
+    )
+    rows = db.execute(stmt).all()
+    if not rows:
+        return {}
+
+    tiers = np.array([row[0] for row in rows], dtype=object)
+    values = np.array(
+        [[np.nan if v is None else v for v in row[1:]] for row in rows], dtype=float
+    )
+    result: Dict[str, Dict[str, float]] = {}
+    for tier in np.unique(tiers):
+        tier_values = values[tiers == tier]
+        with np.errstate(invalid="ignore"):
+            percentiles = np.nanpercentile(tier_values, percentile, axis=0)
+        result[str(tier)] = {
+            "sample_size": int(len(tier_values)),
+            **{
+                name: None if np.isnan(value) else float(value)
+                for name, value in zip(METRIC_FIELDS, percentiles)
+            },
+        }
+    return result
+
+
+def compute_tier_percentiles(
+    db: Session,
+    percentile: float = TIER_BENCHMARK_PERCENTILE,
+) -> Dict[str, Dict[str, float]]:
+    """{tier: {'sample_size', score_inputs 항목별 백분위 값}} (저장 없음)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return _percentiles_sql(db, percentile)
+    return _percentiles_numpy(db, percentile)
+
+
+def calibrate_tier_benchmarks(
+    db: Session,
+    percentile: float = TIER_BENCHMARK_PERCENTILE,
+    min_samples: int = TIER_BENCHMARK_MIN_SAMPLES,
+) -> Optional[int]:
+    """
+    Tier 벤치마크 새 version 저장 -> version (표본이 충분한 Tier 가 없으면 저장 안 하고 None)
+    - 값이 없거나 0 이하인 항목은 기본 BENCHMARKS 값으로 채움
+    """
+    percentiles = compute_tier_percentiles(db, percentile)
+    defaults = MetricsCalculator.BENCHMARKS
+
+    rows: List[TierBenchmark] = []
+    for tier, stats in percentiles.items():
+        if tier not in defaults:
+            continue
+        if stats["sample_size"] < min_samples:
+            print(f"  [TierBenchmark] ⚠️ {tier}: 표본 부족 ({stats['sample_size']} < {min_samples}), 기본값 유지")
+            continue
+        values = {
+            field: stats[name] if stats[name] is not None and stats[name] > 0 else defaults[tier][field]
+            for name, field in METRIC_FIELDS.items()
+        }
+        rows.append(TierBenchmark(tier=tier, percentile=percentile, sample_size=stats["sample_size"], **values))
+
+    if not rows:
+        print("  [TierBenchmark] ⚠️ 표본이 충분한 Tier 가 없어 저장하지 않음")
+        return None
+
+    version = (db.query(func.max(TierBenchmark.version)).scalar() or 0) + 1
+    for row in rows:
+        row.version = version
+        db.add(row)
+    db.commit()
+    invalidate_tier_benchmark_cache()
+
+    print(f"  [TierBenchmark] ✅ version {version} 저장 (p{percentile:g}, Tier {len(rows)}개)")
+    for row in rows:
+        print(
+            f"     - {row.tier} (n={row.sample_size}): Engagement {row.engagement_per_1k:.2f}, "
+            f"Views/day {row.views_per_day:.1f}, Demand {row.demand_index:.3f}, "
+            f"Problem {row.problem_rate:.4f}, Videos/week {row.videos_per_week_benchmark:.2f}"
+        )
+    return version
+
+
+def load_tier_benchmarks(db: Session) -> Tuple[Dict[str, Dict[str, float]], Optional[int]]:
+    """
+    최신 version 벤치마크를 기본 BENCHMARKS 위에 덮어쓴 dict, version (저장된 값이 없으면 기본값, None)
+    - 테이블이 없거나 조회 실패 시에도 기본값 (점수 계산은 멈추지 않음)
+    """
+    benchmarks = copy.deepcopy(MetricsCalculator.BENCHMARKS)
+    try:
+        version = db.query(func.max(TierBenchmark.version)).scalar()
+        rows = (
+            db.query(TierBenchmark).filter(TierBenchmark.version == version).all()
+            if version is not None
+            else []
+        )
+    except SQLAlchemyError as e:
+        db.rollback()
+        logger.warning("[TierBenchmark] 벤치마크 조회 실패, 기본값 사용: %s", e)
+        return benchmarks, None
+
+    for row in rows:
+        if row.tier not in benchmarks:
+            continue
+        for field in METRIC_FIELDS.values():
+            value = getattr(row, field)
+            if value is not None and value > 0:
+                benchmarks[row.tier][field] = float(value)
+    return benchmarks, version
+
+
+def get_tier_benchmarks(db: Session, max_age: float = TIER_BENCHMARK_CACHE_SECONDS) -> Dict[str, Dict[str, float]]:
+    """현재 Tier 벤치마크 (max_age 초 동안 메모리 캐시)"""
+    now = time.monotonic()
+    with _cache_lock:
+        if _cache["benchmarks"] is not None and now - _cache["loaded_at"] < max_age:
+            return _cache["benchmarks"]
+
+    benchmarks, version = load_tier_benchmarks(db)
+    with _cache_lock:
+        _cache.update(benchmarks=benchmarks, version=version, loaded_at=now)
+    return benchmarks
+
+
+def invalidate_tier_benchmark_cache() -> None:
+    """캐시 비우기 (보정 직후 자동 호출)"""
+    with _cache_lock:
+        _cache.update(benchmarks=None, version=None, loaded_at=0.0)
@@ -0,0 +1,130 @@
+"""
+YouTube Data API 응답 캐시
+- 로컬 디스크(SQLite 파일)에 list() 응답을 저장
+- 키: resource + 요청 파라미터(pageToken 포함, API 키 제외)
+- 리소스별 TTL: 채널 ID 조회는 길게, 채널/영상 통계는 짧게, 댓글은 중간
+- hit/miss 카운터 제공
+"""
+
+import json
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+
+class YouTubeResponseCache:
+
+    # 리소스별 TTL (초)
+    DEFAULT_TTLS = {
+        "channels": 7 * 24 * 3600,       # 채널 ID 조회 / 업로드 재생목록: 7일
+        "channels.statistics": 6 * 3600, # 채널 통계(구독자 수 -> Tier/벤치마크): 6시간
+        "search": 6 * 3600,              # 영상 목록: 6시간
+        "playlistItems": 6 * 3600,       # 영상 목록: 6시간
+        "videos": 1 * 3600,              # 영상 통계: 1시간
+        "commentThreads": 24 * 3600,     # 댓글: 1일
+    }
+
+    # 캐시 키에서 제외할 파라미터
+    IGNORED_PARAMS = ("key", "developerKey")
+
+    def __init__(self, path: str, ttls: dict = None):
+        self.path = path
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.hits = Counter()
+        self.misses = Counter()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS youtube_response_cache (
+                    cache_key   TEXT PRIMARY KEY,
+                    resource    TEXT NOT NULL,
+                    response    TEXT NOT NULL,
+                    expires_at  REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_youtube_response_cache_expires "
+                "ON youtube_response_cache (expires_at)"
+            )
+            self._conn.commit()
+        self.purge_expired()
+
+    def make_key(self, resource: str, params: dict) -> str:
+        """resource + 정렬된 파라미터(None 제외)로 캐시 키 생성"""
+        clean = {
+            k: v for k, v in params.items()
+            if v is not None and k not in self.IGNORED_PARAMS
+        }
+        raw = resource + "?" + json.dumps(clean, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def ttl_group(resource: str, params: dict) -> str:
+        """TTL / 통계 구분 (channels 중 statistics 를 포함한 조회는 구독자 수가 바뀌므로 따로)"""
+        if resource == "channels" and "statistics" in str(params.get("part", "")):
+            return "channels.statistics"
+        return resource
+
+    def get(self, resource: str, params: dict):
+        """캐시된 응답(dict) 반환, 없거나 만료되면 None"""
+        group = self.ttl_group(resource, params)
+        if self.ttls.get(group, 0) <= 0:
+            return None
+        cache_key = self.make_key(resource, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM youtube_response_cache WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+            if row is None or row[1] < time.time():
+                self.misses[group] += 1
+                return None
+            self.hits[group] += 1
+        return json.loads(row[0])
+
+    def set(self, resource: str, params: dict, response: dict) -> None:
+        """응답 저장 (TTL 이 0 이하인 리소스는 저장하지 않음)"""
+        ttl = self.ttls.get(self.ttl_group(resource, params), 0)
+        if ttl <= 0:
+            return
+        cache_key = self.make_key(resource, params)
+        payload = json.dumps(response, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO youtube_response_cache "
+                "(cache_key, resource, response, expires_at) VALUES (?, ?, ?, ?)",
+                (cache_key, resource, payload, time.time() + ttl),
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제, 삭제 건수 반환"""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM youtube_response_cache WHERE expires_at < ?",
+                (time.time(),),
+            )
+            self._conn.commit()
+        return cur.rowcount
+
+    def stats(self) -> dict:
+        """리소스별 hit/miss 카운터"""
+        with self._lock:
+            resources = sorted(set(self.hits) | set(self.misses))
+            return {
+                "hits": sum(self.hits.values()),
+                "misses": sum(self.misses.values()),
+                "by_resource": {
+                    r: {"hits": self.hits[r], "misses": self.misses[r]}
+                    for r in resources
+                },
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,136 @@
+"""
+YouTube Data API 키 풀
+- 여러 API 키의 호출 수 / quota 사용량 / quota 오류(403)를 키별로 기록
+- quotaExceeded 등으로 막힌 키는 그날(태평양 시간 기준) 동안 제외하고 다음 정상 키로 교체
+- 프로세스 안에서 공유해 여러 분석 요청이 같은 키 상태를 보도록 함 (get_shared_key_pool)
+"""
+
+import json
+import threading
+from collections import Counter
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+# quota 초기화 기준 시간대 (youtube_quota_service.QUOTA_TIMEZONE 과 동일,
+# collector 가 DB 설정 없이도 import 되도록 여기서 따로 둔다)
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# 키를 그날 사용 불가로 처리할 403 reason
+QUOTA_ERROR_REASONS = ("quotaExceeded", "dailyLimitExceeded")
+
+
+def error_reasons(error) -> list:
+    """HttpError 응답 본문의 error.errors[].reason 목록"""
+    content = getattr(error, "content", b"") or b""
+    try:
+        payload = json.loads(content.decode("utf-8") if isinstance(content, bytes) else content)
+        return [e.get("reason") for e in payload.get("error", {}).get("errors", [])]
+    except (ValueError, AttributeError):
+        return []
+
+
+def quota_error_reason(error):
+    """HttpError 가 키 quota 소진 오류면 reason, 아니면 None"""
+    resp = getattr(error, "resp", None)
+    if resp is None or getattr(resp, "status", None) != 403:
+        return None
+    for reason in error_reasons(error):
+        if reason in QUOTA_ERROR_REASONS:
+            return reason
+    return None
+
+
+def mask_key(api_key: str) -> str:
+    """로그/응답용 키 표시 (끝 4자리)"""
+    return f"...{api_key[-4:]}" if api_key else ""
+
+
+class YouTubeApiKeyPool:
+
+    def __init__(self, api_keys):
+        keys = [k.strip() for k in api_keys if k and k.strip()]
+        if not keys:
+            raise ValueError("API 키가 하나 이상 필요합니다.")
+        # 순서 유지 + 중복 제거
+        self.keys = list(dict.fromkeys(keys))
+        self.calls = Counter()
+        self.units = Counter()
+        self.quota_errors = Counter()
+        # key -> quota 소진된 quota 기준일
+        self._exhausted = {}
+        self._index = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.keys)
+
+    @staticmethod
+    def _today():
+        return datetime.now(QUOTA_TIMEZONE).date()
+
+    def _is_healthy(self, api_key, today) -> bool:
+        return self._exhausted.get(api_key) != today
+
+    def current(self):
+        """
+        지금 사용할 키
+        - 현재 키가 막혔으면 다음 정상 키로 교체
+        - 모든 키가 막혔으면 None
+        """
+        today = self._today()
+        with self._lock:
+            for offset in range(len(self.keys)):
+                i = (self._index + offset) % len(self.keys)
+                if self._is_healthy(self.keys[i], today):
+                    if offset:
+                        print(f"  [KeyPool] 🔁 API 키 교체: {mask_key(self.keys[i])}")
+                    self._index = i
+                    return self.keys[i]
+        return None
+
+    def record_call(self, api_key, units: int) -> None:
+        with self._lock:
+            self.calls[api_key] += 1
+            self.units[api_key] += units
+
+    def mark_exhausted(self, api_key, reason: str = "quotaExceeded") -> None:
+        """키를 오늘 하루 사용 불가로 표시"""
+        today = self._today()
+        with self._lock:
+            self.quota_errors[api_key] += 1
+            newly_exhausted = self._exhausted.get(api_key) != today
+            self._exhausted[api_key] = today
+        # 동시 요청이 같은 키로 여러 번 403 을 받아도 로그는 한 번만
+        if newly_exhausted:
+            print(f"  [KeyPool] ⚠️ API 키 {mask_key(api_key)} quota 소진 ({reason})")
+
+    def usage(self) -> list:
+        """키별 사용 현황 (키는 마스킹)"""
+        today = self._today()
+        with self._lock:
+            return [
+                {
+                    "key": mask_key(k),
+                    "calls": self.calls[k],
+                    "units": self.units[k],
+                    "quota_errors": self.quota_errors[k],
+                    "exhausted": not self._is_healthy(k, today),
+                }
+                for k in self.keys
+            ]
+
+
+# 프로세스 공용 키 풀 (키 목록별 1개)
+_shared_pools = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_key_pool(api_keys) -> YouTubeApiKeyPool:
+    """같은 키 목록이면 같은 풀을 반환 (요청 간 quota 소진 상태 공유)"""
+    pool_key = tuple(dict.fromkeys(k.strip() for k in api_keys if k and k.strip()))
+    with _shared_lock:
+        pool = _shared_pools.get(pool_key)
+        if pool is None:
+            pool = YouTubeApiKeyPool(pool_key)
+            _shared_pools[pool_key] = pool
+        return pool
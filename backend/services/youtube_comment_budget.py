@@ -0,0 +1,66 @@
+"""
+채널 단위 댓글 수집 예산 배분
+- commentThreads 요청(페이지) 예산을 채널 전체에서 하나로 잡고 영상별로 나눔
+- 가중치: 조회수와 댓글 수의 기하평균 sqrt(view_count * comment_count)
+- 댓글이 있는 영상은 먼저 1페이지씩, 남는 예산은 가중치 비례(D'Hondt 방식)로 추가 페이지 배정
+- 영상별 상한: 실제 댓글 수로 채울 수 있는 페이지 수 / max_pages_per_video
+"""
+
+import heapq
+import math
+
+# commentThreads 1페이지 최대 댓글 수
+COMMENTS_PER_PAGE = 100
+
+
+def comment_weight(video_data: dict) -> float:
+    """영상 1개의 배분 가중치"""
+    return math.sqrt(
+        max(video_data.get('view_count', 0), 0) * max(video_data.get('comment_count', 0), 0)
+    )
+
+
+def allocate_comment_pages(videos_data: list, total_pages: int, max_pages_per_video: int = 10) -> dict:
+    """
+    채널 전체 페이지 예산 -> {video_id: 페이지 수}
+    - comment_count 가 0인 영상은 0페이지 (요청 생략)
+    - 예산이 영상 수보다 적으면 가중치가 큰 영상부터 1페이지씩
+      (0페이지가 된 댓글 있는 영상은 collector 가 comments_error 로 표시해 지표 계산에서 제외)
+    """
+    pages = {video['video_id']: 0 for video in videos_data}
+    capacity = {
+        video['video_id']: min(
+            max_pages_per_video,
+            math.ceil(video.get('comment_count', 0) / COMMENTS_PER_PAGE),
+        )
+        for video in videos_data
+    }
+    weights = {video['video_id']: comment_weight(video) for video in videos_data}
+    candidates = sorted(
+        (video_id for video_id in pages if capacity[video_id] > 0),
+        key=lambda video_id: weights[video_id],
+        reverse=True,
+    )
+
+    budget = max(0, int(total_pages))
+
+    # 1단계: 댓글이 있는 영상마다 1페이지
+    for video_id in candidates[:budget]:
+        pages[video_id] = 1
+    budget -= min(budget, len(candidates))
+
+    # 2단계: 남는 예산을 weight / (배정 페이지 + 1) 이 큰 순서로 1페이지씩
+    heap = [
+        (-weights[video_id] / 2, video_id)
+        for video_id in candidates
+        if pages[video_id] == 1 and capacity[video_id] > 1
+    ]
+    heapq.heapify(heap)
+    while budget > 0 and heap:
+        _, video_id = heapq.heappop(heap)
+        pages[video_id] += 1
+        budget -= 1
+        if pages[video_id] < capacity[video_id]:
+            heapq.heappush(heap, (-weights[video_id] / (pages[video_id] + 1), video_id))
+
+    return pages
@@ -0,0 +1,183 @@
+"""
+댓글 적응형 샘플링 (통계적 조기 종료)
+- 댓글을 작은 페이지로 받으면서 Problem 비율 / Demand 적중 비율의 신뢰구간(Wilson)을 추적
+- 영상 단위: 두 비율의 신뢰구간 반폭이 max_half_width 이하가 되면 해당 영상 수집 중단
+- 채널 단위: 채널 전체 비율이 수렴하면 이후 영상은 converged_comments 만큼만 수집
+- 댓글 0개 영상은 요청 생략, 실제로 필요했던 댓글 수를 기록
+- 영상당 상한은 기존 수집과 같은 100개(API 1페이지 최대치)
+"""
+
+import math
+import threading
+
+
+def wilson_half_width(hits: int, n: int, z: float = 1.96) -> float:
+    """이항 비율 hits/n 에 대한 Wilson 신뢰구간의 반폭"""
+    if n <= 0:
+        return 1.0
+    p = hits / n
+    denom = 1 + z * z / n
+    return (z / denom) * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+
+
+class AdaptiveCommentSampler:
+
+    # 샘플링 없이 수집할 때와 같은 영상당 최대 댓글 수
+    MAX_COMMENTS = 100
+
+    def __init__(
+        self,
+        classify,
+        page_size: int = 50,
+        min_comments: int = 50,
+        converged_comments: int = 50,
+        max_half_width: float = 0.05,
+        channel_half_width: float = 0.02,
+        channel_min_videos: int = 10,
+        z: float = 1.96,
+    ):
+        """
+        - classify: 댓글 텍스트 -> (is_demand, is_problem)
+          (MetricsCalculator.classify_comment 와 같은 키워드 기준이어야 함)
+        - page_size: commentThreads 요청 1회당 댓글 수 (API 최대 100)
+        - min_comments: 조기 종료 판단 전에 최소로 받을 댓글 수
+        - converged_comments: 채널 단위로 수렴한 뒤 영상당 받을 댓글 수
+        - max_half_width: 영상 단위 신뢰구간 반폭 허용치
+        - channel_half_width / channel_min_videos: 채널 단위 수렴 기준
+        """
+        self.classify = classify
+        self.page_size = max(1, min(100, int(page_size)))
+        self.min_comments = max(1, int(min_comments))
+        self.converged_comments = max(1, int(converged_comments))
+        self.max_half_width = max_half_width
+        self.channel_half_width = channel_half_width
+        self.channel_min_videos = channel_min_videos
+        self.z = z
+
+        self._lock = threading.Lock()
+        self.channel_comments = 0
+        self.channel_demand_hits = 0
+        self.channel_problem_hits = 0
+        self.videos_sampled = 0
+        self.videos_stopped_early = 0
+        self.videos_skipped = 0
+        # 다음 페이지가 남아 있는데 조기 종료한 영상 ID
+        self.truncated = set()
+
+    def spawn(self) -> "AdaptiveCommentSampler":
+        """같은 설정의 새 샘플러 (여러 채널을 한 번에 수집할 때 채널별 누적 비율을 분리)"""
+        return AdaptiveCommentSampler(
+            self.classify,
+            page_size=self.page_size,
+            min_comments=self.min_comments,
+            converged_comments=self.converged_comments,
+            max_half_width=self.max_half_width,
+            channel_half_width=self.channel_half_width,
+            channel_min_videos=self.channel_min_videos,
+            z=self.z,
+        )
+
+    def converged(self, n: int, demand_hits: int, problem_hits: int, half_width: float) -> bool:
+        return (
+            wilson_half_width(demand_hits, n, self.z) <= half_width
+            and wilson_half_width(problem_hits, n, self.z) <= half_width
+        )
+
+    def channel_converged(self) -> bool:
+        with self._lock:
+            return (
+                self.videos_sampled >= self.channel_min_videos
+                and self.converged(
+                    self.channel_comments,
+                    self.channel_demand_hits,
+                    self.channel_problem_hits,
+                    self.channel_half_width,
+                )
+            )
+
+    def comment_limit(self, max_comments: int) -> int:
+        """이 영상에서 받을 댓글 상한 (채널이 수렴했으면 converged_comments)"""
+        if self.channel_converged():
+            return min(max_comments, self.converged_comments)
+        return max_comments
+
+    def first_page_size(self, limit: int) -> int:
+        """
+        첫 페이지 크기: 채널 누적 비율로 영상 단위 수렴에 필요한 댓글 수를 추정
+        - 추정치가 limit 이상이거나 아직 채널 데이터가 없으면 limit 한 번에 (요청 1회)
+        - 작으면 그만큼만 받고 수렴 여부를 확인 (대부분 추가 요청 없이 종료)
+        """
+        with self._lock:
+            n = self.channel_comments
+            rates = (self.channel_demand_hits / n, self.channel_problem_hits / n) if n else None
+        if rates is None:
+            return limit
+        variance = max(r * (1 - r) for r in rates)
+        needed = math.ceil(self.z * self.z * variance / (self.max_half_width ** 2))
+        return max(min(limit, self.min_comments), min(limit, needed))
+
+    def sample(self, fetch_page, max_comments: int, video_id: str = None) -> list:
+        """
+        fetch_page(page_token, page_size) -> (comments, next_page_token) 로 댓글을 조금씩 수집
+        - 반환: 수집한 댓글 목록 (기존 _get_comment_threads 와 같은 형태)
+        """
+        max_comments = min(max_comments, self.MAX_COMMENTS)
+        limit = self.comment_limit(max_comments)
+        comments = []
+        demand_hits = problem_hits = 0
+        page_token = None
+        stopped_early = False
+
+        page_size = self.first_page_size(limit)
+        while len(comments) < limit:
+            page, page_token = fetch_page(page_token, min(page_size, limit - len(comments)))
+            page_size = self.page_size
+            for text in page:
+                is_demand, is_problem = self.classify(text)
+                demand_hits += int(is_demand)
+                problem_hits += int(is_problem)
+            comments.extend(page)
+
+            if not page_token:
+                break
+            if len(comments) >= self.min_comments and self.converged(
+                len(comments), demand_hits, problem_hits, self.max_half_width
+            ):
+                stopped_early = len(comments) < limit
+                break
+
+        with self._lock:
+            self.videos_sampled += 1
+            self.channel_comments += len(comments)
+            self.channel_demand_hits += demand_hits
+            self.channel_problem_hits += problem_hits
+            if stopped_early or (limit < max_comments and page_token):
+                self.videos_stopped_early += 1
+                if video_id is not None:
+                    self.truncated.add(video_id)
+
+        return comments
+
+    def is_truncated(self, video_id: str) -> bool:
+        """샘플링 때문에 원래보다 적게 받은 영상인지"""
+        with self._lock:
+            return video_id in self.truncated
+
+    def record_skipped(self) -> None:
+        """댓글이 0개라 요청 자체를 생략한 영상"""
+        with self._lock:
+            self.videos_skipped += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            n = self.channel_comments
+            return {
+                'videos_sampled': self.videos_sampled,
+                'videos_stopped_early': self.videos_stopped_early,
+                'videos_skipped': self.videos_skipped,
+                'comments_needed': n,
+                'demand_hit_rate': round(self.channel_demand_hits / n, 4) if n else 0.0,
+                'problem_rate': round(self.channel_problem_hits / n, 4) if n else 0.0,
+                'demand_half_width': round(wilson_half_width(self.channel_demand_hits, n, self.z), 4),
+                'problem_half_width': round(wilson_half_width(self.channel_problem_hits, n, self.z), 4),
+            }
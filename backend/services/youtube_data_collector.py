@@ -5,56 +5,281 @@ YouTube Creator Analysis System - 데이터 수집 모듈 (수정본)
 """
 
 import os
+import re
+import math
 import json
-from datetime import datetime, timedelta
+import time
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timedelta, timezone
 from googleapiclient.discovery import build # pip install google-api-python-client
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
 import isodate # pip install isodate
+from services.youtube_api_keys import YouTubeApiKeyPool, mask_key, quota_error_reason
+from services.youtube_comment_budget import COMMENTS_PER_PAGE, allocate_comment_pages
+from services.youtube_retry import RetryPolicy
+from services.youtube_video_record import VideoRecord, videos_to_dicts
+
+# 채널 ID: UC + 22자
+_CHANNEL_ID_RE = re.compile(r'^UC[0-9A-Za-z_-]{22}$')
+_CHANNEL_URL_RE = re.compile(r'/channel/(UC[0-9A-Za-z_-]{22})')
+_HANDLE_URL_RE = re.compile(r'/@([^/?#\s]+)')
+_LEGACY_URL_RE = re.compile(r'/(?:user|c)/([^/?#\s]+)')
+
+
+def parse_channel_query(query):
+    """
+    [NEW] 채널 입력값을 API 호출 없이 해석
+    - 'UC…' / '…/channel/UC…'  -> ('id', 'UC…')
+    - '@handle' / '…/@handle'  -> ('handle', 'handle')
+    - '…/user/name', '…/c/name' -> ('handle', 'name')
+    - 그 외 문자열              -> ('handle', 문자열에서 @ 제거)
+    """
+    query = (query or '').strip()
+    if not query:
+        return None, None
+    if _CHANNEL_ID_RE.match(query):
+        return 'id', query
+    
+    m = _CHANNEL_URL_RE.search(query)
+    if m:
+        return 'id', m.group(1)
+    m = _HANDLE_URL_RE.search(query)
+    if m:
+        return 'handle', m.group(1)
+    m = _LEGACY_URL_RE.search(query)
+    if m:
+        return 'handle', m.group(1)
+    return 'handle', query.replace('@', '')
+
 
 class YouTubeDataCollector:
-    def __init__(self, api_key):
+    # 영상 목록 수집 방식
+    # - 'search' : search().list (페이지당 100 units, 결과 반영이 느림)
+    # - 'uploads': 업로드 재생목록 playlistItems().list (페이지당 1 unit)
+    VIDEO_LISTING_MODES = ('search', 'uploads')
+
+    # list() 호출 1회당 quota 비용 (https://developers.google.com/youtube/v3/determine_quota_cost)
+    QUOTA_COSTS = {
+        'search': 100,
+        'channels': 1,
+        'playlistItems': 1,
+        'videos': 1,
+        'commentThreads': 1,
+    }
+
+    # 응답 필드 projection (fields=): 실제로 읽는 필드만 받아 응답 크기 / JSON 파싱 시간을 줄인다
+    FIELDS = {
+        'channel_id': 'items/id',
+        'channel_search': 'items/id/channelId',
+        'channel_info': (
+            'items(id,snippet(title,description,publishedAt),'
+            'statistics(subscriberCount,viewCount,videoCount),'
+            'contentDetails/relatedPlaylists/uploads)'
+        ),
+        'uploads_playlist': 'items/contentDetails/relatedPlaylists/uploads',
+        'search_videos': 'nextPageToken,items/id/videoId',
+        'playlist_items': 'nextPageToken,items/contentDetails(videoId,videoPublishedAt)',
+        'videos': (
+            'items(id,snippet(title,publishedAt,tags,thumbnails/high/url),'
+            'contentDetails/duration,statistics(viewCount,likeCount,commentCount))'
+        ),
+        'comment_threads': 'nextPageToken,items/snippet/topLevelComment/snippet/textDisplay',
+    }
+
+    # 재시도할 네트워크 예외
+    TRANSIENT_ERRORS = (OSError,)
+
+    def __init__(self, api_key, comment_workers=1, video_listing='search', cache=None,
+                 comment_sampler=None, comment_budget=None, api_endpoint=None, retry_policy=None):
         """
         YouTube Data API 클라이언트 초기화
+        - api_key: API 키 1개, 키 목록, 또는 YouTubeApiKeyPool (quota 소진 시 다음 키로 자동 교체)
+        - comment_workers: 댓글 동시 수집 스레드 수 (1이면 기존처럼 순차 수집)
+        - video_listing: 영상 목록 수집 방식 ('search' | 'uploads')
+        - cache: 응답 캐시 (services.youtube_api_cache.YouTubeResponseCache, 선택)
+        - comment_sampler: 댓글 적응형 샘플러 (services.youtube_comment_sampler.AdaptiveCommentSampler, 선택)
+        - comment_budget: 채널 전체 댓글 페이지 예산 (None: 영상마다 max_comments, 'auto': 같은 요청 수, 정수: 페이지 수)
+        - api_endpoint: API 서버 루트 주소 변경 (로컬 대역 서버 등, 예: http://127.0.0.1:8765)
+        - retry_policy: 429/5xx 재시도 + 서킷 브레이커 (services.youtube_retry.RetryPolicy, 기본값 사용)
+        """
+        if video_listing not in self.VIDEO_LISTING_MODES:
+            raise ValueError(f"지원하지 않는 video_listing 값입니다: {video_listing}")
+        
+        if isinstance(api_key, YouTubeApiKeyPool):
+            self.key_pool = api_key
+        elif isinstance(api_key, (list, tuple)):
+            self.key_pool = YouTubeApiKeyPool(api_key)
+        else:
+            self.key_pool = YouTubeApiKeyPool([api_key])
+        # 기본 키 (self.youtube 클라이언트에 묶이는 키)
+        self.api_key = self.key_pool.keys[0]
+        self.api_endpoint = api_endpoint
+        self.youtube = self._build_client()
+        # 기본 키 외의 키별 discovery 클라이언트 (필요할 때 생성)
+        self._clients = {}
+        self.comment_workers = max(1, int(comment_workers))
+        self.video_listing = video_listing
+        self.cache = cache
+        self.comment_sampler = comment_sampler
+        self.comment_budget = comment_budget
+        self.retry_policy = retry_policy or RetryPolicy(transient_errors=self.TRANSIENT_ERRORS)
+        # channel_id -> 업로드 재생목록 ID (get_channel_info 에서 채움)
+        self._uploads_playlists = {}
+        # httplib2.Http 는 스레드 안전하지 않으므로 스레드별로 따로 둔다
+        self._local = threading.local()
+        # 마지막 댓글 수집 단계의 시간 측정 결과 (worker 수 튜닝용)
+        self.last_comment_timing = {}
+        # 실제 API 호출 횟수 / quota 사용량 (캐시 적중은 제외)
+        self.call_counts = Counter()
+        self.quota_usage = Counter()
+        self.key_usage = Counter()
+        self._stats_lock = threading.Lock()
+
+    def close(self):
+        """응답 캐시 연결 닫기 (수집이 끝난 collector 는 다시 쓰지 않음)"""
+        if self.cache is not None:
+            self.cache.close()
+
+    def quota_units_used(self):
+        """이 collector 로 지금까지 사용한 quota 합계"""
+        with self._stats_lock:
+            return sum(self.quota_usage.values())
+
+    def usage_summary(self):
+        """리소스별 quota 사용량 / 호출 횟수 (+ 키별 사용량, 키는 마스킹)"""
+        with self._stats_lock:
+            return {
+                'units_by_resource': dict(self.quota_usage),
+                'calls_by_resource': dict(self.call_counts),
+                'units_by_key': {mask_key(k): v for k, v in self.key_usage.items()},
+            }
+
+    def _http(self):
+        """현재 스레드 전용 HTTP 객체"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = build_http()
+            self._local.http = http
+        return http
+
+    def _build_client(self, api_key=None):
+        """discovery 기반 API 클라이언트 생성"""
+        # discovery 문서의 메서드 경로가 'youtube/v3/...' 이므로 루트 주소만 바꾼다
+        client_options = {'api_endpoint': self.api_endpoint.rstrip('/') + '/'} if self.api_endpoint else None
+        return build('youtube', 'v3', developerKey=api_key or self.api_key, client_options=client_options)
+
+    def _client_for(self, api_key):
+        """키에 해당하는 discovery 클라이언트 (기본 키는 self.youtube)"""
+        if api_key == self.api_key:
+            return self.youtube
+        with self._stats_lock:
+            client = self._clients.get(api_key)
+            if client is None:
+                client = self._build_client(api_key)
+                self._clients[api_key] = client
+            return client
+
+    def _execute_list(self, resource, params, api_key):
+        """실제 API 호출 (discovery 클라이언트)"""
+        request = getattr(self._client_for(api_key), resource)().list(**params)
+        return request.execute(http=self._http())
+
+    def _list(self, resource, **params):
+        """
+        모든 API 호출의 단일 진입점: youtube.<resource>().list(**params).execute()
+        - cache 가 있으면 캐시 조회 후 미스일 때만 API 호출
+        - 429/5xx 등 일시 오류는 retry_policy 로 백오프 후 재시도 (시도마다 quota 집계)
+        - 키 quota 소진(403 quotaExceeded)이면 키 풀의 다음 정상 키로 바꿔 재시도
         """
-        self.api_key = api_key
-        self.youtube = build('youtube', 'v3', developerKey=api_key)
+        if self.cache is not None:
+            cached = self.cache.get(resource, params)
+            if cached is not None:
+                return cached
+        
+        cost = self.QUOTA_COSTS.get(resource, 1)
+        last_error = None
+        for _ in range(len(self.key_pool)):
+            api_key = self.key_pool.current()
+            if api_key is None:
+                if last_error is not None:
+                    raise last_error
+                # 모든 키가 소진 상태면 기본 키로 요청해 API 응답(403)을 그대로 전달
+                api_key = self.api_key
+            
+            def attempt(api_key=api_key):
+                with self._stats_lock:
+                    self.call_counts[resource] += 1
+                    self.quota_usage[resource] += cost
+                    self.key_usage[api_key] += cost
+                self.key_pool.record_call(api_key, cost)
+                return self._execute_list(resource, params, api_key)
+            
+            try:
+                response = self.retry_policy.call(resource, attempt)
+            except HttpError as e:
+                reason = quota_error_reason(e)
+                if reason is None:
+                    raise
+                self.key_pool.mark_exhausted(api_key, reason)
+                last_error = e
+                continue
+            
+            if self.cache is not None:
+                self.cache.set(resource, params, response)
+            return response
+        
+        raise last_error
     
-    def get_channel_id_from_username(self, username):
+    def get_channel_id_from_username(self, username, raise_errors=False):
         """
         채널 사용자명(@username)으로 채널 ID 찾기
+        - 채널 URL/ID 가 들어오면 API 호출 없이 바로 반환
+        - raise_errors=True 이면 API 오류를 None 대신 그대로 전달 ('없음'과 구분용)
         """
+        kind, value = parse_channel_query(username)
+        if kind is None:
+            return None
+        if kind == 'id':
+            return value
+        
         try:
             # @ 제거
-            username_cleaned = username.replace('@', '')
+            username_cleaned = value
             
             # 1. handles().list API 사용 (최신 방식)
             # 이 API는 핸들로 직접 ID를 가져옵니다.
-            request = self.youtube.channels().list(
+            response = self._list(
+                'channels',
                 part='id',
-                forHandle=username_cleaned
+                forHandle=username_cleaned,
+                fields=self.FIELDS['channel_id']
             )
-            response = request.execute()
             if 'items' in response and response['items']:
                 return response['items'][0]['id']
 
             # 2. forUsername 사용 (구형 방식)
-            request = self.youtube.channels().list(
+            response = self._list(
+                'channels',
                 part='id',
-                forUsername=username_cleaned
+                forUsername=username_cleaned,
+                fields=self.FIELDS['channel_id']
             )
-            response = request.execute()
             
             if 'items' in response and response['items']:
                 return response['items'][0]['id']
             
             # 3. search API 사용 (최후의 수단)
-            request = self.youtube.search().list(
+            response = self._list(
+                'search',
                 part='id',
-                q=username, # @가 포함된 원래 이름으로 검색
+                q=username if '/' not in username else '@' + username_cleaned, # @가 포함된 원래 이름으로 검색
                 type='channel',
-                maxResults=1
+                maxResults=1,
+                fields=self.FIELDS['channel_search']
             )
-            response = request.execute()
             
             if 'items' in response and response['items']:
                 return response['items'][0]['id']['channelId']
@@ -63,6 +288,8 @@ class YouTubeDataCollector:
             
         except HttpError as e:
             print(f"  [DataCollector] ❌ 채널 검색 오류: {e}")
+            if raise_errors:
+                raise
             return None
     
     def get_channel_info(self, channel_id):
@@ -70,27 +297,18 @@ class YouTubeDataCollector:
         채널 기본 정보 수집
         """
         try:
-            request = self.youtube.channels().list(
-                part='snippet,statistics',
-                id=channel_id
+            response = self._list(
+                'channels',
+                part='snippet,statistics,contentDetails',
+                id=channel_id,
+                fields=self.FIELDS['channel_info']
             )
-            response = request.execute()
             
             if 'items' not in response or not response['items']:
                 print(f"  [DataCollector] ❌ 채널을 찾을 수 없습니다: {channel_id}")
                 return None
             
-            channel = response['items'][0]
-            
-            return {
-                'channel_id': channel_id,
-                'channel_name': channel['snippet']['title'],
-                'description': channel['snippet']['description'],
-                'subscriber_count': int(channel['statistics'].get('subscriberCount', 0)),
-                'total_views': int(channel['statistics']['viewCount']),
-                'video_count': int(channel['statistics']['videoCount']),
-                'published_at': channel['snippet']['publishedAt']
-            }
+            return self._parse_channel_item(channel_id, response['items'][0])
             
         except HttpError as e:
             print(f"  [DataCollector] ❌ HTTP 오류: {e}")
@@ -99,28 +317,85 @@ class YouTubeDataCollector:
             print(f"  [DataCollector] ❌ 예상치 못한 오류: {e}")
             return None
     
-    def get_channel_videos(self, channel_id, max_results=50, months_back=6):
+    def get_channels_info(self, channel_ids):
+        """
+        여러 채널의 기본 정보를 50개 단위 배치로 수집 -> {channel_id: 채널 정보}
+        - 찾지 못한 채널은 결과에서 빠진다
+        """
+        infos = {}
+        for i in range(0, len(channel_ids), 50):
+            batch_ids = channel_ids[i:i+50]
+            try:
+                response = self._list(
+                    'channels',
+                    part='snippet,statistics,contentDetails',
+                    id=','.join(batch_ids),
+                    fields=self.FIELDS['channel_info']
+                )
+            except HttpError as e:
+                print(f"  [DataCollector] ❌ HTTP 오류 (Channel Batch {i}): {e}")
+                continue
+            for channel in response.get('items', []):
+                infos[channel['id']] = self._parse_channel_item(channel['id'], channel)
+        return infos
+    
+    def _parse_channel_item(self, channel_id, channel):
+        """channels().list 응답 항목 -> 채널 정보 dict (업로드 재생목록 ID 는 따로 기억)"""
+        uploads_playlist_id = (
+            channel.get('contentDetails', {})
+            .get('relatedPlaylists', {})
+            .get('uploads')
+        )
+        if uploads_playlist_id:
+            self._uploads_playlists[channel_id] = uploads_playlist_id
+        
+        return {
+            'channel_id': channel_id,
+            'channel_name': channel['snippet']['title'],
+            'description': channel['snippet']['description'],
+            'subscriber_count': int(channel['statistics'].get('subscriberCount', 0)),
+            'total_views': int(channel['statistics']['viewCount']),
+            'video_count': int(channel['statistics']['videoCount']),
+            'published_at': channel['snippet']['publishedAt']
+        }
+    
+    def get_channel_videos(self, channel_id, max_results=50, months_back=6, listing=None,
+                           published_after=None):
         """
         채널의 최근 영상 목록 수집
+        - listing: 'search' | 'uploads' (None 이면 생성자의 video_listing 사용)
+        - published_after: 이 시각(tz-aware datetime) 이후 영상만 (months_back 기준일보다 늦을 때만 적용)
         """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=months_back*30)
+        if published_after is not None and published_after > cutoff:
+            cutoff = published_after
+        
+        listing = listing or self.video_listing
+        if listing == 'uploads':
+            return self._get_channel_videos_from_uploads(channel_id, max_results, cutoff)
+        return self._get_channel_videos_from_search(channel_id, max_results, cutoff)
+
+    def _get_channel_videos_from_search(self, channel_id, max_results, cutoff):
+        """search().list 기반 영상 ID 수집 (페이지당 100 units)"""
         try:
-            # 분석 시작 날짜 계산
-            published_after = (datetime.now() - timedelta(days=months_back*30)).isoformat() + 'Z'
+            # 분석 시작 날짜
+            published_after = cutoff.strftime('%Y-%m-%dT%H:%M:%SZ')
             
             video_ids = []
             next_page_token = None
             
             while len(video_ids) < max_results:
-                request = self.youtube.search().list(
+                response = self._list(
+                    'search',
                     part='id',
                     channelId=channel_id,
                     type='video',
                     order='date', # 최신순
                     maxResults=min(50, max_results - len(video_ids)), # API 최대 50개
                     publishedAfter=published_after,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=self.FIELDS['search_videos']
                 )
-                response = request.execute()
                 
                 video_ids.extend([item['id']['videoId'] for item in response['items']])
                 
@@ -133,39 +408,126 @@ class YouTubeDataCollector:
         except HttpError as e:
             print(f"  [DataCollector] ❌ API 오류: {e}")
             return []
-            
-    def _get_comment_threads(self, video_id: str, max_comments: int = 100) -> list:
-        """[NEW] 영상의 최상위 댓글 텍스트 목록을 수집합니다."""
-        comments = []
+
+    def _get_uploads_playlist_id(self, channel_id):
+        """채널 업로드 재생목록 ID (UCxxxx -> UUxxxx 규칙으로 대체 가능)"""
+        playlist_id = self._uploads_playlists.get(channel_id)
+        if playlist_id:
+            return playlist_id
+        if channel_id.startswith('UC'):
+            return 'UU' + channel_id[2:]
+        
+        response = self._list('channels', part='contentDetails', id=channel_id,
+                              fields=self.FIELDS['uploads_playlist'])
+        items = response.get('items') or []
+        if not items:
+            return None
+        playlist_id = items[0]['contentDetails']['relatedPlaylists']['uploads']
+        self._uploads_playlists[channel_id] = playlist_id
+        return playlist_id
+
+    def _get_channel_videos_from_uploads(self, channel_id, max_results, cutoff):
+        """
+        [NEW] 업로드 재생목록(playlistItems().list) 기반 영상 ID 수집
+        - 페이지당 1 unit, 최신 업로드순
+        - 기준일(cutoff)보다 오래된 영상이 나오면 즉시 중단
+        """
         try:
-            request = self.youtube.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=min(max_comments, 100), # API 최대 100
-                order="relevance", # 관련성 높은 댓글 (또는 'time' for 최신)
-                textFormat="plainText"
-            )
-            response = request.execute()
+            playlist_id = self._get_uploads_playlist_id(channel_id)
+            if not playlist_id:
+                print(f"  [DataCollector] ❌ 업로드 재생목록을 찾을 수 없습니다: {channel_id}")
+                return []
             
-            for item in response.get('items', []):
-                comment_text = item['snippet']['topLevelComment']['snippet']['textDisplay']
-                comments.append(comment_text)
+            video_ids = []
+            next_page_token = None
+            reached_cutoff = False
+            
+            while len(video_ids) < max_results and not reached_cutoff:
+                response = self._list(
+                    'playlistItems',
+                    part='contentDetails',
+                    playlistId=playlist_id,
+                    maxResults=50, # API 최대 50개
+                    pageToken=next_page_token,
+                    fields=self.FIELDS['playlist_items']
+                )
                 
+                for item in response.get('items', []):
+                    details = item.get('contentDetails', {})
+                    published_at_str = details.get('videoPublishedAt')
+                    if not published_at_str:
+                        continue # 비공개/삭제 영상
+                    published_at = datetime.fromisoformat(published_at_str.replace('Z', '+00:00'))
+                    if published_at < cutoff:
+                        reached_cutoff = True
+                        break
+                    video_ids.append(details['videoId'])
+                    if len(video_ids) >= max_results:
+                        break
+                
+                next_page_token = response.get('nextPageToken')
+                if not next_page_token:
+                    break # 다음 페이지 없으면 종료
+            
+            return video_ids
+            
+        except HttpError as e:
+            print(f"  [DataCollector] ❌ API 오류: {e}")
+            return []
+            
+    def _fetch_comment_page(self, video_id, page_size, page_token=None):
+        """commentThreads 1페이지 -> (댓글 텍스트 목록, nextPageToken)"""
+        response = self._list(
+            'commentThreads',
+            part="snippet",
+            videoId=video_id,
+            maxResults=min(page_size, 100), # API 최대 100
+            order="relevance", # 관련성 높은 댓글 (또는 'time' for 최신)
+            textFormat="plainText",
+            pageToken=page_token,
+            fields=self.FIELDS['comment_threads']
+        )
+        comments = [
+            item['snippet']['topLevelComment']['snippet']['textDisplay']
+            for item in response.get('items', [])
+        ]
+        return comments, response.get('nextPageToken')
+
+    def _get_comment_threads(self, video_id: str, max_comments: int = 100, sampler=None) -> list:
+        """
+        [NEW] 영상의 최상위 댓글 텍스트 목록을 수집합니다.
+        - sampler(AdaptiveCommentSampler)가 있으면 작은 페이지로 받다가 비율이 수렴하면 조기 종료
+        - 댓글 비활성화(403)는 빈 목록, 재시도 후에도 실패한 오류는 그대로 전달 (호출 측에서 영상 표시)
+        """
+        try:
+            if sampler is not None:
+                return sampler.sample(
+                    lambda page_token, page_size: self._fetch_comment_page(video_id, page_size, page_token),
+                    max_comments,
+                    video_id=video_id,
+                )
+            comments, page_token = self._fetch_comment_page(video_id, max_comments)
+            # 100개 초과 요청이면 nextPageToken 을 따라 추가 페이지 수집
+            while page_token and len(comments) < max_comments:
+                page, page_token = self._fetch_comment_page(video_id, max_comments - len(comments), page_token)
+                comments.extend(page)
             return comments
         except HttpError as e:
-            # 403: 댓글 비활성화 또는 접근 거부
-            if e.resp.status == 403:
+            # 403: 댓글 비활성화 또는 접근 거부 (quota 소진 / 속도 제한은 오류로 처리)
+            if e.resp.status == 403 and not self.retry_policy.is_retryable(e) and quota_error_reason(e) is None:
                 print(f"    [DataCollector] ⚠️ {video_id} 영상 댓글 비활성화됨.")
-            else:
-                print(f"    [DataCollector] ❌ {video_id} 댓글 수집 중 오류: {e}")
-            return [] # 오류 발생 시 빈 리스트 반환
-        except Exception as e:
+                return []
+            print(f"    [DataCollector] ❌ {video_id} 댓글 수집 중 오류: {e}")
+            raise
+        except (KeyError, TypeError) as e:
             print(f"    [DataCollector] ❌ {video_id} 댓글 파싱 중 알 수 없는 오류: {e}")
             return []
 
     def get_video_details(self, video_ids, include_comments=True, max_comments=100):
         """
         [수정됨] 영상 상세 정보 + 댓글 텍스트 수집 (배치 처리)
+        - 1단계: 50개 단위 배치로 통계 조회
+        - 2단계: 댓글 수집 (comment_workers > 1 이면 스레드 풀로 동시 수집)
         """
         videos_data = []
         
@@ -175,11 +537,12 @@ class YouTubeDataCollector:
             
             try:
                 # 1. 비디오 기본 정보/통계 일괄 조회
-                request = self.youtube.videos().list(
+                response = self._list(
+                    'videos',
                     part='snippet,contentDetails,statistics',
-                    id=','.join(batch_ids)
+                    id=','.join(batch_ids),
+                    fields=self.FIELDS['videos']
                 )
-                response = request.execute()
                 
                 for video in response['items']:
                     # 영상 길이(ISO 8601)를 초 단위로 변환
@@ -193,41 +556,143 @@ class YouTubeDataCollector:
                     if days_since_upload == 0:
                         days_since_upload = 1  # 0으로 나누기 방지
                     
-                    video_data = {
-                        'video_id': video['id'],
-                        'title': video['snippet']['title'],
-                        'published_at': published_at_str,
-                        'days_since_upload': days_since_upload,
-                        'duration_seconds': duration_seconds,
-                        'duration_formatted': self._format_duration(duration_seconds),
-                        'view_count': int(video['statistics'].get('viewCount', 0)),
-                        'like_count': int(video['statistics'].get('likeCount', 0)),
-                        'comment_count': int(video['statistics'].get('commentCount', 0)),
-                        'tags': video['snippet'].get('tags', []),
-                        'thumbnail_high': video['snippet']['thumbnails'].get('high', {}).get('url', ''),
-                        'comments': [] # [NEW] 댓글 필드 초기화
-                    }
-                    
-                    # 2. [NEW] 개별 영상의 댓글 수집 로직 추가
-                    if include_comments:
-                        # 이 부분은 영상 N개만큼 API를 추가 호출합니다.
-                        comments_collected = self._get_comment_threads(
-                            video['id'], 
-                            max_comments=max_comments
-                        )
-                        video_data['comments'] = comments_collected
-                        if len(comments_collected) > 0:
-                            print(f"    [DataCollector] 💬 {video['id']} 댓글 {len(comments_collected)}개 수집 완료")
-                        else:
-                            print(f"    [DataCollector] 💬 {video['id']} 댓글 수집 실패 또는 댓글 없음")
+                    video_data = VideoRecord(
+                        video_id=video['id'],
+                        title=video['snippet']['title'],
+                        published_at=published_at_str,
+                        days_since_upload=days_since_upload,
+                        duration_seconds=duration_seconds,
+                        duration_formatted=self._format_duration(duration_seconds),
+                        view_count=int(video['statistics'].get('viewCount', 0)),
+                        like_count=int(video['statistics'].get('likeCount', 0)),
+                        comment_count=int(video['statistics'].get('commentCount', 0)),
+                        tags=video['snippet'].get('tags', []),
+                        thumbnail_high=video['snippet'].get('thumbnails', {}).get('high', {}).get('url', ''),
+                        comments=[] # [NEW] 댓글 필드 초기화
+                    )
                     
                     videos_data.append(video_data)
                     
             except HttpError as e:
+                # 재시도 후에도 실패하면 배치(최대 50개 영상)를 조용히 빼지 않고 수집 실패로 처리
                 print(f"  [DataCollector] ❌ API 오류 (Video Batch {i}): {e}")
-                continue
+                raise
+        
+        # 2. [NEW] 개별 영상의 댓글 수집 (영상 N개만큼 API를 추가 호출합니다.)
+        if include_comments and videos_data:
+            self._collect_comments(videos_data, max_comments=max_comments)
         
         return videos_data
+
+    def _fetch_comments_timed(self, video_data, max_comments, pages=None, sampler=None):
+        """
+        댓글 수집 + 소요 시간(초) 측정
+        - 적응형 샘플링 중이면 comment_count 가 0인 영상은 요청을 생략하고,
+          조기 종료한 영상에는 'comments_target' (샘플링이 없었다면 받았을 댓글 수 추정치)을 기록
+        - pages: 예산 배분으로 정해진 페이지 수 (0이면 요청 생략). 기본 수집보다 많이 받은 영상은
+          'comments_target' 를 기본 수집 기준(max_comments, 최대 1페이지)으로 기록
+          댓글이 있는데 예산이 모자라 0페이지인 영상은 'comments_error' 로 표시 (댓글 0개가 아니라 측정 안 됨)
+        - 재시도 후에도 댓글 수집에 실패하면 'comments_error' 를 표시 (지표 계산에서 댓글 0개로 보지 않도록)
+        - sampler: 이 영상에 쓸 샘플러 (None 이면 comment_sampler, 여러 채널 배치 수집 시 채널별 샘플러)
+        """
+        started = time.perf_counter()
+        if sampler is None:
+            sampler = self.comment_sampler
+        if pages == 0:
+            if video_data.get('comment_count', 0) > 0:
+                video_data['comments_error'] = True
+            return [], 0.0
+        if sampler is not None and video_data.get('comment_count', 0) == 0:
+            sampler.record_skipped()
+            return [], 0.0
+        
+        limit = max_comments if pages is None else pages * COMMENTS_PER_PAGE
+        try:
+            comments = self._get_comment_threads(video_data['video_id'], max_comments=limit, sampler=sampler)
+        except Exception:
+            video_data['comments_error'] = True
+            return [], time.perf_counter() - started
+        
+        base_comments = min(max_comments, COMMENTS_PER_PAGE)
+        if pages is not None and len(comments) > base_comments:
+            video_data['comments_target'] = base_comments
+        elif sampler is not None:
+            video_data['comments_target'] = len(comments)
+            if sampler.is_truncated(video_data['video_id']):
+                video_data['comments_target'] = max(len(comments), min(max_comments, video_data.get('comment_count', 0)))
+        return comments, time.perf_counter() - started
+
+    def _plan_comment_pages(self, videos_data, max_comments):
+        """
+        comment_budget 가 있으면 영상별 댓글 페이지 수 배분 -> {video_id: pages}, 없으면 None
+        - 'auto': 기본 수집과 같은 요청 수 (영상 수 x max_comments 페이지 수)
+        """
+        if self.comment_budget is None:
+            return None
+        if self.comment_budget == 'auto':
+            total_pages = len(videos_data) * math.ceil(max_comments / COMMENTS_PER_PAGE)
+        else:
+            total_pages = int(self.comment_budget)
+        plan = allocate_comment_pages(videos_data, total_pages)
+        print(
+            f"  [DataCollector] 🧮 댓글 예산 배분: {sum(plan.values())}/{total_pages} 페이지, "
+            f"영상당 최대 {max(plan.values(), default=0)} 페이지"
+        )
+        return plan
+
+    def _collect_comments(self, videos_data, max_comments=100, plan=None, samplers=None):
+        """
+        [NEW] videos_data 각 항목의 'comments' 를 채운다.
+        - comment_workers 개수만큼 동시에 요청 (순서/결과 형태는 순차 수집과 동일)
+        - comment_budget 가 있으면 영상별 배분 페이지 수만큼 수집, 페이지가 많은 영상부터 시작
+        - plan / samplers: 여러 채널 배치 수집용 {video_id: 페이지 수} / {video_id: 샘플러} (채널별로 미리 구성)
+        - 벽시계 시간과 순차 실행 추정 시간(개별 호출 시간 합)을 last_comment_timing 에 기록
+        """
+        workers = min(self.comment_workers, len(videos_data))
+        if plan is None:
+            plan = self._plan_comment_pages(videos_data, max_comments)
+        pages = [None if plan is None else plan[video['video_id']] for video in videos_data]
+        video_samplers = [None if samplers is None else samplers[video['video_id']] for video in videos_data]
+        started = time.perf_counter()
+        
+        if workers <= 1:
+            results = [
+                self._fetch_comments_timed(video, max_comments, video_pages, video_sampler)
+                for video, video_pages, video_sampler in zip(videos_data, pages, video_samplers)
+            ]
+        else:
+            # 페이지가 많은(오래 걸리는) 영상을 먼저 넣어 마지막에 한 영상만 남는 꼬리를 줄인다
+            order = sorted(range(len(videos_data)), key=lambda i: -(pages[i] or 0))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='yt-comments') as pool:
+                futures = {
+                    i: pool.submit(self._fetch_comments_timed, videos_data[i], max_comments, pages[i], video_samplers[i])
+                    for i in order
+                }
+                results = [futures[i].result() for i in range(len(videos_data))]
+        
+        wall_seconds = time.perf_counter() - started
+        serial_seconds = 0.0
+        
+        for video_data, (comments_collected, elapsed) in zip(videos_data, results):
+            serial_seconds += elapsed
+            video_data['comments'] = comments_collected
+            if len(comments_collected) > 0:
+                print(f"    [DataCollector] 💬 {video_data['video_id']} 댓글 {len(comments_collected)}개 수집 완료")
+            else:
+                print(f"    [DataCollector] 💬 {video_data['video_id']} 댓글 수집 실패 또는 댓글 없음")
+        
+        self.last_comment_timing = {
+            'videos': len(videos_data),
+            'workers': workers,
+            'wall_seconds': round(wall_seconds, 3),
+            'serial_seconds': round(serial_seconds, 3),
+            'speedup': round(serial_seconds / wall_seconds, 2) if wall_seconds > 0 else 1.0,
+        }
+        print(
+            f"  [DataCollector] ⏱️ 댓글 수집 시간: 실제 {wall_seconds:.2f}초 / "
+            f"순차 기준 {serial_seconds:.2f}초 (workers={workers}, "
+            f"x{self.last_comment_timing['speedup']:.1f})"
+        )
     
     def _format_duration(self, seconds):
         """영상 길이를 읽기 쉬운 형식으로 변환"""
@@ -240,9 +705,10 @@ class YouTubeDataCollector:
         else:
             return f"{minutes}:{secs:02d}"
     
-    def collect_full_data(self, channel_id, max_videos=50, months_back=6):
+    def collect_full_data(self, channel_id, max_videos=50, months_back=6, max_comments=100):
         """
         [수정됨] 채널의 전체 데이터 수집 (원스톱, 댓글 포함)
+        - max_comments: 영상당 댓글 수집 상한 (quota 부족 시 낮춰서 호출)
         """
         print(f"  [DataCollector] 📊 채널 정보 수집 중...")
         channel_info = self.get_channel_info(channel_id)
@@ -269,7 +735,166 @@ class YouTubeDataCollector:
             }
 
         print(f"\n  [DataCollector] 📝 영상 상세 정보 및 댓글 수집 중... (시간 소요)")
-        videos_data = self.get_video_details(video_ids, include_comments=True, max_comments=100)
+        videos_data = self.get_video_details(video_ids, include_comments=True, max_comments=max_comments)
+        
+        self._print_collection_stats(videos_data)
+        
+        return {
+            'channel': channel_info,
+            'videos': videos_data,
+            'collection_date': datetime.now().isoformat(),
+            'analysis_period_months': months_back
+        }
+
+    def collect_batch_data(self, channel_ids, max_videos=50, months_back=6, max_comments=100):
+        """
+        여러 채널을 한 번에 수집 (전체 재채점 등)
+        - 반환: {channel_id: collect_full_data 와 같은 형식의 dict, 채널을 찾지 못하면 None}
+        - 채널 정보: channels().list 50개 단위 배치
+        - 영상 목록: 채널별 목록 조회를 스레드 풀에서 동시에
+        - 영상 통계: 모든 채널의 영상 ID 를 모아 50개씩 꽉 채운 videos().list 로 조회
+        - 댓글: 전체 영상을 하나의 스레드 풀(comment_workers)에서 수집
+          (comment_budget 배분과 적응형 샘플러의 채널 누적 비율은 채널별로 따로 계산)
+        """
+        channel_ids = list(dict.fromkeys(channel_ids))
+        print(f"  [DataCollector] 📊 채널 {len(channel_ids)}개 정보 수집 중... (배치)")
+        channel_infos = self.get_channels_info(channel_ids)
+        missing = [channel_id for channel_id in channel_ids if channel_id not in channel_infos]
+        if missing:
+            print(f"  [DataCollector] ❌ 채널을 찾을 수 없습니다: {', '.join(missing)}")
+        found = [channel_id for channel_id in channel_ids if channel_id in channel_infos]
+
+        print(f"\n  [DataCollector] 🎬 채널별 최근 {months_back}개월 영상 ID 수집 중...")
+        with ThreadPoolExecutor(max_workers=self.comment_workers, thread_name_prefix='yt-batch') as pool:
+            listing_futures = {
+                channel_id: pool.submit(self.get_channel_videos, channel_id, max_videos, months_back)
+                for channel_id in found
+            }
+            channel_video_ids = {channel_id: future.result() for channel_id, future in listing_futures.items()}
+
+            # 채널 경계와 무관하게 50개씩 묶어서 조회 (채널마다 따로 하면 마지막 배치가 덜 찬다)
+            all_ids = list(dict.fromkeys(
+                video_id for channel_id in found for video_id in channel_video_ids[channel_id]
+            ))
+            print(f"  [DataCollector] ✅ 영상 {len(all_ids)}개 발견 -> videos().list {math.ceil(len(all_ids) / 50)}회")
+            detail_futures = [
+                pool.submit(self.get_video_details, all_ids[i:i+50], include_comments=False)
+                for i in range(0, len(all_ids), 50)
+            ]
+            details = {video['video_id']: video for future in detail_futures for video in future.result()}
+
+        channel_videos = {
+            channel_id: [details[video_id] for video_id in channel_video_ids[channel_id] if video_id in details]
+            for channel_id in found
+        }
+        all_videos = [video for channel_id in found for video in channel_videos[channel_id]]
+
+        plan = None
+        if self.comment_budget is not None:
+            plan = {}
+            for channel_id in found:
+                if channel_videos[channel_id]:
+                    plan.update(self._plan_comment_pages(channel_videos[channel_id], max_comments))
+
+        samplers = None
+        if self.comment_sampler is not None:
+            samplers = {}
+            for channel_id in found:
+                channel_sampler = self.comment_sampler.spawn()
+                for video in channel_videos[channel_id]:
+                    samplers[video['video_id']] = channel_sampler
+
+        if all_videos:
+            print(f"\n  [DataCollector] 📝 {len(found)}개 채널 댓글 수집 중... (공유 worker {self.comment_workers}개)")
+            self._collect_comments(all_videos, max_comments=max_comments, plan=plan, samplers=samplers)
+            self._print_collection_stats(all_videos)
+
+        collection_date = datetime.now().isoformat()
+        results = {channel_id: None for channel_id in channel_ids}
+        for channel_id in found:
+            results[channel_id] = {
+                'channel': channel_infos[channel_id],
+                'videos': channel_videos[channel_id],
+                'collection_date': collection_date,
+                'analysis_period_months': months_back
+            }
+        return results
+
+    def _with_comments(self, video_data, max_comments, pages=None):
+        """영상 1개의 댓글을 채워서 반환 (스트리밍 수집용)"""
+        comments, _ = self._fetch_comments_timed(video_data, max_comments, pages)
+        video_data['comments'] = comments
+        if len(comments) > 0:
+            print(f"    [DataCollector] 💬 {video_data['video_id']} 댓글 {len(comments)}개 수집 완료")
+        else:
+            print(f"    [DataCollector] 💬 {video_data['video_id']} 댓글 수집 실패 또는 댓글 없음")
+        return video_data
+
+    def iter_video_records(self, video_ids, max_comments=100):
+        """
+        [NEW] 영상 레코드(댓글 포함)를 댓글 수집이 끝나는 순서대로 yield 하는 제너레이터
+        - 통계는 50개 배치로 조회, 댓글은 comment_workers 스레드로 동시 수집
+        - 동시에 메모리에 머무는 레코드 수를 comment_workers * 2 로 제한
+        - 소비자가 레코드를 처리하는 동안 다음 댓글 요청이 계속 진행됨
+        - comment_budget 가 있으면 배분을 위해 통계를 먼저 모두 조회
+        """
+        if self.comment_budget is None:
+            plan = None
+            batches = (
+                self.get_video_details(video_ids[i:i+50], include_comments=False)
+                for i in range(0, len(video_ids), 50)
+            )
+        else:
+            all_videos = self.get_video_details(video_ids, include_comments=False)
+            plan = self._plan_comment_pages(all_videos, max_comments)
+            batches = [all_videos]
+        
+        window = self.comment_workers * 2
+        with ThreadPoolExecutor(max_workers=self.comment_workers, thread_name_prefix='yt-comments') as pool:
+            pending = set()
+            for batch in batches:
+                for video_data in batch:
+                    while len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                    video_pages = None if plan is None else plan[video_data['video_id']]
+                    pending.add(pool.submit(self._with_comments, video_data, max_comments, video_pages))
+            
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+    def stream_full_data(self, channel_id, max_videos=50, months_back=6, max_comments=100):
+        """
+        [NEW] collect_full_data 의 스트리밍 버전
+        - 반환 형식은 같지만 'videos' 가 영상 레코드 제너레이터 (iter_video_records)
+        - MetricsCalculator.analyze_video_stream() 으로 소비하면 댓글 원문을 들고 있지 않아도 됨
+        """
+        print(f"  [DataCollector] 📊 채널 정보 수집 중... (스트리밍 모드)")
+        channel_info = self.get_channel_info(channel_id)
+        
+        if not channel_info:
+            print("  [DataCollector] ❌ 채널을 찾을 수 없습니다.")
+            return None
+        
+        print(f"  [DataCollector] ✅ 채널: {channel_info['channel_name']}")
+        
+        video_ids = self.get_channel_videos(channel_id, max_videos, months_back)
+        print(f"  [DataCollector] ✅ 영상 {len(video_ids)}개 발견 (최대 {max_videos}개)")
+        
+        return {
+            'channel': channel_info,
+            'videos': self.iter_video_records(video_ids, max_comments=max_comments),
+            'collection_date': datetime.now().isoformat(),
+            'analysis_period_months': months_back
+        }
+
+    def _print_collection_stats(self, videos_data):
+        """댓글 수집 통계 + 캐시 통계 출력"""
+        if not videos_data:
+            return
         
         # 댓글 수집 통계
         total_comments = sum(len(video.get('comments', [])) for video in videos_data)
@@ -281,16 +906,114 @@ class YouTubeDataCollector:
         print(f"     - 전체 수집 댓글: {total_comments:,}개")
         print(f"     - 댓글 수집된 영상: {videos_with_comments}/{len(videos_data)}개 ({videos_with_comments/len(videos_data)*100:.1f}%)")
         print(f"     - 영상당 평균 댓글: {avg_comments:.1f}개")
+        failed = sum(1 for video in videos_data if video.get('comments_error'))
+        if failed:
+            print(f"     - 댓글 미수집 영상: {failed}개 (수집 실패 / 예산 제외, 댓글 지표 계산에서 제외)")
+        
+        retry_stats = self.retry_policy.summary()
+        if retry_stats['retries'] or retry_stats['gave_up']:
+            print(
+                f"  [DataCollector] 🔁 재시도 {retry_stats['retries']}회, 포기 {retry_stats['gave_up']}회, "
+                f"서킷 {retry_stats['circuits']}"
+            )
+        
+        if self.cache is not None:
+            cache_stats = self.cache.stats()
+            print(f"  [DataCollector] 🗄️ 응답 캐시: hit {cache_stats['hits']} / miss {cache_stats['misses']}")
+        
+        # 배치 수집은 채널별 샘플러를 쓰므로 공용 샘플러 통계가 비어 있으면 생략
+        sample_stats = self.comment_sampler.summary() if self.comment_sampler is not None else None
+        if sample_stats and (sample_stats['videos_sampled'] or sample_stats['videos_skipped']):
+            print(
+                f"  [DataCollector] 🎯 적응형 샘플링: 필요 댓글 {sample_stats['comments_needed']:,}개, "
+                f"조기 종료 {sample_stats['videos_stopped_early']}개 영상, 요청 생략 {sample_stats['videos_skipped']}개 영상 "
+                f"(Problem {sample_stats['problem_rate']*100:.1f}% ±{sample_stats['problem_half_width']*100:.1f}%p)"
+            )
+        
+        # API 키 풀 통계 (키가 여러 개일 때만)
+        if len(self.key_pool) > 1:
+            usage = ", ".join(
+                f"{k['key']} {k['units']}u{' (소진)' if k['exhausted'] else ''}"
+                for k in self.key_pool.usage()
+            )
+            print(f"  [DataCollector] 🔑 API 키 사용량: {usage}")
+
+    def collect_delta_data(self, channel_id, previous, max_videos=50, months_back=6, max_comments=100):
+        """
+        [NEW] 이전 스냅샷(previous: collect_full_data 결과) 기준 증분 수집
+        - 스냅샷 이후 새로 올라온 영상만 목록/상세/댓글 수집
+        - 기존 영상은 videos().list(50개 배치)로 통계만 갱신
+        - comment_count 가 바뀐 영상만 댓글을 다시 수집 (재사용하는 영상은 이전 comments_target 도 유지)
+        """
+        print(f"  [DataCollector] 📊 채널 정보 수집 중... (증분 모드)")
+        channel_info = self.get_channel_info(channel_id)
+        
+        if not channel_info:
+            print("  [DataCollector] ❌ 채널을 찾을 수 없습니다.")
+            return None
+        
+        previous_collected_at = datetime.fromisoformat(previous['collection_date'])
+        if previous_collected_at.tzinfo is None:
+            previous_collected_at = previous_collected_at.astimezone(timezone.utc)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=months_back*30)
+        
+        # 1. 스냅샷 이후 새 영상 (게시 반영 지연을 고려해 1일 겹쳐서 조회)
+        previous_videos = {video['video_id']: video for video in previous.get('videos', [])}
+        listed_ids = self.get_channel_videos(
+            channel_id, max_videos, months_back,
+            published_after=previous_collected_at - timedelta(days=1)
+        )
+        # 목록은 최신순이므로 max_videos 를 넘는 새 영상은 상세/댓글 수집 전에 제외
+        new_ids = [video_id for video_id in listed_ids if video_id not in previous_videos][:max_videos]
+        
+        # 2. 분석 기간 안에 남아 있는 기존 영상 (새 영상을 채우고 남은 자리만큼 최신순으로)
+        existing = sorted(
+            (
+                video for video in previous_videos.values()
+                if datetime.fromisoformat(video['published_at'].replace('Z', '+00:00')) >= cutoff
+            ),
+            key=lambda v: v['published_at'], reverse=True
+        )
+        existing_ids = [video['video_id'] for video in existing[:max(max_videos - len(new_ids), 0)]]
+        print(f"  [DataCollector] ✅ 새 영상 {len(new_ids)}개 / 기존 영상 {len(existing_ids)}개")
+        
+        new_videos = self.get_video_details(new_ids, include_comments=True, max_comments=max_comments) if new_ids else []
+        refreshed = self.get_video_details(existing_ids, include_comments=False) if existing_ids else []
+        
+        # 3. comment_count 가 바뀐(또는 지난번 댓글 수집에 실패한) 영상만 댓글 재수집, 나머지는 이전 댓글 재사용
+        changed = []
+        for video in refreshed:
+            prev = previous_videos[video['video_id']]
+            if video['comment_count'] != prev.get('comment_count') or prev.get('comments_error'):
+                changed.append(video)
+            else:
+                video['comments'] = prev.get('comments', [])
+                # 샘플링/예산 배분으로 받은 댓글이면 보정 기준도 함께 (없으면 demand_index 가 샘플 비율만큼 틀어짐)
+                video['comments_target'] = prev.get('comments_target')
+        if changed:
+            self._collect_comments(changed, max_comments=max_comments)
+        
+        videos_data = sorted(new_videos + refreshed, key=lambda v: v['published_at'], reverse=True)[:max_videos]
+        print(f"  [DataCollector] ♻️ 증분 수집: 새 영상 {len(new_videos)}개, 통계 갱신 {len(refreshed)}개, 댓글 재수집 {len(changed)}개")
+        
+        self._print_collection_stats(videos_data)
         
         return {
             'channel': channel_info,
             'videos': videos_data,
             'collection_date': datetime.now().isoformat(),
-            'analysis_period_months': months_back
+            'analysis_period_months': months_back,
+            'delta': {
+                'base_collection_date': previous['collection_date'],
+                'new_videos': len(new_videos),
+                'refreshed_videos': len(refreshed),
+                'comments_refetched': len(changed),
+            }
         }
     
     def save_to_json(self, data, filename='channel_data.json'):
         """수집한 데이터를 JSON 파일로 저장"""
+        data = {**data, 'videos': videos_to_dicts(data.get('videos', []))}
         with open(filename, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"\n  [DataCollector] 💾 데이터 저장 완료: {filename}")
@@ -312,11 +1035,8 @@ if __name__ == "__main__":
         channel_query = "@bbomni" 
         
         print(f"🔍 채널 ID 검색 중: {channel_query}")
-        CHANNEL_ID = channel_query
-        
-        # UC로 시작하지 않으면 ID 검색 시도
-        if not channel_query.startswith("UC"):
-            CHANNEL_ID = collector.get_channel_id_from_username(channel_query)
+        # UC 채널 ID/URL 이 아니면 ID 검색 시도
+        CHANNEL_ID = collector.get_channel_id_from_username(channel_query)
         
         if not CHANNEL_ID:
             print("❌ 채널을 찾을 수 없습니다.")
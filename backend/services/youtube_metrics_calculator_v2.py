@@ -15,7 +15,10 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 from collections import Counter
-import re
+from itertools import chain
+
+from services.keyword_matcher import KeywordMatcher
+from services.youtube_video_record import videos_to_frame
 
 class MetricsCalculator:
     
@@ -50,6 +53,97 @@ class MetricsCalculator:
             "videos_per_week_benchmark": 1.0,
         }
     }
+
+    # 조회·참여 프로파일 영상 지표
+    PROFILE_METRICS = [
+        'views_per_day', 'engagement_per_1k',
+        'likes_per_view', 'comments_per_view',
+        'demand_index', 'problem_rate'
+    ]
+
+    # 구독자 수 하한 -> Tier (큰 값부터)
+    TIER_THRESHOLDS = [
+        (500_000, "Tier_1_Major"),
+        (100_000, "Tier_2_Mid"),
+        (10_000, "Tier_3_Rising"),
+        (0, "Tier_4_Emerging"),
+    ]
+
+    # BLC 가중치 (합계 1.0, 계산 순서 = 나열 순서)
+    BLC_WEIGHTS = {
+        "engagement_score": 0.30,
+        "views_score": 0.25,
+        "demand_score": 0.15,
+        "problem_score": 0.10,
+        "format_score": 0.10,
+        "consistency_score": 0.10,
+    }
+    ENGAGEMENT_FULL_MARK_RATIO = 1.5  # 벤치마크 1.5배를 만점 기준
+    DEMAND_MAX_THRESHOLD = 5.0  # 0.5% = 5.0 per 1K views 이상이면 만점
+    PROBLEM_MAX_THRESHOLD = 0.005  # 0.5% 이상이면 만점 (기존 0.2%에서 상향)
+    PROBLEM_FULL_MARK_RATIO = 2.0  # 벤치마크 2배를 만점 기준
+    FORMAT_DEFAULT_SCORE = 50  # 포맷 효과 분석 불가 시 기본값
+
+    # BLC 점수 하한 -> 판정 (5단계, 큰 값부터)
+    VERDICTS = [
+        (80, "S (즉시 Go)"),
+        (65, "A (Go)"),
+        (50, "B (조건부 Go)"),
+        (35, "C (보류)"),
+        (0, "D (부적합)"),
+    ]
+
+    # BLC 매칭 결과 (get_blc_matching 규칙이 고르는 key)
+    BLC_MATCHING_PROFILES = {
+        "premium": {
+            "category": "프리미엄·전문가 카테고리",
+            "image": "신뢰·권위·전문가형",
+            "skincare": "고기능성 세럼/앰플/크림",
+            "product_type": "프리미엄 집중케어 라인",
+        },
+        "trend": {
+            "category": "트렌드·큐레이터 카테고리",
+            "image": "트렌디·혁신·인플루언서형",
+            "skincare": "신제품/한정판/컬러",
+            "product_type": "시즌 트렌드 라인",
+        },
+        "daily": {
+            "category": "데일리·입문자 카테고리",
+            "image": "실용·안심·친절한 가이드형",
+            "skincare": "토너/로션/클렌징/저자극",
+            "product_type": "베이직 루틴 세트",
+        },
+        "solution": {
+            "category": "피부타입별·솔루션 카테고리",
+            "image": "전문가 코치·카운슬링형",
+            "skincare": "피부타입별 라인(건성/지성/민감)",
+            "product_type": "맞춤형 솔루션 라인",
+        },
+        "general_balanced": {
+            "category": "일반 스킨케어 카테고리",
+            "image": "신뢰·균형·안정형",
+            "skincare": "올인원/에센스/크림",
+            "product_type": "데일리 기능성 제품",
+        },
+        "intensive": {
+            "category": "기능성·집중케어 카테고리",
+            "image": "문제해결·전문가형",
+            "skincare": "앰플/세럼/고농축 라인",
+            "product_type": "집중 케어 솔루션",
+        },
+        "general_practical": {
+            "category": "일반 스킨케어 카테고리",
+            "image": "친근·실용형",
+            "skincare": "로션/크림/마스크팩",
+            "product_type": "데일리 케어 제품",
+        },
+        "growth": {
+            "category": "성장 필요 카테고리",
+            "image": "성장 단계·잠재력 모니터링",
+            "skincare": "기초 제품 협업 가능",
+            "product_type": "샘플/체험 키트",
+        },
+    }
     
     # Demand 키워드 (구매/사용 인증·긍정 경험)
     DEMAND_KEYWORDS = [
@@ -100,19 +194,25 @@ class MetricsCalculator:
         "좀 알려", "알려줘", "추천해줘"
     ]
 
-    def __init__(self, raw_data: dict):
-        """지표 계산기 초기화"""
+    def __init__(self, raw_data: dict, benchmarks: dict = None):
+        """
+        지표 계산기 초기화
+        - benchmarks: Tier별 벤치마크 (None 이면 BENCHMARKS, 보정값은 tier_benchmark_service.get_tier_benchmarks)
+        """
         if not raw_data or 'channel' not in raw_data or 'videos' not in raw_data:
             raise ValueError("입력된 raw_data 형식이 올바르지 않습니다.")
             
         self.data = raw_data
         self.channel_info = self.data['channel']
-        self.videos_df = pd.DataFrame(self.data['videos'])
+        # 분석 결과 캐시 (videos_df 를 교체하면 비워짐)
+        self._analysis_cache = {}
+        self.videos_df = videos_to_frame(self.data['videos'])
         
         # [NEW] Tier 및 벤치마크 설정
         self.subscriber_count = self.channel_info.get('subscriber_count', 0)
         self.tier = self._get_tier()
-        self.benchmark = self.BENCHMARKS[self.tier]
+        self.benchmarks = benchmarks or self.BENCHMARKS
+        self.benchmark = self.benchmarks[self.tier]
         
         # 댓글 샘플 저장용
         self.demand_comment_samples = []
@@ -126,16 +226,30 @@ class MetricsCalculator:
     
     def _get_tier(self) -> str:
         """[NEW] 구독자 수로 Tier 결정"""
-        if self.subscriber_count >= 500_000:
-            return "Tier_1_Major"
-        elif self.subscriber_count >= 100_000:
-            return "Tier_2_Mid"
-        elif self.subscriber_count >= 10_000:
-            return "Tier_3_Rising"
-        else:
-            return "Tier_4_Emerging"
+        for min_subscribers, tier in self.TIER_THRESHOLDS:
+            if self.subscriber_count >= min_subscribers:
+                return tier
+        return self.TIER_THRESHOLDS[-1][1]
     
-    def _analyze_comments(self, comments: list) -> dict:
+    @classmethod
+    def _keyword_matcher(cls) -> KeywordMatcher:
+        """Demand/Problem 키워드 matcher (클래스당 1회 생성, 하위 클래스가 키워드를 바꾸면 따로 생성)"""
+        matcher = cls.__dict__.get('_compiled_matcher')
+        if matcher is None:
+            matcher = KeywordMatcher({
+                'demand': cls.DEMAND_KEYWORDS,
+                'problem': cls.PROBLEM_KEYWORDS,
+            })
+            cls._compiled_matcher = matcher
+        return matcher
+
+    @classmethod
+    def classify_comment(cls, comment_text: str) -> tuple:
+        """[NEW] 댓글 1개 -> (Demand 여부, Problem 여부). 적응형 샘플링의 분류 기준"""
+        return cls._keyword_matcher().flags(comment_text)
+
+    @classmethod
+    def _analyze_comments(cls, comments: list) -> dict:
         """댓글 분석: Demand와 Problem (매칭 샘플 포함)"""
         if not comments or not isinstance(comments, list):
             return {
@@ -152,25 +266,12 @@ class MetricsCalculator:
         demand_samples = []  # 매칭된 Demand 댓글 샘플 (최대 3개)
         problem_samples = []  # 매칭된 Problem 댓글 샘플 (최대 3개)
         
-        try:
-            demand_pattern = re.compile('|'.join(self.DEMAND_KEYWORDS), re.IGNORECASE)
-            problem_pattern = re.compile('|'.join(self.PROBLEM_KEYWORDS), re.IGNORECASE)
-        except re.error as e:
-            print(f"  [MetricsCalculator] ❌ 키워드 정규식 컴파일 오류: {e}")
-            return {
-                'demand_count': 0, 
-                'problem_count': 0, 
-                'total_analyzed_comments': total_comments,
-                'demand_samples': [],
-                'problem_samples': []
-            }
+        # 댓글 전체를 Aho-Corasick automaton 으로 한 번에 훑는다
+        flags = cls._keyword_matcher().flags_many(comments)
         
-        for comment_text in comments:
-            if not isinstance(comment_text, str):
-                continue
-            
+        for comment_text, (is_demand, is_problem) in zip(comments, flags):
             # Demand 키워드 매칭
-            if demand_pattern.search(comment_text):
+            if is_demand:
                 demand_count += 1
                 if len(demand_samples) < 3:  # 최대 3개 샘플만 저장
                     # 댓글 길이 제한 (100자)
@@ -178,7 +279,7 @@ class MetricsCalculator:
                     demand_samples.append(sample)
             
             # Problem 키워드 매칭
-            if problem_pattern.search(comment_text):
+            if is_problem:
                 problem_count += 1
                 if len(problem_samples) < 3:  # 최대 3개 샘플만 저장
                     # 댓글 길이 제한 (100자)
@@ -193,6 +294,64 @@ class MetricsCalculator:
             'problem_samples': problem_samples
         }
 
+    @classmethod
+    def _analyze_comment_column(cls, comments: pd.Series) -> pd.DataFrame:
+        """
+        영상별 댓글 목록 열 전체를 한 번에 분석 (_analyze_comments 를 영상마다 부른 것과 같은 결과)
+        - 댓글을 (영상 위치, 댓글) 한 줄로 펼쳐 키워드 적중 여부를 한 번에 계산 (KeywordMatcher.flag_matrix)
+        - 영상별 개수는 bincount, 샘플(영상당 최대 3개)은 정렬된 영상 위치로 잘라서 집계
+        """
+        n_videos = len(comments)
+        lists = [c if isinstance(c, list) and c else [] for c in comments]
+        lengths = np.fromiter((len(c) for c in lists), dtype=np.int64, count=n_videos)
+        texts = list(chain.from_iterable(lists))
+        positions = np.repeat(np.arange(n_videos), lengths)
+        
+        flags = cls._keyword_matcher().flag_matrix(texts)
+        is_demand, is_problem = flags[:, 0], flags[:, 1]
+        
+        video_starts = np.arange(n_videos)
+        
+        def samples(mask):
+            # 영상당 앞에서부터 3개 (positions 가 정렬돼 있으므로 영상 안 순번 = 위치 - 영상 첫 위치)
+            matched_videos = positions[mask]
+            rank = np.arange(len(matched_videos)) - np.searchsorted(matched_videos, matched_videos, side='left')
+            keep = np.flatnonzero(mask)[rank < 3]
+            kept_videos = positions[keep]
+            # 100자 초과분은 '...' 로 자름
+            text = pd.Series([texts[i] for i in keep], dtype=object)
+            truncated = (text.str.slice(0, 100) + np.where(text.str.len() > 100, '...', '')).tolist()
+            starts = np.searchsorted(kept_videos, video_starts, side='left').tolist()
+            ends = np.searchsorted(kept_videos, video_starts, side='right').tolist()
+            return [truncated[start:end] for start, end in zip(starts, ends)]
+        
+        return pd.DataFrame({
+            'demand_count': np.bincount(positions[is_demand], minlength=n_videos),
+            'problem_count': np.bincount(positions[is_problem], minlength=n_videos),
+            'total_analyzed_comments': lengths,
+            'demand_samples': samples(is_demand),
+            'problem_samples': samples(is_problem),
+        }, index=comments.index)
+
+    @classmethod
+    def analyze_video_stream(cls, video_records) -> list:
+        """
+        [NEW] 영상 레코드 스트림(YouTubeDataCollector.iter_video_records)을 받는 즉시 댓글 분석
+        - 레코드마다 Demand/Problem 카운트와 샘플만 남기고 댓글 원문은 버린다
+        - 반환된 목록을 raw_data['videos'] 로 넘기면 __init__ 에서 댓글 분석을 건너뜀
+        - 댓글 총량과 관계없이 메모리는 영상 수에만 비례
+        """
+        analyzed = []
+        for record in video_records:
+            record = dict(record)
+            comments = record.pop('comments', [])
+            record.update(cls._analyze_comments(comments))
+            analyzed.append(record)
+        
+        # 수집 완료 순서와 무관하게 최신 업로드순으로 정렬 (collect_full_data 와 동일한 순서)
+        analyzed.sort(key=lambda v: v.get('published_at', ''), reverse=True)
+        return analyzed
+
     def _calculate_basic_metrics(self):
         """기본 지표 계산"""
         if len(self.videos_df) == 0:
@@ -211,11 +370,14 @@ class MetricsCalculator:
         df['comments_per_view'] = df['comment_count'] / df['view_count']
         df['length_bucket'] = df['duration_seconds'].apply(self._classify_length)
 
-        print("  [MetricsCalculator] 💬 댓글 텍스트 키워드 분석 중...")
-        
-        comment_stats = df['comments'].apply(self._analyze_comments)
-        comment_stats_df = comment_stats.apply(pd.Series)
-        df = pd.concat([df, comment_stats_df], axis=1)
+        if 'total_analyzed_comments' in df.columns:
+            # 스트리밍 모드: analyze_video_stream() 에서 이미 분석됨
+            print("  [MetricsCalculator] 💬 댓글 분석 결과 재사용 (스트리밍 모드)")
+        else:
+            print("  [MetricsCalculator] 💬 댓글 텍스트 키워드 분석 중...")
+            
+            comment_stats_df = self._analyze_comment_column(df['comments'])
+            df = pd.concat([df, comment_stats_df], axis=1)
 
         # 댓글 수집 통계 출력
         total_comments_collected = df['total_analyzed_comments'].sum()
@@ -226,23 +388,31 @@ class MetricsCalculator:
         print(f"  [MetricsCalculator] 📊 댓글 통계:")
         print(f"     - 전체 수집 댓글: {total_comments_collected:,}개")
         print(f"     - 영상당 평균: {avg_comments_per_video:.1f}개")
-        print(f"     - Demand 매칭: {total_demand_matches}개 ({total_demand_matches/total_comments_collected*100:.2f}%)")
-        print(f"     - Problem 매칭: {total_problem_matches}개 ({total_problem_matches/total_comments_collected*100:.2f}%)")
+        if total_comments_collected > 0:
+            print(f"     - Demand 매칭: {total_demand_matches}개 ({total_demand_matches/total_comments_collected*100:.2f}%)")
+            print(f"     - Problem 매칭: {total_problem_matches}개 ({total_problem_matches/total_comments_collected*100:.2f}%)")
 
         # Demand Index (구매/사용 인증 댓글 / 1,000뷰)
-        df['demand_index'] = (df['demand_count'] * 1000) / df['view_count']
+        # 적응형 샘플링 / 예산 배분으로 기본 수집과 다른 수의 댓글을 받은 영상은
+        # 기본 수집 기준 댓글 수(comments_target)로 보정
+        demand_count = df['demand_count']
+        if 'comments_target' in df.columns:
+            sample_scale = (
+                df['comments_target'] / df['total_analyzed_comments'].where(df['total_analyzed_comments'] > 0)
+            ).fillna(1.0)
+            demand_count = demand_count * sample_scale
+        df['demand_index'] = (demand_count * 1000) / df['view_count']
         
         # Problem Rate (문제 댓글 / 전체 댓글)
         df['problem_rate'] = df['problem_count'] / (df['total_analyzed_comments'] + 1e-6)
         
-        # 매칭 샘플 수집 (전체 영상에서)
+        # 매칭 샘플 수집 (전체 영상에서, 영상 순서대로)
         all_demand_samples = []
         all_problem_samples = []
-        for idx, row in df.iterrows():
-            if 'demand_samples' in row and isinstance(row['demand_samples'], list):
-                all_demand_samples.extend(row['demand_samples'])
-            if 'problem_samples' in row and isinstance(row['problem_samples'], list):
-                all_problem_samples.extend(row['problem_samples'])
+        if 'demand_samples' in df.columns:
+            all_demand_samples = list(chain.from_iterable(s for s in df['demand_samples'] if isinstance(s, list)))
+        if 'problem_samples' in df.columns:
+            all_problem_samples = list(chain.from_iterable(s for s in df['problem_samples'] if isinstance(s, list)))
         
         # 최대 10개 샘플만 유지 (중복 제거)
         self.demand_comment_samples = list(dict.fromkeys(all_demand_samples))[:10]
@@ -251,9 +421,39 @@ class MetricsCalculator:
         df = df.replace([np.inf, -np.inf], np.nan)
         df = df.fillna(0)
         
+        # 댓글을 받지 못한 영상(재시도 후에도 수집 실패 / 예산 제외)은 댓글 0개가 아니라 '측정 안 됨'(NaN)으로 둔다
+        # (fillna 이후에 적용해야 median / mean 집계에서 제외됨)
+        if 'comments_error' in df.columns:
+            failed = df['comments_error'].astype(bool)
+            df.loc[failed, ['demand_index', 'problem_rate']] = np.nan
+        
         self.videos_df = df
         print(f"  [MetricsCalculator] ✅ {len(self.videos_df)}개 비디오 전처리 완료")
     
+    @property
+    def videos_df(self) -> pd.DataFrame:
+        return self._videos_df
+
+    @videos_df.setter
+    def videos_df(self, df: pd.DataFrame):
+        """영상 DataFrame 교체 시 이전 분석 결과 캐시 무효화"""
+        self._videos_df = df
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        """
+        분석 결과 캐시 비우기
+        - videos_df 를 새로 대입하면 자동 호출
+        - videos_df 의 값을 제자리에서(in-place) 고친 경우에는 직접 호출해야 함
+        """
+        self._analysis_cache.clear()
+
+    def _cached(self, key, compute):
+        """key 별로 1번만 계산 (같은 인스턴스에서 재호출 시 저장된 결과 반환)"""
+        if key not in self._analysis_cache:
+            self._analysis_cache[key] = compute()
+        return self._analysis_cache[key]
+
     def _classify_length(self, seconds):
         """영상 길이 구간 분류"""
         if seconds < 60: return "0-60초"
@@ -264,26 +464,26 @@ class MetricsCalculator:
     
     def get_performance_profile(self):
         """조회·참여 프로파일"""
+        return self._cached('performance_profile', self._compute_performance_profile)
+
+    def _compute_performance_profile(self):
         if self.videos_df.empty:
             return {}
             
         df = self.videos_df
         profile = {}
-        
-        metrics_to_agg = [
-            'views_per_day', 'engagement_per_1k', 
-            'likes_per_view', 'comments_per_view',
-            'demand_index', 'problem_rate'
-        ]
-        
-        for metric in metrics_to_agg:
+        for metric in self.PROFILE_METRICS:
             if metric in df.columns:
-                profile[f'{metric}_median'] = float(df[metric].median())
-                profile[f'{metric}_mean'] = float(df[metric].mean())
+                profile[f'{metric}_median'] = self._metric_median(metric)
+                profile[f'{metric}_mean'] = float(np.nan_to_num(df[metric].mean()))
                 profile[f'{metric}_std'] = float(df[metric].std())
             
         return profile
-    
+
+    def _metric_median(self, metric: str) -> float:
+        """영상 지표 median (측정 안 됨(NaN) 영상은 제외, 모든 영상이 측정 안 됨이면 0)"""
+        return float(np.nan_to_num(self.videos_df[metric].median()))
+
     def analyze_format_effect(self):
         """
         [수정됨 V2.3] 포맷 효과 분석
@@ -292,6 +492,9 @@ class MetricsCalculator:
         - 최소 샘플 수 체크
         - 0 나누기 방지
         """
+        return self._cached('format_effect', self._compute_format_effect)
+
+    def _compute_format_effect(self):
         if self.videos_df.empty:
             return {}
         
@@ -359,6 +562,12 @@ class MetricsCalculator:
     
     def analyze_upload_consistency(self, recent_weeks=12):
         """업로드 일관성 분석"""
+        return self._cached(
+            ('upload_consistency', recent_weeks),
+            lambda: self._compute_upload_consistency(recent_weeks),
+        )
+
+    def _compute_upload_consistency(self, recent_weeks):
         if self.videos_df.empty:
             return None
             
@@ -405,28 +614,28 @@ class MetricsCalculator:
         - Problem Score (10점): 0.5% 이상이면 만점 (기존 0.2%에서 상향), 벤치마크 2배를 만점 기준
         - Format Fit Score (10점): 상대적 % 방식, 50% 개선 = 100점 기준 (2배 스케일링)
         """
+        return self._cached('blc_score', self._compute_blc_score)
+
+    def _compute_blc_score(self):
         if self.videos_df.empty:
             return {'blc_score': 0.0, 'verdict': 'N/A', 'components': {}, 'tier': self.tier}
 
         # 1. Engagement Score (30%)
         # [수정됨 V2.4] 더 엄격한 기준 적용: 벤치마크의 1.5배를 만점 기준으로 설정
-        eng_median = self.videos_df['engagement_per_1k'].median()
-        engagement_benchmark_adjusted = self.benchmark['engagement_per_1k'] * 1.5  # 벤치마크 1.5배를 만점 기준
+        eng_median = self._metric_median('engagement_per_1k')
+        engagement_benchmark_adjusted = self.benchmark['engagement_per_1k'] * self.ENGAGEMENT_FULL_MARK_RATIO
         eng_score = min((eng_median / engagement_benchmark_adjusted) * 100, 100)
         
         # 2. Views Score (25%)
-        vpd_median = self.videos_df['views_per_day'].median()
+        vpd_median = self._metric_median('views_per_day')
         views_score = min((vpd_median / self.benchmark['views_per_day']) * 100, 100)
         
         # 3. Demand Score (15%)
         # Demand Index = 댓글 중 구매/사용 인증 댓글 수 / 1,000뷰
-        demand_index_median = self.videos_df['demand_index'].median()
+        demand_index_median = self._metric_median('demand_index')
         
         # 만점 기준: 0.5% 이상이면 만점 (Demand per 1K views = 5.0 이상)
-        # 0.5% = 0.005 = 5.0 per 1K views
-        DEMAND_MAX_THRESHOLD = 5.0  # 0.5% = 5.0 per 1K views
-        
-        if demand_index_median >= DEMAND_MAX_THRESHOLD:
+        if demand_index_median >= self.DEMAND_MAX_THRESHOLD:
             demand_score = 100.0
         else:
             # 벤치마크 대비 상대 평가
@@ -434,17 +643,15 @@ class MetricsCalculator:
         
         # 4. Problem Score (Needs Score, 10%)
         # Problem Rate = 댓글 중 특정 니즈 요청 댓글 비율
-        problem_rate_median = self.videos_df['problem_rate'].median()
+        problem_rate_median = self._metric_median('problem_rate')
         benchmark_problem_rate = self.benchmark['problem_rate']
         
         # [수정됨 V2.4] 더 엄격한 기준 적용: 만점 기준을 0.5% (0.005)로 상향 조정
-        PROBLEM_MAX_THRESHOLD = 0.005  # 0.5% = 0.005 (기존 0.2%에서 상향)
-        
-        if problem_rate_median >= PROBLEM_MAX_THRESHOLD:
+        if problem_rate_median >= self.PROBLEM_MAX_THRESHOLD:
             problem_score = 100.0
         elif benchmark_problem_rate > 0:
             # 벤치마크 대비 상대 평가 (더 엄격하게: 벤치마크의 2배를 만점 기준으로 간주)
-            problem_rate_benchmark_adjusted = benchmark_problem_rate * 2.0  # 벤치마크 2배를 만점 기준
+            problem_rate_benchmark_adjusted = benchmark_problem_rate * self.PROBLEM_FULL_MARK_RATIO
             problem_score = (problem_rate_median / problem_rate_benchmark_adjusted) * 100
         else:
             problem_score = 0
@@ -454,6 +661,7 @@ class MetricsCalculator:
         # 5. Format Fit Score (10%) - [수정됨 V2.3: 통합 포맷 계산]
         format_effects = self.analyze_format_effect()
         
+        improvement_pct = None
         if format_effects and 'format' in format_effects:
             format_data = format_effects['format']
             improvement_pct = format_data['improvement_pct']
@@ -461,7 +669,7 @@ class MetricsCalculator:
             # 50% 개선 = 100점 (2배 스케일링)
             format_score = min(improvement_pct * 2, 100)
         else:
-            format_score = 50  # 기본값 (포맷 효과 분석 불가)
+            format_score = self.FORMAT_DEFAULT_SCORE  # 기본값 (포맷 효과 분석 불가)
             print(f"  [MetricsCalculator] ⚠️ Format Score: 50점 (기본값) - 포맷 효과 분석 불가")
         
         format_score = min(format_score, 100)
@@ -479,29 +687,21 @@ class MetricsCalculator:
         consistency_score = min(consistency_score, 100)
         
         # 최종 BLC 점수 (가중 평균)
+        weights = self.BLC_WEIGHTS
         blc = (
-            eng_score * 0.30 +
-            views_score * 0.25 +
-            demand_score * 0.15 +
-            problem_score * 0.10 +
-            format_score * 0.10 +
-            consistency_score * 0.10
+            eng_score * weights['engagement_score'] +
+            views_score * weights['views_score'] +
+            demand_score * weights['demand_score'] +
+            problem_score * weights['problem_score'] +
+            format_score * weights['format_score'] +
+            consistency_score * weights['consistency_score']
         )
         
         # 100점 cap
         blc = min(blc, 100)
         
         # 판정 (5단계)
-        if blc >= 80:
-            verdict = "S (즉시 Go)"
-        elif blc >= 65:
-            verdict = "A (Go)"
-        elif blc >= 50:
-            verdict = "B (조건부 Go)"
-        elif blc >= 35:
-            verdict = "C (보류)"
-        else:
-            verdict = "D (부적합)"
+        verdict = next(label for min_score, label in self.VERDICTS if blc >= min_score or min_score == 0)
         return {
             'blc_score': float(round(blc, 1)),
             'verdict': verdict,
@@ -520,6 +720,16 @@ class MetricsCalculator:
                 'demand_index_median': float(round(demand_index_median, 2)),
                 'problem_rate_median': float(round(problem_rate_median, 4)),
                 'videos_per_week': videos_per_week
+            },
+            # 재채점용 원본 입력 (raw_values 는 표시용 반올림 값)
+            'score_inputs': {
+                'subscriber_count': self.subscriber_count,
+                'engagement_median': eng_median,
+                'views_per_day_median': vpd_median,
+                'demand_index_median': demand_index_median,
+                'problem_rate_median': problem_rate_median,
+                'videos_per_week': videos_per_week,
+                'format_improvement_pct': improvement_pct,
             }
         }
     
@@ -532,68 +742,28 @@ class MetricsCalculator:
         engagement = blc_components.get('engagement_score', 0)
         
         # 알고리즘 기반 매칭
-        category = ""
-        image = ""
-        skincare = ""
-        product_type = ""
-        
         # 고성과 채널 (Engagement 80+)
         if engagement >= 80:
-            if demand >= 80:
-                category = "프리미엄·전문가 카테고리"
-                image = "신뢰·권위·전문가형"
-                skincare = "고기능성 세럼/앰플/크림"
-                product_type = "프리미엄 집중케어 라인"
-            else:
-                category = "트렌드·큐레이터 카테고리"
-                image = "트렌디·혁신·인플루언서형"
-                skincare = "신제품/한정판/컬러"
-                product_type = "시즌 트렌드 라인"
+            key = "premium" if demand >= 80 else "trend"
         
         # 중상위 채널 (Engagement 60-80)
         elif engagement >= 60:
             if demand >= 60 and problem < 60:
-                category = "데일리·입문자 카테고리"
-                image = "실용·안심·친절한 가이드형"
-                skincare = "토너/로션/클렌징/저자극"
-                product_type = "베이직 루틴 세트"
+                key = "daily"
             elif demand >= 60 and problem >= 60:
-                category = "피부타입별·솔루션 카테고리"
-                image = "전문가 코치·카운슬링형"
-                skincare = "피부타입별 라인(건성/지성/민감)"
-                product_type = "맞춤형 솔루션 라인"
+                key = "solution"
             else:
-                category = "일반 스킨케어 카테고리"
-                image = "신뢰·균형·안정형"
-                skincare = "올인원/에센스/크림"
-                product_type = "데일리 기능성 제품"
+                key = "general_balanced"
         
         # 중위권 채널 (Engagement 40-60)
         elif engagement >= 40:
-            if problem >= 70:
-                category = "기능성·집중케어 카테고리"
-                image = "문제해결·전문가형"
-                skincare = "앰플/세럼/고농축 라인"
-                product_type = "집중 케어 솔루션"
-            else:
-                category = "일반 스킨케어 카테고리"
-                image = "친근·실용형"
-                skincare = "로션/크림/마스크팩"
-                product_type = "데일리 케어 제품"
+            key = "intensive" if problem >= 70 else "general_practical"
         
         # 하위권 채널
         else:
-            category = "성장 필요 카테고리"
-            image = "성장 단계·잠재력 모니터링"
-            skincare = "기초 제품 협업 가능"
-            product_type = "샘플/체험 키트"
+            key = "growth"
         
-        return {
-            'category': category,
-            'image': image,
-            'skincare': skincare,
-            'product_type': product_type
-        }
+        return dict(self.BLC_MATCHING_PROFILES[key])
     
     def generate_summary_report(self):
         """한 장 요약 보고서 생성"""
@@ -638,6 +808,7 @@ class MetricsCalculator:
             'upload_consistency': consistency,
             'blc_breakdown': blc['components'],
             'raw_values': blc['raw_values'],
+            'score_inputs': blc['score_inputs'],
             'blc_matching': blc_matching,
             'comment_statistics': {
                 'total_comments_collected': total_comments_collected,
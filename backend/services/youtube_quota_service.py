@@ -0,0 +1,148 @@
+# services/youtube_quota_service.py
+from __future__ import annotations
+import math
+from datetime import date, datetime
+from typing import Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from models.youtube_quota import YouTubeQuotaUsage, YouTubeCollectionRun
+from services.youtube_data_collector import YouTubeDataCollector
+
+# YouTube quota 는 태평양 시간 자정에 초기화된다
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# 추정 오차를 고려해 남겨두는 여유분 (일일 한도 대비)
+SAFETY_MARGIN = 0.05
+
+# 분석 깊이 단계 (max_videos, max_comments) - 위에서부터 가능한 가장 깊은 단계를 선택
+DEPTH_LEVELS = [
+    (100, 100),
+    (50, 100),
+    (50, 50),
+    (30, 30),
+    (20, 20),
+]
+
+
+def quota_day(now: Optional[datetime] = None) -> date:
+    """quota 기준일 (America/Los_Angeles)"""
+    now = now or datetime.now(QUOTA_TIMEZONE)
+    return now.astimezone(QUOTA_TIMEZONE).date()
+
+
+def get_units_used_today(db: Session) -> int:
+    row = db.get(YouTubeQuotaUsage, quota_day())
+    return int(row.units_used) if row else 0
+
+
+def get_remaining_units(db: Session, daily_limit: int) -> int:
+    return max(0, daily_limit - get_units_used_today(db))
+
+
+def estimate_collection_cost(max_videos: int, max_comments: int, listing: str = "uploads") -> int:
+    """
+    collect_full_data 1회의 quota 상한 추정 (캐시 적중/증분 수집은 고려하지 않음)
+    - channels 1 + 목록 페이지 + videos 배치 + 영상당 댓글 페이지
+    """
+    pages = math.ceil(max_videos / 50)
+    listing_cost = pages * YouTubeDataCollector.QUOTA_COSTS["search" if listing == "search" else "playlistItems"]
+    videos_cost = pages * YouTubeDataCollector.QUOTA_COSTS["videos"]
+    comments_cost = max_videos * math.ceil(max_comments / 100) * YouTubeDataCollector.QUOTA_COSTS["commentThreads"]
+    return YouTubeDataCollector.QUOTA_COSTS["channels"] + listing_cost + videos_cost + comments_cost
+
+
+def plan_collection_depth(
+    remaining_units: int,
+    daily_limit: int,
+    listing: str = "uploads",
+) -> Tuple[int, int, bool]:
+    """
+    남은 quota 로 끝까지 완료할 수 있는 가장 깊은 (max_videos, max_comments) 선택
+    - 반환: (max_videos, max_comments, degraded)
+    - 가장 얕은 단계도 불가능하면 RuntimeError
+    """
+    usable = remaining_units - int(daily_limit * SAFETY_MARGIN)
+    for i, (max_videos, max_comments) in enumerate(DEPTH_LEVELS):
+        if estimate_collection_cost(max_videos, max_comments, listing) <= usable:
+            if i > 0:
+                print(
+                    f"  [Quota] ⚠️ 남은 quota {remaining_units} units → 축소 모드 "
+                    f"(영상 {max_videos}개, 댓글 {max_comments}개)"
+                )
+            return max_videos, max_comments, i > 0
+
+    raise RuntimeError(
+        f"YouTube API 일일 quota 가 부족합니다. (남은 quota: {remaining_units} units)"
+    )
+
+
+def _add_units_used(db: Session, day: date, units: int) -> None:
+    """
+    일일 원장에 units 누적 (upsert)
+    - 그날 첫 기록을 미리 수집과 분석이 동시에 넣어도 PK 충돌 없이 합산
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(YouTubeQuotaUsage).values(usage_date=day, units_used=units)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[YouTubeQuotaUsage.usage_date],
+            set_={
+                "units_used": YouTubeQuotaUsage.units_used + stmt.excluded.units_used,
+                "updated_at": func.now(),
+            },
+        ))
+        return
+
+    # 그 외 DB: update 후 행이 없으면 insert
+    updated = (
+        db.query(YouTubeQuotaUsage)
+        .filter(YouTubeQuotaUsage.usage_date == day)
+        .update(
+            {YouTubeQuotaUsage.units_used: YouTubeQuotaUsage.units_used + units},
+            synchronize_session=False,
+        )
+    )
+    if not updated:
+        db.add(YouTubeQuotaUsage(usage_date=day, units_used=units))
+
+
+def record_collection_run(
+    db: Session,
+    collector: YouTubeDataCollector,
+    *,
+    channel_id: Optional[str],
+    request_id: Optional[int],
+    max_videos: int,
+    max_comments: int,
+    degraded: bool,
+    status: str,
+) -> YouTubeCollectionRun:
+    """수집 1회 비용을 기록하고 일일 원장에 누적"""
+    usage = collector.usage_summary()
+    units_by_resource = usage["units_by_resource"]
+    calls_by_resource = usage["calls_by_resource"]
+    units = sum(units_by_resource.values())
+    day = quota_day()
+
+    run = YouTubeCollectionRun(
+        request_id=request_id,
+        channel_id=channel_id,
+        usage_date=day,
+        max_videos=max_videos,
+        max_comments=max_comments,
+        degraded=degraded,
+        status=status,
+        units_used=units,
+        units_by_resource=units_by_resource,
+        calls_by_resource=calls_by_resource,
+    )
+    db.add(run)
+    _add_units_used(db, day, units)
+    db.commit()
+    print(f"  [Quota] 🧾 이번 수집 quota: {units} units {units_by_resource}")
+    return run
@@ -0,0 +1,220 @@
+"""
+YouTube Data API 호출 재시도 정책
+- 429 / 5xx / 403 rateLimitExceeded 및 네트워크 오류는 지수 백오프 + full jitter 로 재시도
+- Retry-After 헤더가 있으면 그 값 이상 대기
+- 재시도 예산(token bucket): 성공 호출마다 조금씩 적립, 재시도마다 1개 소모 -> 장애 시 재시도 폭주 방지
+- 엔드포인트(resource)별 서킷 브레이커: 연속 실패가 쌓이면 잠시 호출 차단 후 1건으로 상태 확인
+- 같은 엔드포인트의 백오프는 스레드 간 공유 (한 worker 가 throttling 을 받으면 모두 같이 쉰다)
+"""
+
+import random
+import threading
+import time
+
+from services.youtube_api_keys import error_reasons, quota_error_reason
+
+# 재시도할 HTTP 상태 코드
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+# 403 중 재시도할 reason (일시적 속도 제한)
+RETRYABLE_403_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않음"""
+
+    def __init__(self, resource, retry_in):
+        super().__init__(f"{resource} 엔드포인트 서킷 열림 ({retry_in:.1f}초 후 재시도)")
+        self.resource = resource
+        self.retry_in = retry_in
+
+
+def _http_status(error):
+    resp = getattr(error, "resp", None)
+    status = getattr(resp, "status", None)
+    return int(status) if status is not None else None
+
+
+def _retry_after(error):
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if hasattr(resp, "get") else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class CircuitBreaker:
+    """
+    엔드포인트 1개의 서킷 브레이커
+    - closed: 정상 / open: failure_threshold 연속 실패 후 reset_timeout 동안 차단
+    - half-open: 차단 시간이 지나면 1건만 통과시켜 성공하면 closed, 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            if self.opened_at is None:
+                return "closed"
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self, resource):
+        """호출 가능 여부 확인 (불가하면 CircuitOpenError)"""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            elapsed = time.monotonic() - self.opened_at
+            if elapsed < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(resource, max(0.0, self.reset_timeout - elapsed))
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class RetryPolicy:
+    """
+    collector 의 모든 API 호출에 공통으로 쓰는 재시도 정책
+    - max_attempts: 1회 호출당 최대 시도 횟수 (첫 시도 포함)
+    - base_delay / max_delay: 지수 백오프 기준 / 상한 (초), full jitter 적용
+    - budget_ratio / budget_max: 성공 1회당 적립되는 재시도 토큰 / 최대 토큰 수
+    - transient_errors: 재시도할 네트워크 예외 타입
+    """
+
+    def __init__(
+        self,
+        max_attempts=5,
+        base_delay=0.5,
+        max_delay=30.0,
+        budget_ratio=0.1,
+        budget_max=20.0,
+        failure_threshold=5,
+        reset_timeout=30.0,
+        transient_errors=(OSError,),
+        sleep=time.sleep,
+    ):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget_ratio = budget_ratio
+        self.budget_max = budget_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.transient_errors = tuple(transient_errors)
+        self._sleep = sleep
+
+        self._tokens = budget_max
+        self._breakers = {}
+        # resource -> 이 시각(monotonic) 전에는 호출하지 않음 (공유 백오프)
+        self._paused_until = {}
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.gave_up = 0
+
+    def breaker(self, resource) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(resource)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[resource] = breaker
+            return breaker
+
+    def is_retryable(self, error) -> bool:
+        if isinstance(error, self.transient_errors):
+            return True
+        status = _http_status(error)
+        if status in RETRYABLE_STATUSES:
+            return True
+        if status == 403 and quota_error_reason(error) is None:
+            return any(r in RETRYABLE_403_REASONS for r in error_reasons(error))
+        return False
+
+    def backoff(self, attempt, error=None) -> float:
+        """attempt 번째 재시도 대기 시간 (full jitter, Retry-After 우선)"""
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        retry_after = _retry_after(error) if error is not None else None
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_delay))
+        return delay
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def _on_success(self):
+        with self._lock:
+            self._tokens = min(self.budget_max, self._tokens + self.budget_ratio)
+
+    def _wait_for_pause(self, resource):
+        with self._lock:
+            wait = self._paused_until.get(resource, 0.0) - time.monotonic()
+        if wait > 0:
+            self._sleep(wait)
+
+    def _pause(self, resource, delay):
+        with self._lock:
+            until = time.monotonic() + delay
+            self._paused_until[resource] = max(self._paused_until.get(resource, 0.0), until)
+
+    def call(self, resource, fn):
+        """fn() 실행, 일시 오류면 재시도. 재시도 불가/예산 소진/최대 시도 초과면 마지막 오류 전달"""
+        breaker = self.breaker(resource)
+        attempt = 0
+        while True:
+            self._wait_for_pause(resource)
+            breaker.before_call(resource)
+            try:
+                result = fn()
+            except Exception as e:
+                if not self.is_retryable(e):
+                    # 요청 자체의 문제(400/404/quota 등)는 엔드포인트 장애로 보지 않는다
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                attempt += 1
+                if attempt >= self.max_attempts or not self._take_token():
+                    with self._lock:
+                        self.gave_up += 1
+                    raise
+                delay = self.backoff(attempt, e)
+                print(f"    [Retry] ⏳ {resource} {_http_status(e) or type(e).__name__} -> {delay:.2f}초 후 재시도 ({attempt}/{self.max_attempts - 1})")
+                self._pause(resource, delay)
+                continue
+            breaker.record_success()
+            self._on_success()
+            return result
+
+    def summary(self) -> dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+            summary = {
+                "retries": self.retries,
+                "gave_up": self.gave_up,
+                "retry_tokens": round(self._tokens, 2),
+            }
+        summary["circuits"] = {r: b.state for r, b in breakers.items()}
+        return summary
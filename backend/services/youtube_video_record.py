@@ -0,0 +1,92 @@
+"""
+수집한 영상 1개의 compact 레코드
+- __slots__ dataclass: 영상마다 dict 를 두는 것보다 메모리가 작고 필드 오타가 바로 드러남
+- 기존 dict 접근 코드(video['view_count'], video.get(...), video['comments'] = ...)와 호환
+- DataFrame / JSON 변환은 경계(MetricsCalculator, 스냅샷 저장, 파일 저장)에서만 수행
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import List, Optional
+
+import pandas as pd
+
+
+@dataclass(slots=True)
+class VideoRecord:
+    video_id: str
+    title: str
+    published_at: str
+    days_since_upload: int
+    duration_seconds: int
+    duration_formatted: str
+    view_count: int
+    like_count: int
+    comment_count: int
+    tags: List[str] = field(default_factory=list)
+    thumbnail_high: str = ''
+    comments: List[str] = field(default_factory=list)
+    # 샘플링/예산 배분 보정용 기본 수집 기준 댓글 수 (youtube_comment_sampler / youtube_comment_budget)
+    comments_target: Optional[int] = None
+    # 댓글 미측정 (재시도 후에도 수집 실패, 또는 댓글 예산 배분에서 제외)
+    comments_error: bool = False
+
+    # --- dict 호환 ---
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return key in self.__slots__
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return [f.name for f in fields(self)]
+
+    def to_dict(self) -> dict:
+        """JSON 저장용 dict (값이 없는 보정용 필드는 생략 -> 기존 스냅샷 형식과 동일)"""
+        data = {name: getattr(self, name) for name in self.keys()}
+        if data['comments_target'] is None:
+            del data['comments_target']
+        if not data['comments_error']:
+            del data['comments_error']
+        return data
+
+
+def video_to_dict(video) -> dict:
+    """VideoRecord 또는 dict -> dict"""
+    return video.to_dict() if isinstance(video, VideoRecord) else dict(video)
+
+
+def videos_to_dicts(videos) -> list:
+    return [video_to_dict(v) for v in videos]
+
+
+def videos_to_frame(videos) -> pd.DataFrame:
+    """
+    영상 레코드 목록 -> DataFrame
+    - 모두 VideoRecord 면 레코드별 dict 를 만들지 않고 열 단위로 구성
+    - dict 가 섞여 있으면 기존처럼 pd.DataFrame(list of dict)
+    - 이미 DataFrame 이면 (컬럼형 스냅샷 등) 얕은 복사만 (호출자의 DataFrame 에 열이 추가되지 않도록)
+    """
+    if isinstance(videos, pd.DataFrame):
+        return videos.copy(deep=False)
+    videos = list(videos)
+    if not videos or not all(isinstance(v, VideoRecord) for v in videos):
+        return pd.DataFrame([video_to_dict(v) for v in videos])
+    df = pd.DataFrame({
+        f.name: [getattr(v, f.name) for v in videos]
+        for f in fields(VideoRecord)
+    })
+    # None 이 섞인 object 열 대신 NaN 숫자 열로 (dict 입력일 때와 같은 dtype)
+    df['comments_target'] = pd.to_numeric(df['comments_target'], errors='coerce').astype('float64')
+    return df
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from services.blc_batch_scorer import blc_records, score_blc_batch
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+COMMENT_POOL = ["샀어요", "여드름 고민", "영상 잘 봤습니다", "추천해요", "건조해요", "ㅎㅎ"]
+SUBSCRIBER_COUNTS = [0, 3_000, 9_999, 10_000, 80_000, 100_000, 450_000, 500_000, 2_000_000]
+
+
+def random_channel(rng, subscriber_count):
+    now = datetime.now(timezone.utc)
+    videos = []
+    for i in range(int(rng.integers(3, 15))):
+        days = int(rng.integers(1, 170))
+        views = int(rng.integers(0, 200_000))
+        comments = list(rng.choice(COMMENT_POOL, size=int(rng.integers(0, 30))))
+        videos.append({
+            "video_id": f"v{i}",
+            "title": "솔직 리뷰" if rng.random() < 0.4 else f"일상 {i}",
+            "published_at": (now - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "days_since_upload": days,
+            "duration_seconds": int(rng.integers(30, 1500)),
+            "duration_formatted": "",
+            "view_count": views,
+            "like_count": int(views * rng.random() * 0.05),
+            "comment_count": len(comments),
+            "tags": [],
+            "thumbnail_high": "",
+            "comments": comments,
+            "comments_error": bool(rng.random() < 0.1),
+        })
+    return {
+        "channel": {"channel_name": "batch", "subscriber_count": subscriber_count, "total_views": 1},
+        "videos": videos,
+    }
+
+
+def test_batch_scores_match_scalar_calculator():
+    rng = np.random.default_rng(21)
+    calculators = [
+        MetricsCalculator(random_channel(rng, subscriber_count))
+        for subscriber_count in SUBSCRIBER_COUNTS * 5
+    ]
+    scalar = [calculator.calculate_blc_score() for calculator in calculators]
+    inputs = [result["score_inputs"] for result in scalar]
+
+    scores = score_blc_batch(
+        subscriber_count=[i["subscriber_count"] for i in inputs],
+        engagement_median=[i["engagement_median"] for i in inputs],
+        views_per_day_median=[i["views_per_day_median"] for i in inputs],
+        demand_index_median=[i["demand_index_median"] for i in inputs],
+        problem_rate_median=[i["problem_rate_median"] for i in inputs],
+        videos_per_week=[i["videos_per_week"] for i in inputs],
+        format_improvement_pct=[
+            np.nan if i["format_improvement_pct"] is None else i["format_improvement_pct"] for i in inputs
+        ],
+    )
+
+    for calculator, expected, record in zip(calculators, scalar, blc_records(scores)):
+        assert record["blc_score"] == expected["blc_score"]
+        assert record["verdict"] == expected["verdict"]
+        assert record["tier"] == expected["tier"]
+        assert record["components"] == expected["components"]
+        assert record["blc_matching"] == calculator.get_blc_matching(expected["components"], {})
+
+
+def test_thresholds_and_caps():
+    scores = score_blc_batch(
+        subscriber_count=[50_000, 50_000],
+        engagement_median=[1e9, 0.0],
+        views_per_day_median=[1e9, 0.0],
+        demand_index_median=[MetricsCalculator.DEMAND_MAX_THRESHOLD, 0.0],
+        problem_rate_median=[MetricsCalculator.PROBLEM_MAX_THRESHOLD, 0.0],
+        videos_per_week=[100.0, 0.0],
+        format_improvement_pct=[500.0, np.nan],
+    )
+
+    # 두 번째 채널은 포맷 기본 점수만 남는다
+    default_only = MetricsCalculator.FORMAT_DEFAULT_SCORE * MetricsCalculator.BLC_WEIGHTS["format_score"]
+    assert scores["blc_score"].tolist() == [100.0, pytest.approx(default_only)]
+    assert scores["demand_score"].tolist() == [100.0, 0.0]
+    assert scores["format_score"].tolist() == [100.0, MetricsCalculator.FORMAT_DEFAULT_SCORE]
+    assert scores["matching"].tolist() == ["premium", "growth"]
+
+
+def test_mismatched_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        score_blc_batch([1, 2], [1], [1, 2], [1, 2], [1, 2], [1, 2])
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+from models.channel_resolution import ChannelResolution
+from services.channel_resolver import resolve_channel_id
+
+
+class FakeCollector:
+    """핸들 해석 API 대신 (호출 횟수 기록, on_call 로 동시 저장 재현)"""
+
+    def __init__(self, channel_id, on_call=None):
+        self.channel_id = channel_id
+        self.on_call = on_call
+        self.calls = 0
+
+    def get_channel_id_from_username(self, username, raise_errors=False):
+        self.calls += 1
+        if self.on_call is not None:
+            self.on_call()
+        return self.channel_id
+
+
+def test_channel_url_is_resolved_locally(db_session):
+    collector = FakeCollector("UCunused")
+    channel_id = "UC" + "a" * 22
+    assert resolve_channel_id(db_session, collector, f"https://www.youtube.com/channel/{channel_id}") == channel_id
+    assert collector.calls == 0
+
+
+def test_handle_is_cached_after_first_lookup(db_session):
+    collector = FakeCollector("UCbeauty")
+    assert resolve_channel_id(db_session, collector, "@Beauty") == "UCbeauty"
+    assert resolve_channel_id(db_session, collector, "@beauty") == "UCbeauty"
+    assert collector.calls == 1
+
+
+def test_concurrent_insert_of_same_handle_uses_stored_row(db_session, session_factory):
+    def insert_from_other_session():
+        other = session_factory()
+        other.add(ChannelResolution(
+            handle="beauty", channel_id="UCbeauty", resolved_at=datetime.now(timezone.utc)
+        ))
+        other.commit()
+        other.close()
+
+    collector = FakeCollector("UCbeauty", on_call=insert_from_other_session)
+    assert resolve_channel_id(db_session, collector, "@beauty") == "UCbeauty"
+    assert db_session.query(ChannelResolution).count() == 1
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+from services.channel_snapshot_service import (
+    collect_channel_data,
+    load_fresh_snapshot_data,
+    load_snapshot,
+    save_snapshot,
+)
+
+CHANNEL_ID = "UCsnapshot"
+
+
+class FakeCollector:
+    """collect_full_data / collect_delta_data 호출 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _data(self, videos):
+        return {
+            "channel": {"channel_id": CHANNEL_ID, "channel_name": "snapshot"},
+            "videos": [{"video_id": f"v{i}", "comments": []} for i in range(videos)],
+            "collection_date": datetime.now().isoformat(),
+            "analysis_period_months": 6,
+        }
+
+    def collect_full_data(self, channel_id, max_videos, months_back, max_comments):
+        self.calls.append("full")
+        return self._data(max_videos)
+
+    def collect_delta_data(self, channel_id, previous, max_videos, months_back, max_comments):
+        self.calls.append("delta")
+        return self._data(max_videos)
+
+
+def _age_snapshot(db, hours=24):
+    """FRESH_MAX_AGE 가 지난 스냅샷으로 (그대로 재사용하지 않고 수집하도록)"""
+    snapshot = load_snapshot(db, CHANNEL_ID)
+    snapshot.collected_at = datetime.now(timezone.utc) - timedelta(hours=hours)
+    db.commit()
+
+
+def test_full_depth_snapshot_is_used_as_delta_base(db_session):
+    collector = FakeCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    _age_snapshot(db_session)
+
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    assert collector.calls == ["full", "delta"]
+
+
+def test_degraded_snapshot_is_not_used_as_delta_base(db_session):
+    collector = FakeCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID, max_videos=20, max_comments=20, degraded=True)
+    assert load_snapshot(db_session, CHANNEL_ID).data["degraded"] is True
+    _age_snapshot(db_session)
+
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    assert collector.calls == ["full", "full"]
+    assert load_snapshot(db_session, CHANNEL_ID).data["degraded"] is False
+
+
+def test_snapshot_without_depth_flag_counts_as_full_depth(db_session):
+    collector = FakeCollector()
+    save_snapshot(db_session, CHANNEL_ID, collector._data(3))
+    _age_snapshot(db_session)
+
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    assert collector.calls == ["delta"]
+
+
+def test_fresh_full_depth_snapshot_is_reused(db_session):
+    collector = FakeCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    assert collector.calls == ["full"]
+
+
+def test_fresh_degraded_snapshot_is_not_reused(db_session):
+    collector = FakeCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID, max_videos=20, max_comments=20, degraded=True)
+
+    assert load_fresh_snapshot_data(db_session, CHANNEL_ID) is None
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+    assert collector.calls == ["full", "full"]
+    assert load_snapshot(db_session, CHANNEL_ID).data["degraded"] is False
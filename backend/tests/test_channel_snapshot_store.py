@@ -0,0 +1,104 @@
+import os
+
+import pyarrow as pa
+import pytest
+
+from services.channel_snapshot_store import ChannelSnapshotStore
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+
+def make_raw_data():
+    videos = [
+        {
+            "video_id": f"v{i}",
+            "title": f"영상 {i}",
+            "published_at": "2026-09-01T00:00:00Z",
+            "days_since_upload": 10 + i,
+            "duration_seconds": 300 + i,
+            "duration_formatted": "5:00",
+            "view_count": 1000 * (i + 1),
+            "like_count": 50 + i,
+            "comment_count": 3,
+            "tags": ["스킨케어", f"tag{i}"] if i else [],
+            "thumbnail_high": "",
+            "comments": ["샀어요", "여드름 고민", "잘 봤어요"][: 3 - i],
+        }
+        for i in range(3)
+    ]
+    videos[1]["comments_target"] = 100
+    videos[2]["comments_error"] = True
+    return {
+        "channel": {
+            "channel_id": "UCstore",
+            "channel_name": "store",
+            "description": "",
+            "subscriber_count": 50_000,
+            "total_views": 6000,
+            "video_count": 3,
+            "published_at": "2020-01-01T00:00:00Z",
+        },
+        "videos": videos,
+        "collection_date": "2026-10-01T12:00:00",
+        "analysis_period_months": 6,
+    }
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_snapshot_round_trip(tmp_path, compression):
+    raw_data = make_raw_data()
+    store = ChannelSnapshotStore(str(tmp_path), compression)
+
+    path = store.save(raw_data)
+
+    assert store.latest("UCstore") == path
+    assert store.load(path) == raw_data
+
+
+def test_metrics_from_store_match_metrics_from_dict(tmp_path):
+    raw_data = make_raw_data()
+    store = ChannelSnapshotStore(str(tmp_path))
+    path = store.save(raw_data)
+
+    from_dict = MetricsCalculator(raw_data).calculate_blc_score()
+    from_store = MetricsCalculator(store.load_for_metrics(path)).calculate_blc_score()
+
+    assert from_store["blc_score"] == pytest.approx(from_dict["blc_score"])
+    assert from_store["score_inputs"] == pytest.approx(from_dict["score_inputs"])
+
+
+@pytest.mark.parametrize("compression, copies", [(None, False), ("zstd", True)])
+def test_only_compressed_snapshot_is_copied_on_read(tmp_path, compression, copies):
+    store = ChannelSnapshotStore(str(tmp_path), compression)
+    path = store.save(make_raw_data())
+
+    allocated = pa.total_allocated_bytes()
+    tables = store.load_tables(path)
+    assert (pa.total_allocated_bytes() > allocated) is copies
+    assert tables["videos"].column("view_count").to_pylist() == [1000, 2000, 3000]
+
+
+@pytest.mark.skipif("YOUTUBE_SNAPSHOT_STORE_COMPRESSION" in os.environ, reason="압축 설정이 환경 변수로 지정됨")
+def test_store_defaults_to_uncompressed():
+    from core.config import YOUTUBE_SNAPSHOT_STORE_COMPRESSION
+
+    assert ChannelSnapshotStore("unused").compression is None
+    assert YOUTUBE_SNAPSHOT_STORE_COMPRESSION is None
+
+
+def test_save_keeps_only_latest_snapshots_per_channel(tmp_path):
+    store = ChannelSnapshotStore(str(tmp_path), keep=2)
+    raw_data = make_raw_data()
+    paths = []
+    for day in (1, 2, 3):
+        paths.append(store.save({**raw_data, "collection_date": f"2026-10-0{day}T12:00:00"}))
+
+    assert store.list_snapshots("UCstore") == paths[1:]
+    assert store.load(store.latest("UCstore"))["collection_date"] == "2026-10-03T12:00:00"
+
+
+def test_keep_zero_disables_pruning(tmp_path):
+    store = ChannelSnapshotStore(str(tmp_path), keep=0)
+    for day in (1, 2, 3):
+        store.save({**make_raw_data(), "collection_date": f"2026-10-0{day}T12:00:00"})
+
+    assert len(store.list_snapshots("UCstore")) == 3
@@ -0,0 +1,98 @@
+import pytest
+
+from models.report_creator import ReportCreator
+from models.request import Request
+from services.creator_percentile_index import SCORE_FIELDS, TierPercentileIndex
+
+TIER = "Tier_3_Rising"
+
+
+def scores(blc_score):
+    return {name: float(blc_score) for name in SCORE_FIELDS}
+
+
+def add_report(db, request_id, version, blc_score, tier=TIER):
+    if db.get(Request, request_id) is None:
+        db.add(
+            Request(
+                request_id=request_id,
+                activity_name="test",
+                platform="youtube",
+                channel_name=f"@creator{request_id}",
+                category_code="cream",
+                brand_concept="concept",
+                contact_method="email",
+                email="test@example.com",
+                view_pw_hash="hash",
+            )
+        )
+    db.add(
+        ReportCreator(
+            request_id=request_id,
+            version=version,
+            title="report",
+            platform="youtube",
+            blc_tier=tier,
+            **scores(blc_score),
+        )
+    )
+    db.commit()
+
+
+@pytest.fixture
+def index(db_session):
+    """빈 DB 로 구성한 인덱스 (이후 증분 반영만 시험)"""
+    index = TierPercentileIndex(reload_seconds=3600)
+    index.load(db_session)
+    return index
+
+
+def test_percentile_and_rank(index):
+    for request_id, blc_score in enumerate([10, 20, 20, 40]):
+        index.add(request_id, 1, TIER, scores(blc_score))
+
+    result = index.lookup(TIER, {"blc_score": 20.0})
+    assert result["sample_size"] == 4
+    # 20 보다 낮은 1개 + 같은 2개의 절반 -> 2/4
+    assert result["scores"]["blc_score"] == {"percentile": 50.0, "rank": 2}
+    assert index.lookup(TIER, {"blc_score": 40.0})["scores"]["blc_score"]["rank"] == 1
+
+
+def test_new_version_replaces_previous_value(index):
+    index.add(1, 1, TIER, scores(10))
+    index.add(2, 1, TIER, scores(50))
+    index.add(1, 2, TIER, scores(90))
+
+    assert index.lookup(TIER, {"blc_score": 90.0})["scores"]["blc_score"]["rank"] == 1
+    assert index.lookup(TIER, {"blc_score": 10.0})["sample_size"] == 2
+    # 이전 버전이 늦게 들어와도 무시
+    index.add(1, 1, TIER, scores(10))
+    assert index.lookup(TIER, {"blc_score": 90.0})["scores"]["blc_score"]["percentile"] == 75.0
+
+
+def test_tier_change_moves_entry(index):
+    index.add(1, 1, TIER, scores(30))
+    index.add(1, 2, "Tier_2_Mid", scores(30))
+
+    assert index.lookup(TIER, {"blc_score": 30.0})["sample_size"] == 0
+    assert index.lookup("Tier_2_Mid", {"blc_score": 30.0})["sample_size"] == 1
+
+
+def test_add_before_load_is_ignored():
+    index = TierPercentileIndex()
+    index.add(1, 1, TIER, scores(30))
+    assert index.lookup(TIER, {"blc_score": 30.0})["sample_size"] == 0
+
+
+def test_load_uses_latest_version_per_request(db_session):
+    add_report(db_session, 1, 1, 10)
+    add_report(db_session, 1, 2, 80)
+    add_report(db_session, 2, 1, 40)
+    add_report(db_session, 3, 1, 60, tier="Tier_1_Major")
+
+    index = TierPercentileIndex(reload_seconds=3600)
+    report = db_session.query(ReportCreator).filter_by(request_id=2).one()
+    result = index.lookup_report(db_session, report)
+
+    assert result["sample_size"] == 2
+    assert result["scores"]["blc_score"] == {"percentile": 25.0, "rank": 2}
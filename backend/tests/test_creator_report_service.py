@@ -0,0 +1,140 @@
+import pytest
+
+import services.creator_report_service as creator_report_service
+from models.request import Request
+from models.youtube_quota import YouTubeQuotaUsage
+from services.channel_snapshot_service import collect_channel_data
+from services.youtube_quota_service import DEPTH_LEVELS, SAFETY_MARGIN, estimate_collection_cost, quota_day
+
+CHANNEL_ID = "UC" + "s" * 22
+
+
+class FakeCollector:
+    key_pool = ["test-key"]
+    video_listing = "uploads"
+
+    def close(self):
+        pass
+
+
+class StreamingCollector(FakeCollector):
+    """스냅샷 수집 / 스트리밍 수집 호출 기록"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _data(self, source):
+        return {
+            "channel": {"channel_id": CHANNEL_ID, "channel_name": source},
+            "videos": [],
+            "analysis_period_months": 6,
+        }
+
+    def collect_full_data(self, channel_id, max_videos, months_back, max_comments):
+        self.calls.append("full")
+        return self._data("snapshot")
+
+    def stream_full_data(self, channel_id, max_videos, months_back, max_comments):
+        self.calls.append("stream")
+        return self._data("stream")
+
+    def quota_units_used(self):
+        return 0
+
+    def usage_summary(self):
+        return {"units_by_key": {}, "units_by_resource": {}, "calls_by_resource": {}}
+
+
+@pytest.fixture
+def prefetch(monkeypatch, db_session):
+    """API 호출 없이 미리 수집 실행 (수집 깊이만 기록)"""
+    collected = []
+
+    def resolve_and_collect(collector, channel_query, analysis_period_months, db=None, request_id=None, streaming=None, depth=None):
+        collected.append(depth)
+        return "UCprefetch", {"videos": []}, {"quota_units": 0}
+
+    monkeypatch.setattr(creator_report_service, "_load_youtube_api_keys", lambda: ["test-key"])
+    monkeypatch.setattr(creator_report_service, "_build_collector", lambda key_pool: FakeCollector())
+    monkeypatch.setattr(creator_report_service, "_resolve_and_collect", resolve_and_collect)
+    monkeypatch.setattr(creator_report_service, "YOUTUBE_DAILY_QUOTA", 10_000)
+
+    db_session.add(
+        Request(
+            request_id=1,
+            activity_name="test",
+            platform="youtube",
+            channel_name="@prefetch",
+            category_code="cream",
+            brand_concept="concept",
+            contact_method="email",
+            email="test@example.com",
+            view_pw_hash="hash",
+        )
+    )
+    db_session.commit()
+
+    def run():
+        return creator_report_service.prefetch_channel_data_for_request(db_session, 1)
+
+    run.collected = collected
+    return run
+
+
+def test_prefetch_collects_at_full_depth(prefetch):
+    assert prefetch() == "UCprefetch"
+    assert prefetch.collected == [(100, 100, False)]
+
+
+def test_prefetch_is_skipped_when_quota_forces_degraded_depth(prefetch, db_session):
+    # 남은 quota 가 전체 깊이 수집 비용보다 1 unit 부족
+    margin = int(10_000 * SAFETY_MARGIN)
+    full_cost = estimate_collection_cost(*DEPTH_LEVELS[0])
+    db_session.add(YouTubeQuotaUsage(usage_date=quota_day(), units_used=10_000 - (margin + full_cost - 1)))
+    db_session.commit()
+
+    assert prefetch() is None
+    assert prefetch.collected == []
+
+
+def _stream(db_session, collector):
+    return creator_report_service._resolve_and_collect(
+        collector, CHANNEL_ID, 6, db=db_session, streaming=True, depth=(100, 100, False)
+    )
+
+
+def test_streaming_run_reuses_fresh_full_depth_snapshot(db_session):
+    collector = StreamingCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID)
+
+    _, raw_data, _ = _stream(db_session, collector)
+    assert collector.calls == ["full"]
+    assert raw_data["channel"]["channel_name"] == "snapshot"
+
+
+def test_streaming_run_does_not_reuse_fresh_degraded_snapshot(db_session):
+    collector = StreamingCollector()
+    collect_channel_data(db_session, collector, CHANNEL_ID, max_videos=20, max_comments=20, degraded=True)
+
+    _, raw_data, _ = _stream(db_session, collector)
+    assert collector.calls == ["full", "stream"]
+    assert raw_data["channel"]["channel_name"] == "stream"
+
+
+def test_pipeline_closes_collector_when_collection_fails(monkeypatch):
+    closed = []
+
+    class ClosingCollector(FakeCollector):
+        def close(self):
+            closed.append(True)
+
+    def resolve_and_collect(*args, **kwargs):
+        raise RuntimeError("수집 실패")
+
+    monkeypatch.setattr(creator_report_service, "_load_youtube_api_keys", lambda: ["test-key"])
+    monkeypatch.setattr(creator_report_service, "_build_collector", lambda key_pool: ClosingCollector())
+    monkeypatch.setattr(creator_report_service, "_resolve_and_collect", resolve_and_collect)
+
+    with pytest.raises(RuntimeError):
+        creator_report_service._run_creator_pipeline_core("@closing", "concept")
+    assert closed == [True]
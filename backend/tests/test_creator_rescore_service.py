@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import inspect
+
+import services.creator_rescore_service as creator_rescore_service
+from models.report_creator import ReportCreator
+from models.request import Request
+from services.creator_rescore_service import _flag_stale_section, rescore_creator_reports
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+SCORE_INPUTS = {
+    "subscriber_count": 50_000,
+    "engagement_median": 40.0,
+    "views_per_day_median": 900.0,
+    "demand_index_median": 0.3,
+    "problem_rate_median": 0.01,
+    "videos_per_week": 1.0,
+    "format_improvement_pct": 20.0,
+}
+
+
+@pytest.fixture
+def stale_report(monkeypatch, db_session):
+    """현재 기준과 다른 점수로 저장된 v1 리포트"""
+    monkeypatch.setattr(creator_rescore_service, "get_tier_benchmarks", lambda db: MetricsCalculator.BENCHMARKS)
+    db_session.add(
+        Request(
+            request_id=7,
+            activity_name="test",
+            platform="youtube",
+            channel_name="@rescore",
+            category_code="cream",
+            brand_concept="concept",
+            contact_method="email",
+            email="test@example.com",
+            view_pw_hash="hash",
+        )
+    )
+    report = ReportCreator(
+        request_id=7,
+        version=1,
+        title="@rescore 크리에이터 분석 리포트",
+        platform="youtube",
+        blc_score=12.0,
+        blc_grade="D",
+        blc_tier="Tier_3_Rising",
+        subscriber_count=50_000,
+        engagement_score=1.0,
+        views_score=1.0,
+        demand_score=1.0,
+        problem_score=1.0,
+        format_score=1.0,
+        consistency_score=1.0,
+        meta_json={"score_inputs": SCORE_INPUTS},
+        executive_summary_json={"key": "executive_summary", "content_md": "BLC 12점, D 등급 채널입니다."},
+        deep_analysis_json={"key": "deep_analysis", "content_md": "심층 분석"},
+        blc_matching_json={"key": "blc_matching", "title": "BLC 매칭", "content_md": "Engagement: 1.0/100"},
+        risk_mitigation_json={},
+    )
+    db_session.add(report)
+    db_session.commit()
+    return report
+
+
+def _latest(db_session):
+    return db_session.query(ReportCreator).order_by(ReportCreator.version.desc()).first()
+
+
+def test_new_version_regenerates_blc_matching_text(db_session, stale_report):
+    assert rescore_creator_reports(db_session)["changed"] == 1
+
+    report = _latest(db_session)
+    content = report.blc_matching_json["content_md"]
+    assert report.version == 2
+    assert "Engagement: 1.0/100" not in content
+    assert f"Engagement: {float(report.engagement_score):.1f}/100" in content
+    assert f"등급: {report.meta_json['verdict']}" in content
+    assert report.blc_matching_json["matching"]["category"] in content
+    assert report.blc_matching_json["title"] == "BLC 매칭"
+
+
+def test_new_version_flags_copied_llm_sections(db_session, stale_report):
+    rescore_creator_reports(db_session)
+
+    report = _latest(db_session)
+    summary = report.executive_summary_json
+    assert summary["scores_from_version"] == 1
+    assert summary["content_md"].startswith("※ 이 섹션은 v1 리포트의 점수 기준")
+    assert summary["content_md"].endswith("BLC 12점, D 등급 채널입니다.")
+    # 본문이 없는 섹션은 그대로
+    assert report.risk_mitigation_json == {}
+
+
+def test_stale_flag_is_added_once():
+    section = {"key": "deep_analysis", "content_md": "본문"}
+
+    flagged = _flag_stale_section(section, 1)
+    assert _flag_stale_section(flagged, 2) is flagged
+    assert flagged["content_md"].count("※") == 1
+    assert _flag_stale_section(None, 1) is None
+
+
+def test_latest_version_lookup_is_indexed(db_engine):
+    indexes = {index["name"]: index["column_names"] for index in inspect(db_engine).get_indexes("report_creator")}
+    assert indexes["ix_report_creator_request_version"] == ["request_id", "version"]
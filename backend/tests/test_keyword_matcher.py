@@ -0,0 +1,73 @@
+import re
+
+import pytest
+
+from services.keyword_matcher import KeywordMatcher
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+
+@pytest.fixture
+def matcher():
+    return KeywordMatcher({"demand": ["샀어요", "추천", "Bought"], "problem": ["여드름", "추천"]})
+
+
+def test_flags_per_category(matcher):
+    assert matcher.flags("여드름 때문에 샀어요") == (True, True)
+    assert matcher.flags("샀어요") == (True, False)
+    assert matcher.flags("여드름") == (False, True)
+    assert matcher.flags("잘 봤어요") == (False, False)
+
+
+def test_matching_is_case_insensitive(matcher):
+    assert matcher.flags("I BOUGHT it") == (True, False)
+
+
+def test_keyword_in_several_categories_hits_all(matcher):
+    assert matcher.flags("추천해요") == (True, True)
+
+
+def test_non_text_comments_do_not_match(matcher):
+    assert matcher.flags_many(["샀어요", None, 3, ""]) == [
+        (True, False),
+        (False, False),
+        (False, False),
+        (False, False),
+    ]
+
+
+def test_flag_matrix_matches_flags_many(matcher):
+    texts = ["샀어요", None, "", "İ여드름", "추", "천", "잘 봤어요 BOUGHT", 3, "\x00여드름", "추천"]
+
+    matrix = matcher.flag_matrix(texts)
+
+    assert matrix.shape == (len(texts), 2)
+    # 이어 붙인 댓글 경계("추" + "천")에 걸친 적중은 없어야 한다
+    assert [tuple(row) for row in matrix.tolist()] == matcher.flags_many(texts)
+    assert matcher.flag_matrix([]).shape == (0, 2)
+
+
+def test_scan_returns_unique_keywords_in_order(matcher):
+    flags, matched = matcher.scan("여드름 샀어요 여드름 추천")
+
+    assert flags == (True, True)
+    assert matched == {"demand": ["샀어요", "추천"], "problem": ["여드름", "추천"]}
+
+
+def test_empty_matcher_matches_nothing():
+    assert KeywordMatcher({"demand": [""]}).flags("샀어요") == (False,)
+
+
+def test_matches_calculator_regex_keywords():
+    # 기존 re.IGNORECASE 정규식 매칭과 같은 결과
+    demand = re.compile("|".join(map(re.escape, MetricsCalculator.DEMAND_KEYWORDS)), re.IGNORECASE)
+    problem = re.compile("|".join(map(re.escape, MetricsCalculator.PROBLEM_KEYWORDS)), re.IGNORECASE)
+    comments = [
+        "재구매 했어요 추천!",
+        "피부가 건조하고 여드름이 올라와요",
+        "I TRIED this and recommend",
+        "영상 잘 봤습니다",
+        "사용 중인데 자극 없어요",
+    ]
+
+    expected = [(bool(demand.search(c)), bool(problem.search(c))) for c in comments]
+    assert MetricsCalculator._keyword_matcher().flags_many(comments) == expected
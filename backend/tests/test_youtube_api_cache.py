@@ -0,0 +1,27 @@
+import time
+
+from services.youtube_api_cache import YouTubeResponseCache
+
+ID_LOOKUP = {"part": "id", "forHandle": "beautiq"}
+STATISTICS = {"part": "snippet,statistics,contentDetails", "id": "UCcache"}
+
+
+def test_channel_statistics_expire_sooner_than_id_lookups(tmp_path, monkeypatch):
+    cache = YouTubeResponseCache(str(tmp_path / "cache.sqlite3"))
+    cache.set("channels", ID_LOOKUP, {"items": [{"id": "UCcache"}]})
+    cache.set("channels", STATISTICS, {"items": [{"statistics": {"subscriberCount": "1000"}}]})
+
+    now = time.time()
+    later = now + cache.ttls["channels.statistics"] + 1
+    monkeypatch.setattr(time, "time", lambda: later)
+
+    assert cache.get("channels", ID_LOOKUP) == {"items": [{"id": "UCcache"}]}
+    assert cache.get("channels", STATISTICS) is None
+    assert cache.stats()["by_resource"]["channels.statistics"] == {"hits": 0, "misses": 1}
+    cache.close()
+
+
+def test_ttl_group():
+    assert YouTubeResponseCache.ttl_group("channels", STATISTICS) == "channels.statistics"
+    assert YouTubeResponseCache.ttl_group("channels", ID_LOOKUP) == "channels"
+    assert YouTubeResponseCache.ttl_group("videos", STATISTICS) == "videos"
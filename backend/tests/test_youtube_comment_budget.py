@@ -0,0 +1,45 @@
+from services.youtube_comment_budget import allocate_comment_pages, comment_weight
+
+
+def _video(video_id, view_count, comment_count):
+    return {"video_id": video_id, "view_count": view_count, "comment_count": comment_count}
+
+
+def test_every_commented_video_gets_one_page_before_extras():
+    videos = [
+        _video("big", 1_000_000, 5_000),
+        _video("mid", 50_000, 300),
+        _video("small", 1_000, 5),
+        _video("silent", 10_000, 0),
+    ]
+    pages = allocate_comment_pages(videos, total_pages=6)
+
+    assert pages["silent"] == 0
+    assert pages["small"] == 1
+    assert pages["mid"] >= 1
+    assert sum(pages.values()) == 6
+    assert pages["big"] > pages["mid"]
+
+
+def test_pages_are_capped_by_available_comments():
+    videos = [_video("a", 10_000, 150), _video("b", 10_000, 40)]
+    pages = allocate_comment_pages(videos, total_pages=20, max_pages_per_video=10)
+
+    # 150개 -> 최대 2페이지, 40개 -> 1페이지 (남는 예산은 쓰지 않음)
+    assert pages == {"a": 2, "b": 1}
+
+
+def test_budget_smaller_than_videos_goes_to_heaviest_videos():
+    videos = [_video(f"v{i}", 1_000 * (i + 1), 100) for i in range(5)]
+    pages = allocate_comment_pages(videos, total_pages=2)
+
+    assert pages == {"v0": 0, "v1": 0, "v2": 0, "v3": 1, "v4": 1}
+
+
+def test_extra_pages_follow_dhondt_order():
+    # 가중치 4:1 -> 첫 페이지 이후 추가 페이지는 weight / (pages + 1) 순서 (a 가 3페이지 더 받은 뒤 b)
+    videos = [_video("a", 16, 10_000), _video("b", 1, 10_000)]
+    assert comment_weight(videos[0]) == 4 * comment_weight(videos[1])
+
+    pages = allocate_comment_pages(videos, total_pages=5)
+    assert pages == {"a": 4, "b": 1}
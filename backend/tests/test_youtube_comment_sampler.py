@@ -0,0 +1,99 @@
+import pytest
+
+from services.youtube_comment_sampler import AdaptiveCommentSampler, wilson_half_width
+
+
+def make_fetch_page(total):
+    """댓글 total 개짜리 영상의 commentThreads 페이지 대역 (요청한 page_size 기록)"""
+    requests = []
+
+    def fetch_page(page_token, page_size):
+        start = int(page_token or 0)
+        requests.append(page_size)
+        end = min(total, start + page_size)
+        next_token = str(end) if end < total else None
+        return [f"comment {i}" for i in range(start, end)], next_token
+
+    return fetch_page, requests
+
+
+def never_matches(text):
+    return False, False
+
+
+def alternating(text):
+    # 절반이 Demand / Problem -> 분산 최대, 조기 종료 조건을 만족하지 못함
+    odd = int(text.split()[-1]) % 2 == 1
+    return odd, odd
+
+
+def test_wilson_half_width():
+    # 10/100 의 Wilson 95% 구간 (0.0552, 0.1744)
+    assert wilson_half_width(10, 100) == pytest.approx((0.1744 - 0.0552) / 2, abs=1e-4)
+    assert wilson_half_width(0, 0) == 1.0
+    assert wilson_half_width(0, 50) < wilson_half_width(25, 50)
+
+
+def test_first_video_is_fetched_in_one_full_page():
+    # 채널 누적 비율이 없으면 limit 만큼 한 번에 요청
+    sampler = AdaptiveCommentSampler(never_matches)
+    fetch_page, requests = make_fetch_page(300)
+
+    assert len(sampler.sample(fetch_page, 100, video_id="v0")) == 100
+    assert requests == [100]
+    assert not sampler.is_truncated("v0")
+
+
+def test_video_stops_early_once_both_rates_converge():
+    sampler = AdaptiveCommentSampler(never_matches)
+    sampler.sample(make_fetch_page(300)[0], 100, video_id="v0")
+    fetch_page, requests = make_fetch_page(300)
+
+    comments = sampler.sample(fetch_page, 100, video_id="v1")
+
+    assert len(comments) == sampler.min_comments
+    assert requests == [sampler.min_comments]
+    assert sampler.is_truncated("v1")
+    assert sampler.summary()["videos_stopped_early"] == 1
+
+
+def test_high_variance_video_is_fetched_up_to_limit():
+    sampler = AdaptiveCommentSampler(alternating)
+    fetch_page, _ = make_fetch_page(300)
+
+    comments = sampler.sample(fetch_page, 100, video_id="v1")
+
+    assert len(comments) == 100
+    assert not sampler.is_truncated("v1")
+
+
+def test_short_video_is_not_marked_truncated():
+    sampler = AdaptiveCommentSampler(never_matches)
+    fetch_page, _ = make_fetch_page(20)
+
+    assert len(sampler.sample(fetch_page, 100, video_id="v1")) == 20
+    assert not sampler.is_truncated("v1")
+
+
+def test_channel_convergence_lowers_per_video_limit():
+    sampler = AdaptiveCommentSampler(never_matches, converged_comments=30, channel_min_videos=3)
+    assert sampler.comment_limit(100) == 100
+
+    for i in range(3):
+        fetch_page, _ = make_fetch_page(300)
+        sampler.sample(fetch_page, 100, video_id=f"v{i}")
+
+    assert sampler.channel_converged()
+    assert sampler.comment_limit(100) == 30
+    fetch_page, _ = make_fetch_page(300)
+    assert len(sampler.sample(fetch_page, 100, video_id="v3")) == 30
+
+
+def test_spawn_keeps_settings_but_not_channel_totals():
+    sampler = AdaptiveCommentSampler(never_matches, page_size=20, min_comments=40)
+    fetch_page, _ = make_fetch_page(300)
+    sampler.sample(fetch_page, 100)
+
+    child = sampler.spawn()
+    assert (child.page_size, child.min_comments) == (20, 40)
+    assert child.channel_comments == 0
@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from services.youtube_data_collector import YouTubeDataCollector
+from services.youtube_video_record import VideoRecord
+
+
+def _published(days_ago):
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _record(video_id, comment_count, days_ago=10):
+    return VideoRecord(
+        video_id=video_id,
+        title=video_id,
+        published_at=_published(days_ago),
+        days_since_upload=days_ago,
+        duration_seconds=300,
+        duration_formatted="5:00",
+        view_count=1000,
+        like_count=50,
+        comment_count=comment_count,
+    )
+
+
+@pytest.fixture
+def collector(monkeypatch):
+    """API 대신 고정 응답을 돌려주는 collector (댓글 재수집 대상 기록)"""
+    collector = YouTubeDataCollector("test-key", video_listing="uploads", api_endpoint="http://127.0.0.1:9")
+    collector.refetched = []
+    current = {"old-sampled": 250, "old-changed": 90}
+
+    monkeypatch.setattr(collector, "get_channel_info", lambda channel_id: {"channel_id": channel_id})
+    monkeypatch.setattr(collector, "get_channel_videos", lambda *args, **kwargs: [])
+    monkeypatch.setattr(
+        collector,
+        "get_video_details",
+        lambda video_ids, include_comments=True, max_comments=100: [
+            _record(video_id, current[video_id]) for video_id in video_ids
+        ],
+    )
+
+    def collect_comments(videos, max_comments=100):
+        for video in videos:
+            collector.refetched.append(video["video_id"])
+            video["comments"] = ["new comment"]
+
+    monkeypatch.setattr(collector, "_collect_comments", collect_comments)
+    return collector
+
+
+def test_delta_reuses_comments_with_their_sample_target(collector):
+    previous = {
+        "collection_date": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
+        "videos": [
+            {**_record("old-sampled", 250).to_dict(), "comments": ["a", "b"], "comments_target": 100},
+            {**_record("old-changed", 80).to_dict(), "comments": ["c"], "comments_target": 100},
+        ],
+    }
+
+    data = collector.collect_delta_data("UCdelta", previous, max_videos=10)
+    videos = {video["video_id"]: video for video in data["videos"]}
+
+    assert collector.refetched == ["old-changed"]
+    assert videos["old-sampled"]["comments"] == ["a", "b"]
+    assert videos["old-sampled"]["comments_target"] == 100
+    # 다시 수집한 영상은 이번 수집 기준 (이전 보정값을 그대로 쓰지 않음)
+    assert videos["old-changed"]["comments_target"] is None
+
+
+def test_delta_skips_fetching_videos_beyond_max_videos(collector, monkeypatch):
+    current = {"new-1": 5, "new-2": 5, "new-3": 5, "old-recent": 90, "old-stale": 90}
+    detailed = []
+
+    def get_video_details(video_ids, include_comments=True, max_comments=100):
+        detailed.extend(video_ids)
+        return [_record(video_id, current[video_id], days_ago=1) for video_id in video_ids]
+
+    monkeypatch.setattr(collector, "get_channel_videos", lambda *args, **kwargs: ["new-1", "new-2", "new-3"])
+    monkeypatch.setattr(collector, "get_video_details", get_video_details)
+    previous = {
+        "collection_date": (datetime.now(timezone.utc) - timedelta(days=1)).isoformat(),
+        "videos": [
+            {**_record("old-stale", 80, days_ago=20).to_dict(), "comments": ["a"]},
+            {**_record("old-recent", 80, days_ago=10).to_dict(), "comments": ["b"]},
+        ],
+    }
+
+    data = collector.collect_delta_data("UCdelta", previous, max_videos=2)
+    assert [video["video_id"] for video in data["videos"]] == ["new-1", "new-2"]
+    assert detailed == ["new-1", "new-2"]
+    assert collector.refetched == []
+
+    collector.collect_delta_data("UCdelta", previous, max_videos=4)
+    # 새 영상 3개 + 남은 1자리는 가장 최근 기존 영상만 갱신/댓글 재수집
+    assert detailed[2:] == ["new-1", "new-2", "new-3", "old-recent"]
+    assert collector.refetched == ["old-recent"]
+
+
+def test_video_left_out_of_comment_budget_is_marked_unmeasured(collector):
+    commented = _record("commented", 40)
+    silent = _record("silent", 0)
+
+    assert collector._fetch_comments_timed(commented, 100, pages=0) == ([], 0.0)
+    assert collector._fetch_comments_timed(silent, 100, pages=0) == ([], 0.0)
+
+    assert commented["comments_error"] is True
+    assert silent["comments_error"] is False
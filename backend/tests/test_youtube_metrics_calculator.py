@@ -0,0 +1,78 @@
+import math
+
+import pytest
+
+from services.youtube_metrics_calculator_v2 import MetricsCalculator
+
+
+def make_video(video_id, comments, view_count=1000, **extra):
+    return {
+        "video_id": video_id,
+        "title": f"{video_id} 리뷰",
+        "published_at": "2026-09-01T00:00:00Z",
+        "days_since_upload": 10,
+        "duration_seconds": 300,
+        "duration_formatted": "5:00",
+        "view_count": view_count,
+        "like_count": 40,
+        "comment_count": len(comments),
+        "tags": [],
+        "thumbnail_high": "",
+        "comments": comments,
+        **extra,
+    }
+
+
+def make_raw_data(videos, subscriber_count=50_000):
+    return {
+        "channel": {"channel_name": "test", "subscriber_count": subscriber_count, "total_views": 1},
+        "videos": videos,
+    }
+
+
+# 구매 인증 2개 / 1,000뷰 -> demand_index 2.0, problem_rate 0
+DEMAND_VIDEO = ["샀어요 최고"] * 2 + ["영상 잘 봤습니다"] * 8
+# 고민 댓글 5/10 -> demand_index 0, problem_rate 0.5
+PROBLEM_VIDEO = ["여드름 고민"] * 5 + ["영상 잘 봤습니다"] * 5
+
+
+def test_failed_comment_fetches_are_excluded_from_medians():
+    videos = [
+        make_video("good-1", DEMAND_VIDEO),
+        make_video("good-2", PROBLEM_VIDEO),
+        *[make_video(f"failed-{i}", [], comments_error=True) for i in range(3)],
+    ]
+    calculator = MetricsCalculator(make_raw_data(videos))
+
+    assert calculator.videos_df["demand_index"].isna().sum() == 3
+    profile = calculator.get_performance_profile()
+    assert profile["demand_index_median"] == pytest.approx(1.0)
+    assert profile["problem_rate_median"] == pytest.approx(0.25, rel=1e-4)
+    assert profile["demand_index_mean"] == pytest.approx(1.0)
+
+    score_inputs = calculator.calculate_blc_score()["score_inputs"]
+    assert score_inputs["demand_index_median"] == pytest.approx(1.0)
+    assert score_inputs["problem_rate_median"] == pytest.approx(0.25, rel=1e-4)
+
+
+@pytest.mark.filterwarnings("error::RuntimeWarning")
+def test_all_failed_comment_fetches_score_as_zero():
+    videos = [make_video(f"failed-{i}", [], comments_error=True) for i in range(3)]
+    calculator = MetricsCalculator(make_raw_data(videos))
+
+    blc = calculator.calculate_blc_score()
+    assert blc["score_inputs"]["demand_index_median"] == 0.0
+    assert blc["components"]["demand_score"] == 0.0
+    assert math.isfinite(blc["blc_score"])
+
+
+def test_videos_without_error_flag_keep_zero_comment_metrics():
+    videos = [
+        make_video("good-1", DEMAND_VIDEO),
+        make_video("empty-1", []),
+        make_video("empty-2", []),
+    ]
+    calculator = MetricsCalculator(make_raw_data(videos))
+
+    assert calculator.get_performance_profile()["demand_index_median"] == 0.0
+
@@ -0,0 +1,69 @@
+import pytest
+
+from models.youtube_quota import YouTubeCollectionRun, YouTubeQuotaUsage
+from services.youtube_quota_service import (
+    DEPTH_LEVELS,
+    SAFETY_MARGIN,
+    estimate_collection_cost,
+    get_units_used_today,
+    plan_collection_depth,
+    quota_day,
+    record_collection_run,
+)
+
+
+class FakeCollector:
+    def __init__(self, units):
+        self.units = units
+
+    def usage_summary(self):
+        return {
+            "units_by_resource": {"commentThreads": self.units},
+            "calls_by_resource": {"commentThreads": self.units},
+        }
+
+
+def _record(db, units):
+    return record_collection_run(
+        db,
+        FakeCollector(units),
+        channel_id="UCquota",
+        request_id=1,
+        max_videos=100,
+        max_comments=100,
+        degraded=False,
+        status="success",
+    )
+
+
+def test_record_collection_run_accumulates_daily_units(db_session):
+    _record(db_session, 120)
+    _record(db_session, 30)
+    assert get_units_used_today(db_session) == 150
+    assert db_session.query(YouTubeCollectionRun).count() == 2
+
+
+def test_record_merges_with_row_inserted_by_other_session(db_session, session_factory):
+    # 다른 세션(미리 수집)이 먼저 그날 행을 만든 뒤 분석 쪽 세션이 기록
+    assert get_units_used_today(db_session) == 0
+    other = session_factory()
+    other.add(YouTubeQuotaUsage(usage_date=quota_day(), units_used=200))
+    other.commit()
+    other.close()
+
+    _record(db_session, 50)
+    db_session.expire_all()
+    assert get_units_used_today(db_session) == 250
+
+
+def test_plan_collection_depth_picks_deepest_affordable_level():
+    daily_limit = 10_000
+    margin = int(daily_limit * SAFETY_MARGIN)
+    full_cost = estimate_collection_cost(*DEPTH_LEVELS[0])
+    assert plan_collection_depth(daily_limit, daily_limit) == (*DEPTH_LEVELS[0], False)
+
+    max_videos, max_comments, degraded = plan_collection_depth(margin + full_cost - 1, daily_limit)
+    assert degraded and (max_videos, max_comments) in DEPTH_LEVELS[1:]
+
+    with pytest.raises(RuntimeError):
+        plan_collection_depth(0, daily_limit)
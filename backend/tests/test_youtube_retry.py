@@ -0,0 +1,111 @@
+import json
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from services.youtube_retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+def http_error(status, reasons=(), retry_after=None):
+    headers = {"status": status}
+    if retry_after is not None:
+        headers["retry-after"] = str(retry_after)
+    content = json.dumps({"error": {"errors": [{"reason": r} for r in reasons]}}).encode()
+    return HttpError(httplib2.Response(headers), content)
+
+
+def failing(*errors, result="ok"):
+    """errors 를 차례로 던진 뒤 result 반환하는 API 호출 대역"""
+    calls = []
+
+    def fn():
+        calls.append(len(calls))
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return result
+
+    return fn, calls
+
+
+@pytest.fixture
+def policy():
+    return RetryPolicy(max_attempts=4, base_delay=0.01, sleep=lambda s: None)
+
+
+def test_server_errors_are_retried_until_success(policy):
+    fn, calls = failing(http_error(500), http_error(503), OSError("reset"))
+
+    assert policy.call("videos", fn) == "ok"
+    assert len(calls) == 4
+    assert policy.summary()["retries"] == 3
+
+
+def test_client_errors_are_not_retried(policy):
+    fn, calls = failing(http_error(400))
+
+    with pytest.raises(HttpError):
+        policy.call("videos", fn)
+    assert len(calls) == 1
+    assert policy.breaker("videos").state == "closed"
+
+
+def test_only_rate_limit_403_is_retried(policy):
+    assert policy.is_retryable(http_error(403, ["rateLimitExceeded"]))
+    assert not policy.is_retryable(http_error(403, ["quotaExceeded"]))
+    assert not policy.is_retryable(http_error(403, ["forbidden"]))
+
+
+def test_gives_up_after_max_attempts(policy):
+    fn, calls = failing(*[http_error(502)] * 10)
+
+    with pytest.raises(HttpError):
+        policy.call("videos", fn)
+    assert len(calls) == policy.max_attempts
+    assert policy.summary()["gave_up"] == 1
+
+
+def test_retry_budget_exhaustion_stops_retries():
+    policy = RetryPolicy(max_attempts=10, budget_max=2, failure_threshold=100, sleep=lambda s: None)
+    fn, calls = failing(*[http_error(500)] * 10)
+
+    with pytest.raises(HttpError):
+        policy.call("videos", fn)
+    # 토큰 2개 -> 첫 시도 + 재시도 2번
+    assert len(calls) == 3
+
+
+def test_retry_after_sets_minimum_backoff(policy):
+    assert policy.backoff(1, http_error(429, retry_after=5)) >= 5
+    assert policy.backoff(1, http_error(429, retry_after=999)) <= policy.max_delay
+
+
+def test_breaker_opens_then_allows_one_trial_call():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("videos")
+
+    breaker.reset_timeout = 0
+    assert breaker.state == "half-open"
+    breaker.before_call("videos")
+    # 시험 호출 1건이 끝나기 전에는 다른 호출을 막는다
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call("videos")
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_failed_trial_call_reopens_breaker():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0)
+    for _ in range(5):
+        breaker.record_failure()
+    breaker.before_call("videos")
+
+    breaker.reset_timeout = 60
+    breaker.record_failure()
+    assert breaker.state == "open"